@@ -0,0 +1,125 @@
+"""
+Pydantic schemas for backtest results.
+"""
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Optional, List, Dict
+from datetime import datetime
+
+
+class BacktestConfigOut(BaseModel):
+    name: str
+    risk_profile_id: str
+    start_date: datetime
+    end_date: datetime
+    starting_value: float
+    benchmark_ticker: str
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class SummaryOut(BaseModel):
+    starting_value: float
+    ending_value: float
+    total_return: float
+    annualized_return: float
+    benchmark_total_return: float
+    benchmark_annualized_return: float
+
+
+class RiskMetricsOut(BaseModel):
+    max_drawdown: float
+    sharpe_ratio: float
+    sortino_ratio: float
+    calmar_ratio: float
+    std_dev_annualized: float
+    beta: float
+    alpha: float
+    information_ratio: float
+    upside_capture: float
+    downside_capture: float
+    positive_months_pct: float
+
+
+class EquityCurvePointOut(BaseModel):
+    date: str
+    portfolio_value: float
+    benchmark_value: float
+    regime: str
+    cash_value: float
+
+
+class DrawdownPointOut(BaseModel):
+    date: str
+    drawdown: float
+
+
+class DrawdownEventOut(BaseModel):
+    drawdown_pct: float
+    start_date: datetime
+    low_date: datetime
+    end_date: Optional[datetime] = None
+    length_days: int
+    recovery_days: Optional[int] = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class HoldingOut(BaseModel):
+    ticker: str
+    shares: float
+    price: float
+    value: float
+    weight: float
+    return_: float = Field(alias="return")
+
+
+class RegimeStatOut(BaseModel):
+    regime: str
+    days: int
+    pct_time: float
+    total_return: float
+    num_trades: int
+    color: str
+
+
+class RegimePeriodOut(BaseModel):
+    regime: str
+    start: str
+    end: str
+
+
+class TradeOut(BaseModel):
+    date: datetime
+    action: str
+    ticker: str
+    shares: float
+    price: float
+    value: float
+    regime: str
+    reason: str
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class BacktestResultsOut(BaseModel):
+    config: BacktestConfigOut
+    summary: SummaryOut
+    risk_metrics: RiskMetricsOut
+    equity_curve: List[EquityCurvePointOut]
+    drawdown_series: List[DrawdownPointOut]
+    monthly_returns: Dict[str, Dict[str, float]]
+    benchmark_monthly_returns: Dict[str, Dict[str, float]]
+    trailing_returns: Dict[str, float]
+    benchmark_trailing_returns: Dict[str, float]
+    top_drawdowns: List[DrawdownEventOut]
+    final_holdings: List[HoldingOut]
+    regime_stats: List[RegimeStatOut]
+    regime_timeline: List[RegimePeriodOut]
+    trades: List[TradeOut]
+    total_trades: int
+
+
+class BacktestOut(BaseModel):
+    id: str
+    created_at: str
+    results: BacktestResultsOut
@@ -0,0 +1,106 @@
+"""
+Storage for serialized backtest results.
+Every result is written to disk once; only the most recent payloads stay in memory.
+The directory is the source of truth, so worker processes sharing it see each
+other's backtests.
+"""
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import orjson
+
+_default_dir = Path(__file__).parent / "backtests"
+BACKTEST_DIR = Path(os.environ.get("BACKTEST_DIR", _default_dir))
+BACKTEST_CACHE_SIZE = int(os.environ.get("BACKTEST_CACHE_SIZE", 16))
+
+
+class BacktestStore:
+    """
+    LRU cache of backtest payloads backed by one JSON file per backtest.
+
+    Payloads are the encoded response bytes. A small summary per backtest
+    (for listing) lives in a sidecar file and is kept in memory for all of them.
+    Ids missing from memory are looked up on disk, since another process may
+    have written them. Files are written under a temp name and renamed into
+    place, so readers never see a partial file. The in-memory maps are shared
+    by the event loop and threadpool handlers and are guarded by one lock.
+    """
+
+    def __init__(self, directory: Path = BACKTEST_DIR, max_cached: int = BACKTEST_CACHE_SIZE):
+        self.directory = directory
+        self.max_cached = max_cached
+        self._payloads: "OrderedDict[str, bytes]" = OrderedDict()
+        self._summaries: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._load_summaries()
+
+    def __contains__(self, backtest_id: str) -> bool:
+        with self._lock:
+            if backtest_id in self._summaries:
+                return True
+        meta = self._meta_path(backtest_id)
+        if not meta.exists():
+            return False
+        summary = orjson.loads(meta.read_bytes())
+        with self._lock:
+            self._summaries.setdefault(backtest_id, summary)
+        return True
+
+    def path(self, backtest_id: str) -> Path:
+        return self.directory / f"{backtest_id}.json"
+
+    def _meta_path(self, backtest_id: str) -> Path:
+        return self.directory / f"{backtest_id}.meta.json"
+
+    def _load_summaries(self):
+        """Read summaries of backtests not yet known to this process, oldest first"""
+        metas = sorted(self.directory.glob("*.meta.json"), key=lambda p: p.stat().st_mtime)
+        with self._lock:
+            known = set(self._summaries)
+        new = [orjson.loads(meta.read_bytes()) for meta in metas
+               if meta.name[:-len(".meta.json")] not in known]
+        with self._lock:
+            for summary in new:
+                self._summaries.setdefault(summary["id"], summary)
+
+    @staticmethod
+    def _write(path: Path, data: bytes):
+        """Write data to path atomically: temp file first, then rename over it"""
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+
+    def add(self, summary: Dict, payload: bytes):
+        """Persist a backtest and keep its payload in the cache"""
+        backtest_id = summary["id"]
+        # Payload first: the meta file is what makes the backtest visible
+        self._write(self.path(backtest_id), payload)
+        self._write(self._meta_path(backtest_id), orjson.dumps(summary))
+        with self._lock:
+            self._summaries[backtest_id] = summary
+            self._cache(backtest_id, payload)
+
+    def get(self, backtest_id: str) -> Optional[bytes]:
+        """Cached payload bytes, or None if the payload only lives on disk"""
+        with self._lock:
+            payload = self._payloads.get(backtest_id)
+            if payload is not None:
+                self._payloads.move_to_end(backtest_id)
+        return payload
+
+    def summaries(self) -> List[Dict]:
+        self._load_summaries()
+        with self._lock:
+            return list(self._summaries.values())
+
+    def _cache(self, backtest_id: str, payload: bytes):
+        """Caller holds the lock"""
+        self._payloads[backtest_id] = payload
+        self._payloads.move_to_end(backtest_id)
+        while len(self._payloads) > self.max_cached:
+            self._payloads.popitem(last=False)
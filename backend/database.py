@@ -4,9 +4,11 @@ Uses SQLite by default for local development, PostgreSQL if DATABASE_URL is set.
 """
 import os
 from pathlib import Path
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import sessionmaker, scoped_session
+from sqlalchemy.pool import StaticPool
 
 # Use SQLite by default for easy local development
 _default_db_path = Path(__file__).parent / "pgrb_rankings.db"
@@ -15,10 +17,47 @@ DATABASE_URL = os.environ.get(
     f"sqlite:///{_default_db_path}"
 )
 
+IS_SQLITE = DATABASE_URL.startswith("sqlite")
+
 # SQLite needs check_same_thread=False for FastAPI
-connect_args = {"check_same_thread": False} if DATABASE_URL.startswith("sqlite") else {}
-engine = create_engine(DATABASE_URL, echo=False, connect_args=connect_args)
+connect_args = {"check_same_thread": False} if IS_SQLITE else {}
+if DATABASE_URL.startswith("postgresql+psycopg:"):
+    # psycopg 3 prepares a statement server-side once a connection has run it
+    # this many times, so the hot queries skip parse and plan after that
+    connect_args["prepare_threshold"] = int(os.environ.get("DB_PREPARE_THRESHOLD", 5))
+
+if IS_SQLITE:
+    # An in-memory database only exists on its one connection, so share it.
+    # File databases keep SQLAlchemy's default pool.
+    pool_args = {"poolclass": StaticPool} if ":memory:" in DATABASE_URL or DATABASE_URL == "sqlite://" else {}
+else:
+    # Size the pool for concurrent FastAPI workers and drop stale connections
+    pool_args = {
+        "pool_size": int(os.environ.get("DB_POOL_SIZE", 20)),
+        "max_overflow": int(os.environ.get("DB_MAX_OVERFLOW", 40)),
+        "pool_recycle": int(os.environ.get("DB_POOL_RECYCLE", 3600)),
+        "pool_pre_ping": True,
+    }
+
+engine = create_engine(DATABASE_URL, echo=False, connect_args=connect_args, **pool_args)
+
+if IS_SQLITE:
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        """WAL lets readers proceed during a write; NORMAL sync is safe under WAL."""
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA mmap_size=268435456")
+        cursor.close()
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+# Thread-local sessions for work outside a request (startup, background jobs).
+# Request handlers use get_db; other callers use ScopedSession() and must call
+# ScopedSession.remove() when done so the connection goes back to the pool.
+ScopedSession = scoped_session(SessionLocal)
+
 Base = declarative_base()
 
 
@@ -33,5 +72,23 @@ def get_db():
 
 def init_db():
     """Create all tables if they don't exist."""
-    from ranking_models import FundCategory, Fund, FundScore  # noqa
+    from ranking_models import FundCategory, Fund, FundScore, trigram_indexes  # noqa
     Base.metadata.create_all(bind=engine)
+    # create_all skips tables that already exist, so add any newer indexes
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
+    if not IS_SQLITE and _enable_pg_trgm():
+        for index in trigram_indexes():
+            index.create(bind=engine, checkfirst=True)
+
+
+def _enable_pg_trgm() -> bool:
+    """Enable pg_trgm for the fund search indexes. Needs CREATE on the database."""
+    try:
+        with engine.begin() as conn:
+            conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        return True
+    except DBAPIError as e:
+        print(f"pg_trgm not available, fund search runs without trigram indexes: {e}")
+        return False
@@ -3,9 +3,9 @@ import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional, Tuple
-from collections import defaultdict
+from collections import Counter, defaultdict
 from models import (
-    GridDataRow, RiskProfile, Position, Trade, EquityCurvePoint,
+    GridData, RiskProfile, Position, TradeLog, EquityCurve, REGIME_CODES,
     DrawdownEvent, RegimeStat, BacktestConfig, BacktestResults,
     DEFAULT_PROFILES
 )
@@ -30,22 +30,63 @@ class BacktestEngine:
         "INFLATION": "REFLATION"
     }
 
+    # Column order of the confirming-markets matrix
+    REGIMES = ["GOLDILOCKS", "REFLATION", "INFLATION", "DEFLATION"]
+    OPPOSING_IDX = np.array([3, 2, 1, 0])  # REGIMES index of each OPPOSING_REGIMES entry
+
+    # Trailing return windows in trading days
+    TRAILING_PERIODS = ['1D', '1W', '1M', '3M', '6M', '1Y', '3Y', '5Y']
+    TRAILING_OFFSETS = np.array([1, 5, 21, 63, 126, 252, 756, 1260])
+
     RISK_ON_REGIMES = {"GOLDILOCKS", "REFLATION"}
     RISK_OFF_REGIMES = {"INFLATION", "DEFLATION"}
 
-    def __init__(self, grid_data: List[GridDataRow], risk_profile: RiskProfile):
-        self.grid_data = {row.date: row for row in grid_data}
-        self.dates = sorted(self.grid_data.keys())
+    def __init__(self, grid_data: GridData, risk_profile: RiskProfile):
+        # Grid rows are date-sorted with one row per date
+        self.grid_data = grid_data
+        self._dates_np = grid_data.dates.astype('datetime64[us]')
+        self.dates = self._dates_np.tolist()
+
+        # Grid columns aligned with self.dates (struct-of-arrays)
+        self._market_regimes = grid_data.market_regime_names.tolist()
+        self._sum_confirming = grid_data.confirming[:, 0].astype(np.int32)
+        self._confirming = grid_data.confirming[:, 1:].astype(np.int32)
+        xlk = grid_data.ticker_index.get("XLK")
+        self._xlk_vams = (grid_data.vams[:, xlk] if xlk is not None
+                          else np.full(len(grid_data), -2, dtype=np.int8))
+
         self.risk_profile = risk_profile
         self.price_provider: Optional[PriceDataProvider] = None
 
+        # Per-regime (tickers, weights) in allocation order, crypto excluded
+        self._regime_weights: Dict[str, Tuple[List[str], np.ndarray]] = {}
+        for regime, alloc in risk_profile.allocations.items():
+            alloc_tickers = [t for t in alloc if t not in ["Bitcoin", "Ethereum"]]
+            self._regime_weights[regime] = (
+                alloc_tickers, np.array([alloc[t] for t in alloc_tickers], dtype=np.float64))
+
         # State
         self.current_regime = "REFLATION"
-        self.positions: Dict[str, Position] = {}
         self.cash = 0.0
         self.shv_position = 0.0
-        self.trades: List[Trade] = []
-        self.equity_curve: List[EquityCurvePoint] = []
+        self.trade_log = TradeLog()
+        self.equity_curve: Optional[EquityCurve] = None
+
+        # Dense price lookup, built in run() once the backtest dates are known
+        self._tickers: List[str] = []
+        self._ticker_idx: Dict[str, int] = {}
+        self._price_matrix = np.empty((0, 0))
+        self._valuation_prices = np.empty((0, 0))
+        self._last_prices = np.empty((0, 0))
+        self._shv_prices = np.empty(0)
+        self._regime_targets: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+        self._date_i = 0
+        self._window = slice(0, 0)
+
+        # Holdings, parallel to self._tickers. A ticker is held while its
+        # share count is non-zero; avg_costs is only needed for reporting.
+        self.shares_vec = np.zeros(0)
+        self.avg_costs: Dict[str, float] = {}
 
     def _get_required_tickers(self) -> List[str]:
         """Get all tickers needed for the backtest"""
@@ -59,122 +100,160 @@ class BacktestEngine:
 
     def _build_regime_timeline(self) -> Dict[datetime, str]:
         """Build regime timeline from grid data"""
-        timeline = {}
-        for date in self.dates:
-            row = self.grid_data[date]
-            timeline[date] = row.market_regime
-        return timeline
-
-    def _get_price(self, ticker: str, date: datetime) -> Optional[float]:
-        """Get price for a ticker on a given date"""
-        if self.price_provider is None:
-            return None
-        return self.price_provider.get_price(ticker, date)
-
-    def _check_regime_change(self, row: GridDataRow) -> Optional[str]:
-        """Check if regime change conditions are met."""
-        if row.sum_confirming_markets <= 59:
+        return dict(zip(self.dates, self._market_regimes))
+
+    def _build_price_matrix(self, tickers: List[str], dates: List[datetime]):
+        """Materialize a (dates x tickers) price matrix from the provider cache"""
+        self._tickers = tickers
+        self._ticker_idx = {t: i for i, t in enumerate(tickers)}
+        self._price_matrix = np.full((len(dates), len(tickers)), np.nan)
+        self._date_i = 0
+
+        cache = self.price_provider.price_cache if self.price_provider else None
+        if cache is not None and not cache.empty:
+            # Same forward-fill semantics as PriceDataProvider.get_price, done once
+            rows = cache.index.get_indexer(pd.DatetimeIndex(dates), method='ffill')
+            values = cache.reindex(columns=tickers).to_numpy(dtype=np.float64)
+            valid = rows >= 0
+            self._price_matrix[valid] = values[rows[valid]]
+
+        # Valuation counts a missing quote as worth nothing that day, while
+        # liquidation and reporting fall back to the last quote seen
+        self._valuation_prices = np.nan_to_num(self._price_matrix)
+        self._last_prices = np.nan_to_num(pd.DataFrame(self._price_matrix).ffill().to_numpy())
+
+        # SHV is read several times per day; resolve its $110 fallback up front
+        shv_col = self._price_matrix[:, self._ticker_idx["SHV"]]
+        self._shv_prices = np.where(np.isnan(shv_col), 110.0, shv_col)
+
+        # Resolve each regime's allocation to (ticker indices, weights)
+        self._regime_targets = {}
+        for regime, (alloc_tickers, weights) in self._regime_weights.items():
+            known = [k for k, t in enumerate(alloc_tickers) if t in self._ticker_idx]
+            self._regime_targets[regime] = (
+                np.array([self._ticker_idx[alloc_tickers[k]] for k in known], dtype=np.intp),
+                weights[known])
+
+    def _get_shv_price(self) -> float:
+        """SHV price on the current backtest date"""
+        return float(self._shv_prices[self._date_i])
+
+    def _get_price(self, ticker: str) -> Optional[float]:
+        """Get price for a ticker on the current backtest date"""
+        idx = self._ticker_idx.get(ticker)
+        if idx is None:
             return None
-
-        confirmings = {
-            "GOLDILOCKS": row.goldilocks_confirming,
-            "REFLATION": row.reflation_confirming,
-            "INFLATION": row.inflation_confirming,
-            "DEFLATION": row.deflation_confirming
-        }
-
-        candidate = max(confirmings, key=confirmings.get)
-
-        if candidate == self.current_regime:
-            return None
-
-        opposing = self.OPPOSING_REGIMES[candidate]
-        spread = confirmings[candidate] - confirmings[opposing]
-
-        if spread > 2:
-            return candidate
-
-        return None
+        price = self._price_matrix[self._date_i, idx]
+        return None if np.isnan(price) else float(price)
+
+    def _precompute_regime_candidates(self, conf: np.ndarray,
+                                      sums: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Evaluate the regime change rule for every row at once.
+
+        Returns (candidate regime index, whether the candidate passes the
+        sum > 59 and +2 spread tests). The caller still has to check the
+        candidate differs from the regime in force on that day.
+        """
+        # argmax keeps the first maximum, matching the old dict-order tie break
+        n = np.arange(len(sums))
+        candidates = conf.argmax(axis=1)
+        spread = conf[n, candidates] - conf[n, self.OPPOSING_IDX[candidates]]
+        return candidates, (sums > 59) & (spread > 2)
 
     def _is_risk_on(self, regime: str) -> bool:
         return regime in self.RISK_ON_REGIMES
 
-    def _calculate_portfolio_value(self, date: datetime) -> float:
-        """Calculate total portfolio value"""
-        total = self.cash
-
-        if self.shv_position > 0:
-            shv_price = self._get_price("SHV", date) or 110.0
-            total += self.shv_position * shv_price
+    def _held_indices(self) -> np.ndarray:
+        """Ticker indices of all open positions"""
+        return np.flatnonzero(self.shares_vec)
 
-        for ticker, position in self.positions.items():
-            price = self._get_price(ticker, date)
-            if price:
-                position.current_price = price
-                total += position.market_value
+    def _positions(self) -> List[Position]:
+        """Materialize open positions at their last known prices"""
+        return [
+            Position(self._tickers[i], float(self.shares_vec[i]),
+                     self.avg_costs[self._tickers[i]], float(self._last_prices[self._date_i, i]))
+            for i in self._held_indices()
+        ]
 
-        return total
+    def _calculate_portfolio_value(self, date: datetime) -> float:
+        """Calculate total portfolio value"""
+        shv_value = self.shv_position * self._get_shv_price()
+        return self.cash + shv_value + float(self.shares_vec @ self._valuation_prices[self._date_i])
 
     def _execute_trade(self, date: datetime, action: str, ticker: str,
                        shares: float, price: float, reason: str):
         """Record and execute a trade"""
         value = shares * price
 
-        trade = Trade(
-            date=date,
-            action=action,
-            ticker=ticker,
-            shares=abs(shares),
-            price=price,
-            value=abs(value),
-            regime=self.current_regime,
-            reason=reason
-        )
-        self.trades.append(trade)
+        self.trade_log.append(date, action, ticker, abs(shares), price, abs(value),
+                              self.current_regime, reason)
+
+        i = self._ticker_idx[ticker]
+        held = self.shares_vec[i]
 
         if action == "BUY":
-            if ticker in self.positions:
-                old_pos = self.positions[ticker]
-                total_shares = old_pos.shares + shares
-                total_cost = (old_pos.shares * old_pos.avg_cost) + (shares * price)
-                avg_cost = total_cost / total_shares if total_shares > 0 else price
-                self.positions[ticker] = Position(ticker, total_shares, avg_cost, price)
+            if held:
+                total_shares = held + shares
+                total_cost = (held * self.avg_costs[ticker]) + (shares * price)
+                self.avg_costs[ticker] = total_cost / total_shares if total_shares > 0 else price
             else:
-                self.positions[ticker] = Position(ticker, shares, price, price)
+                total_shares = shares
+                self.avg_costs[ticker] = price
+            self.shares_vec[i] = total_shares
             self.cash -= value
         else:
-            if ticker in self.positions:
-                self.positions[ticker].shares -= shares
-                if self.positions[ticker].shares <= 0.001:
-                    del self.positions[ticker]
+            if held:
+                remaining = held - shares
+                if remaining <= 0.001:
+                    self.shares_vec[i] = 0.0
+                    del self.avg_costs[ticker]
+                else:
+                    self.shares_vec[i] = remaining
             self.cash += value
 
     def _liquidate_all(self, date: datetime, reason: str):
         """Liquidate all positions"""
-        for ticker, position in list(self.positions.items()):
-            price = self._get_price(ticker, date) or position.current_price
-            self._execute_trade(date, "SELL", ticker, position.shares, price, reason)
+        for i in self._held_indices():
+            ticker = self._tickers[i]
+            price = self._get_price(ticker) or float(self._last_prices[self._date_i, i])
+            self._execute_trade(date, "SELL", ticker, float(self.shares_vec[i]), price, reason)
 
         if self.shv_position > 0:
-            shv_price = self._get_price("SHV", date) or 110.0
+            shv_price = self._get_shv_price()
             self.cash += self.shv_position * shv_price
             self.shv_position = 0
 
     def _allocate_to_regime(self, date: datetime, regime: str, capital: float, reason: str):
         """Allocate capital according to regime's allocation"""
-        allocations = self.risk_profile.allocations.get(regime, {})
-
-        for ticker, weight in allocations.items():
-            if ticker in ["Bitcoin", "Ethereum"]:
-                continue
-
-            target_value = capital * weight
-            price = self._get_price(ticker, date)
-
-            if price and price > 0:
-                shares = target_value / price
-                if shares > 0.001:
-                    self._execute_trade(date, "BUY", ticker, shares, price, reason)
+        idx, weights = self._regime_targets.get(regime, (np.empty(0, dtype=np.intp), np.empty(0)))
+        if not len(idx):
+            return
+
+        prices = self._price_matrix[self._date_i, idx]
+        with np.errstate(invalid='ignore'):
+            # NaN prices (no quote yet) compare False and are skipped
+            shares = np.where(prices > 0, capital * weights / np.where(prices > 0, prices, 1.0), 0.0)
+        buy = shares > 0.001
+        if not buy.any():
+            return
+
+        idx, shares, prices = idx[buy], shares[buy], prices[buy]
+        values = shares * prices
+        held = self.shares_vec[idx]
+        total = held + shares
+        for i, h, t, v, p in zip(idx.tolist(), held.tolist(), total.tolist(),
+                                 values.tolist(), prices.tolist()):
+            ticker = self._tickers[i]
+            self.avg_costs[ticker] = (h * self.avg_costs[ticker] + v) / t if h else p
+        self.shares_vec[idx] = total
+        self.cash -= float(values.sum())
+
+        n = len(idx)
+        self.trade_log.extend(
+            [date] * n, ["BUY"] * n, [self._tickers[i] for i in idx.tolist()],
+            shares.tolist(), prices.tolist(), values.tolist(),
+            [self.current_regime] * n, [reason] * n)
 
     def _handle_risk_off_transition(self, date: datetime, new_regime: str):
         """Handle transition to Risk Off regime - move 25% to SHV"""
@@ -182,7 +261,7 @@ class BacktestEngine:
         self._liquidate_all(date, f"Regime change to {new_regime}")
 
         cash_reserve = portfolio_value * 0.25
-        shv_price = self._get_price("SHV", date) or 110.0
+        shv_price = self._get_shv_price()
         self.shv_position = cash_reserve / shv_price
 
         equity_capital = portfolio_value * 0.75
@@ -191,13 +270,11 @@ class BacktestEngine:
 
     def _handle_risk_on_transition(self, date: datetime, new_regime: str):
         """Handle transition to Risk On regime - return all cash"""
-        portfolio_value = self._calculate_portfolio_value(date)
         self._liquidate_all(date, f"Regime change to {new_regime}")
         self._allocate_to_regime(date, new_regime, self.cash, f"Allocated to {new_regime}")
 
-    def _check_xlk_vams_exit(self, row: GridDataRow, date: datetime) -> bool:
+    def _check_xlk_vams_exit(self, xlk_vams: int) -> bool:
         """Check if XLK VAMS improved (exit cash rule for Deflation)"""
-        xlk_vams = row.vams.get("XLK", -2)
         return xlk_vams >= 0 and self.shv_position > 0
 
     def run(self, config: BacktestConfig) -> BacktestResults:
@@ -223,18 +300,28 @@ class BacktestEngine:
         # Initialize
         self.cash = config.starting_value
         self.current_regime = "REFLATION"
-        self.positions = {}
         self.shv_position = 0
-        self.trades = []
-        self.equity_curve = []
+        self.trade_log = TradeLog()
+        self.equity_curve = None
 
         # Filter dates to backtest period
-        backtest_dates = [d for d in self.dates
-                         if config.start_date <= d <= config.end_date]
+        window = self.grid_data.slice(np.datetime64(config.start_date, 'D'),
+                                      np.datetime64(config.end_date, 'D'))
+        self._window = window
+        backtest_dates = self.dates[window]
 
         if not backtest_dates:
             raise ValueError("No data available for the specified date range")
 
+        self._build_price_matrix(sorted(tickers), backtest_dates)
+        self.shares_vec = np.zeros(len(self._tickers))
+        self.avg_costs = {}
+
+        candidates, can_change = self._precompute_regime_candidates(
+            self._confirming[window], self._sum_confirming[window]
+        )
+        xlk_vams = self._xlk_vams[window]
+
         # Initial allocation
         first_date = backtest_dates[0]
         self._allocate_to_regime(
@@ -245,25 +332,28 @@ class BacktestEngine:
         )
 
         # Store initial benchmark price
-        initial_benchmark_price = self._get_price(config.benchmark_ticker, first_date) or 100
+        initial_benchmark_price = self._get_price(config.benchmark_ticker) or 100
 
         regime_periods = []
         current_regime_start = first_date
 
-        # Main backtest loop
-        for date in backtest_dates:
-            row = self.grid_data.get(date)
-            if not row:
-                continue
+        # Equity curve columns, filled one slot per day
+        n_days = len(backtest_dates)
+        ec_portfolio = np.empty(n_days)
+        ec_benchmark = np.empty(n_days)
+        ec_cash = np.empty(n_days)
+        ec_regime = np.empty(n_days, dtype=np.int8)
 
-            # Update position prices
-            for ticker, position in self.positions.items():
-                price = self._get_price(ticker, date)
-                if price:
-                    position.current_price = price
+        # Main backtest loop
+        for date_i, date in enumerate(backtest_dates):
+            self._date_i = date_i
 
             # Check for regime change
-            new_regime = self._check_regime_change(row)
+            new_regime = None
+            if can_change[date_i]:
+                candidate = self.REGIMES[candidates[date_i]]
+                if candidate != self.current_regime:
+                    new_regime = candidate
 
             if new_regime:
                 regime_periods.append({
@@ -283,45 +373,51 @@ class BacktestEngine:
                 elif not old_risk_on and new_risk_on:
                     self._handle_risk_on_transition(date, new_regime)
                 else:
-                    portfolio_value = self._calculate_portfolio_value(date)
                     self._liquidate_all(date, f"Regime change to {new_regime}")
                     self._allocate_to_regime(date, new_regime, self.cash, f"Allocated to {new_regime}")
 
                 self.current_regime = new_regime
 
             # Check XLK VAMS exit rule (only in Deflation)
-            elif self.current_regime == "DEFLATION" and self._check_xlk_vams_exit(row, date):
+            elif self.current_regime == "DEFLATION" and self._check_xlk_vams_exit(xlk_vams[date_i]):
                 print(f"{date.strftime('%Y-%m-%d')}: XLK VAMS improved, returning cash to portfolio")
                 if self.shv_position > 0:
-                    shv_price = self._get_price("SHV", date) or 110.0
+                    shv_price = self._get_shv_price()
                     returned_cash = self.shv_position * shv_price
                     self.shv_position = 0
 
-                    total_equity = sum(p.market_value for p in self.positions.values())
+                    market_values = self.shares_vec * self._last_prices[date_i]
+                    total_equity = market_values.sum()
                     if total_equity > 0:
-                        for ticker, position in list(self.positions.items()):
-                            weight = position.market_value / total_equity
+                        for i in self._held_indices():
+                            ticker = self._tickers[i]
+                            weight = market_values[i] / total_equity
                             additional = returned_cash * weight
-                            price = self._get_price(ticker, date)
+                            price = self._get_price(ticker)
                             if price:
                                 shares = additional / price
                                 self._execute_trade(date, "BUY", ticker, shares, price,
                                                     "XLK VAMS improved - reinvesting cash")
 
-            # Record equity curve point
-            portfolio_value = self._calculate_portfolio_value(date)
-            shv_value = self.shv_position * (self._get_price("SHV", date) or 110.0)
+            # Record equity curve point: one dot product against today's row
+            shv_value = self.shv_position * self._get_shv_price()
+            portfolio_value = self.cash + shv_value + float(self.shares_vec @ self._valuation_prices[date_i])
 
-            benchmark_price = self._get_price(config.benchmark_ticker, date) or initial_benchmark_price
+            benchmark_price = self._get_price(config.benchmark_ticker) or initial_benchmark_price
             benchmark_value = config.starting_value * (benchmark_price / initial_benchmark_price)
 
-            self.equity_curve.append(EquityCurvePoint(
-                date=date,
-                portfolio_value=portfolio_value,
-                benchmark_value=benchmark_value,
-                regime=self.current_regime,
-                cash_value=shv_value
-            ))
+            ec_portfolio[date_i] = portfolio_value
+            ec_benchmark[date_i] = benchmark_value
+            ec_cash[date_i] = shv_value
+            ec_regime[date_i] = REGIME_CODES[self.current_regime]
+
+        self.equity_curve = EquityCurve(
+            date=self._dates_np[window],
+            portfolio_value=ec_portfolio,
+            benchmark_value=ec_benchmark,
+            regime=ec_regime,
+            cash_value=ec_cash
+        )
 
         # Final regime period
         regime_periods.append({
@@ -337,10 +433,12 @@ class BacktestEngine:
         """Calculate all backtest metrics"""
         if not self.equity_curve:
             raise ValueError("No equity curve data")
+        pv = self.equity_curve.portfolio_value
+        bv = self.equity_curve.benchmark_value
 
         # Basic returns
         starting = config.starting_value
-        ending = self.equity_curve[-1].portfolio_value
+        ending = float(pv[-1])
         total_return = (ending - starting) / starting
 
         days = len(self.equity_curve)
@@ -349,22 +447,22 @@ class BacktestEngine:
         annualized_return = (1 + total_return) ** (1 / years) - 1 if years > 0 else 0
 
         # Benchmark returns
-        benchmark_start = self.equity_curve[0].benchmark_value
-        benchmark_end = self.equity_curve[-1].benchmark_value
+        benchmark_start = float(bv[0])
+        benchmark_end = float(bv[-1])
         benchmark_total_return = (benchmark_end - benchmark_start) / benchmark_start
         benchmark_annualized = (1 + benchmark_total_return) ** (1 / years) - 1 if years > 0 else 0
 
         # Daily returns for risk metrics
-        portfolio_values = [p.portfolio_value for p in self.equity_curve]
-        benchmark_values = [p.benchmark_value for p in self.equity_curve]
-
-        daily_returns = pd.Series(portfolio_values).pct_change().dropna()
-        benchmark_daily = pd.Series(benchmark_values).pct_change().dropna()
+        portfolio_values = pv.tolist()
+        dates = self.equity_curve.date.tolist()
+        dates_iso = np.datetime_as_string(self.equity_curve.date, unit='s').tolist()
+        daily_returns = np.diff(pv) / pv[:-1]
+        benchmark_daily = np.diff(bv) / bv[:-1]
 
         # Risk metrics
-        std_dev = daily_returns.std() * np.sqrt(252) if len(daily_returns) > 0 else 0.15
+        std_dev = float(np.std(daily_returns, ddof=1) * np.sqrt(252)) if len(daily_returns) > 1 else 0.15
         downside_returns = daily_returns[daily_returns < 0]
-        downside_std = downside_returns.std() * np.sqrt(252) if len(downside_returns) > 0 else 0.10
+        downside_std = float(np.std(downside_returns, ddof=1) * np.sqrt(252)) if len(downside_returns) > 1 else 0.10
 
         risk_free_rate = 0.02
         excess_return = annualized_return - risk_free_rate
@@ -383,103 +481,57 @@ class BacktestEngine:
             dd = (peak - value) / peak
             max_dd = max(max_dd, dd)
             drawdown_series.append({
-                "date": self.equity_curve[i].date.isoformat(),
+                "date": dates_iso[i],
                 "drawdown": -dd
             })
 
         calmar = annualized_return / max_dd if max_dd > 0 else 0
 
         # Beta and Alpha
-        if len(daily_returns) > 0 and len(benchmark_daily) > 0:
-            min_len = min(len(daily_returns), len(benchmark_daily))
-            aligned = pd.DataFrame({
-                'port': daily_returns.values[:min_len],
-                'bench': benchmark_daily.values[:min_len]
-            }).dropna()
-            if len(aligned) > 1:
-                cov = aligned.cov().iloc[0, 1]
-                var = aligned['bench'].var()
-                beta = cov / var if var > 0 else 1
-                alpha = annualized_return - (risk_free_rate + beta * (benchmark_annualized - risk_free_rate))
-            else:
-                beta, alpha = 1, 0
+        valid = ~(np.isnan(daily_returns) | np.isnan(benchmark_daily))
+        port_valid = daily_returns[valid]
+        bench_valid = benchmark_daily[valid]
+        if len(port_valid) > 1:
+            cov = np.cov(port_valid, bench_valid, ddof=1)[0, 1]
+            var = np.var(bench_valid, ddof=1)
+            beta = float(cov / var) if var > 0 else 1
+            alpha = annualized_return - (risk_free_rate + beta * (benchmark_annualized - risk_free_rate))
         else:
             beta, alpha = 1, 0
 
         # Information ratio
-        min_len = min(len(daily_returns), len(benchmark_daily))
-        if min_len > 0:
-            tracking_diff = daily_returns.values[:min_len] - benchmark_daily.values[:min_len]
-            tracking_error = np.std(tracking_diff) * np.sqrt(252) if len(tracking_diff) > 0 else 0.01
+        if len(daily_returns) > 0:
+            tracking_diff = daily_returns - benchmark_daily
+            tracking_error = np.std(tracking_diff) * np.sqrt(252)
             info_ratio = (annualized_return - benchmark_annualized) / tracking_error if tracking_error > 0 else 0
         else:
             info_ratio = 0
 
         # Capture ratios
-        min_len = min(len(daily_returns), len(benchmark_daily))
-        port_aligned = daily_returns.values[:min_len]
-        bench_aligned = benchmark_daily.values[:min_len]
-
-        up_mask = bench_aligned > 0
-        down_mask = bench_aligned < 0
+        up_mask = benchmark_daily > 0
+        down_mask = benchmark_daily < 0
 
-        upside_capture = (np.mean(port_aligned[up_mask]) / np.mean(bench_aligned[up_mask]) * 100) if up_mask.sum() > 0 and np.mean(bench_aligned[up_mask]) != 0 else 100
-        downside_capture = (np.mean(port_aligned[down_mask]) / np.mean(bench_aligned[down_mask]) * 100) if down_mask.sum() > 0 and np.mean(bench_aligned[down_mask]) != 0 else 100
+        up_bench = np.mean(benchmark_daily[up_mask]) if up_mask.any() else 0
+        down_bench = np.mean(benchmark_daily[down_mask]) if down_mask.any() else 0
+        upside_capture = np.mean(daily_returns[up_mask]) / up_bench * 100 if up_bench != 0 else 100
+        downside_capture = np.mean(daily_returns[down_mask]) / down_bench * 100 if down_bench != 0 else 100
 
         # Monthly returns
-        monthly_returns = {}
-        benchmark_monthly = {}
-        dates = [p.date for p in self.equity_curve]
-
-        month_start_val = portfolio_values[0]
-        bench_month_start = benchmark_values[0]
-        prev_month = dates[0].strftime('%Y-%m')
-
-        for i, (d, val, bench) in enumerate(zip(dates, portfolio_values, benchmark_values)):
-            year = str(d.year)
-            month = d.strftime('%b')
-            curr_month = d.strftime('%Y-%m')
-
-            if curr_month != prev_month or i == len(dates) - 1:
-                if year not in monthly_returns:
-                    monthly_returns[year] = {}
-                    benchmark_monthly[year] = {}
-
-                prev_date = dates[i-1] if i > 0 else dates[0]
-                prev_year = str(prev_date.year)
-                prev_month_name = prev_date.strftime('%b')
-
-                if prev_year not in monthly_returns:
-                    monthly_returns[prev_year] = {}
-                    benchmark_monthly[prev_year] = {}
-
-                port_ret = (portfolio_values[i-1] - month_start_val) / month_start_val if month_start_val > 0 else 0
-                bench_ret = (benchmark_values[i-1] - bench_month_start) / bench_month_start if bench_month_start > 0 else 0
-
-                monthly_returns[prev_year][prev_month_name] = port_ret
-                benchmark_monthly[prev_year][prev_month_name] = bench_ret
-
-                month_start_val = val
-                bench_month_start = bench
-                prev_month = curr_month
+        months = pd.DatetimeIndex(self.equity_curve.date).to_period('M')
+        monthly_returns = self._monthly_returns(pv, months)
+        benchmark_monthly = self._monthly_returns(bv, months)
 
         # Positive months
         all_monthly = [r for yr in monthly_returns.values() for r in yr.values()]
         positive_months = sum(1 for r in all_monthly if r > 0)
         positive_months_pct = positive_months / len(all_monthly) * 100 if all_monthly else 50
 
-        # Trailing returns
-        trailing = {}
-        benchmark_trailing = {}
-
-        if days >= 2:
-            trailing['1D'] = (portfolio_values[-1] - portfolio_values[-2]) / portfolio_values[-2]
-            benchmark_trailing['1D'] = (benchmark_values[-1] - benchmark_values[-2]) / benchmark_values[-2]
-
-        for period, td in [('1W', 5), ('1M', 21), ('3M', 63), ('6M', 126), ('1Y', 252), ('3Y', 756), ('5Y', 1260)]:
-            if days > td:
-                trailing[period] = (portfolio_values[-1] - portfolio_values[-td-1]) / portfolio_values[-td-1]
-                benchmark_trailing[period] = (benchmark_values[-1] - benchmark_values[-td-1]) / benchmark_values[-td-1]
+        # Trailing returns: gather every lookback that fits the curve at once
+        valid = self.TRAILING_OFFSETS < days
+        names = [name for name, ok in zip(self.TRAILING_PERIODS, valid) if ok]
+        past = -self.TRAILING_OFFSETS[valid] - 1
+        trailing = dict(zip(names, ((pv[-1] - pv[past]) / pv[past]).tolist()))
+        benchmark_trailing = dict(zip(names, ((bv[-1] - bv[past]) / bv[past]).tolist()))
 
         trailing['YTD'] = total_return
         benchmark_trailing['YTD'] = benchmark_total_return
@@ -488,21 +540,23 @@ class BacktestEngine:
         regime_stats = []
         regime_counts = defaultdict(lambda: {"days": 0, "trades": 0, "returns": []})
 
+        # The curve holds one point per backtest date, so each period is a
+        # contiguous slice of the window
+        ec_dates = self._dates_np[self._window]
         for period in regime_periods:
             regime = period['regime']
-            start = datetime.fromisoformat(period['start'])
-            end = datetime.fromisoformat(period['end'])
-
-            period_days = [p for p in self.equity_curve if start <= p.date <= end]
-            if period_days:
-                regime_counts[regime]['days'] += len(period_days)
-                start_val = period_days[0].portfolio_value
-                end_val = period_days[-1].portfolio_value
+            i0 = np.searchsorted(ec_dates, np.datetime64(period['start']), side='left')
+            i1 = np.searchsorted(ec_dates, np.datetime64(period['end']), side='right')
+
+            if i1 > i0:
+                regime_counts[regime]['days'] += int(i1 - i0)
+                start_val = pv[i0]
+                end_val = pv[i1 - 1]
                 if start_val > 0:
-                    regime_counts[regime]['returns'].append((end_val - start_val) / start_val)
+                    regime_counts[regime]['returns'].append(float((end_val - start_val) / start_val))
 
-        for trade in self.trades:
-            regime_counts[trade.regime]['trades'] += 1
+        for regime, count in Counter(self.trade_log.regime).items():
+            regime_counts[regime]['trades'] = count
 
         total_days = len(self.equity_curve)
         for regime, data in regime_counts.items():
@@ -517,11 +571,11 @@ class BacktestEngine:
 
         # Final holdings
         final_holdings = []
-        total_value = self._calculate_portfolio_value(self.equity_curve[-1].date)
+        total_value = ending
 
-        for ticker, pos in self.positions.items():
+        for pos in self._positions():
             final_holdings.append({
-                "ticker": ticker,
+                "ticker": pos.ticker,
                 "shares": pos.shares,
                 "price": pos.current_price,
                 "value": pos.market_value,
@@ -561,65 +615,73 @@ class BacktestEngine:
             final_holdings=final_holdings,
             regime_stats=regime_stats,
             regime_timeline=regime_periods,
-            trades=self.trades,
-            total_trades=len(self.trades)
+            trades=self.trade_log.to_trades(),
+            total_trades=len(self.trade_log)
         )
 
+    @staticmethod
+    def _monthly_returns(values: np.ndarray,
+                         months: pd.PeriodIndex) -> Dict[str, Dict[str, float]]:
+        """Month-end over prior month-end returns as {year: {month: return}}.
+        The first (partial) month is measured from the starting value."""
+        month_end = pd.Series(values, index=months).groupby(level=0).last()
+        prev_end = month_end.shift(1)
+        prev_end.iloc[0] = values[0]
+        returns = (month_end / prev_end - 1).where(prev_end > 0, 0.0)
+
+        grid: Dict[str, Dict[str, float]] = {}
+        for period, ret in returns.items():
+            grid.setdefault(str(period.year), {})[period.strftime('%b')] = float(ret)
+        return grid
+
+    @staticmethod
+    def _scan_drawdowns(values: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Locate every drawdown episode in an equity curve.
+
+        An episode is a run of days below the running peak. It starts on the
+        last day at the peak and ends on the first day back at it.
+        Returns (start_idx, low_idx, end_idx, drawdown_pct) arrays, with
+        end_idx = -1 for an episode still open at the end of the curve.
+        """
+        peaks = np.maximum.accumulate(values)
+        dd = (peaks - values) / peaks
+
+        recovered = (values >= peaks).astype(np.int8)
+        flips = np.flatnonzero(np.diff(recovered)) + 1
+        starts = flips[recovered[flips] == 0]
+        ends = np.full(len(starts), -1, dtype=np.int64)
+        closed = flips[recovered[flips] == 1]
+        ends[:len(closed)] = closed
+
+        lows = np.array([s + np.argmax(dd[s:e if e >= 0 else None])
+                         for s, e in zip(starts, ends)], dtype=np.int64)
+        return starts - 1, lows, ends, dd[lows]
+
     def _find_top_drawdowns(self, values: List[float], dates: List[datetime],
                             n: int = 5) -> List[DrawdownEvent]:
         """Find the top n drawdown events"""
-        drawdowns = []
-        peak = values[0]
-        peak_idx = 0
-        in_drawdown = False
-        dd_start_idx = 0
-        dd_low_idx = 0
-        dd_low = float('inf')
-
-        for i, val in enumerate(values):
-            if val >= peak:
-                if in_drawdown:
-                    dd_pct = (peak - dd_low) / peak
-                    drawdowns.append(DrawdownEvent(
-                        drawdown_pct=dd_pct,
-                        start_date=dates[dd_start_idx],
-                        low_date=dates[dd_low_idx],
-                        end_date=dates[i],
-                        length_days=i - dd_start_idx,
-                        recovery_days=i - dd_low_idx
-                    ))
-                    in_drawdown = False
-                peak = val
-                peak_idx = i
-            else:
-                if not in_drawdown:
-                    in_drawdown = True
-                    dd_start_idx = peak_idx
-                    dd_low = val
-                    dd_low_idx = i
-                elif val < dd_low:
-                    dd_low = val
-                    dd_low_idx = i
-
-        if in_drawdown:
-            dd_pct = (peak - dd_low) / peak
-            drawdowns.append(DrawdownEvent(
-                drawdown_pct=dd_pct,
-                start_date=dates[dd_start_idx],
-                low_date=dates[dd_low_idx],
-                end_date=None,
-                length_days=len(values) - dd_start_idx,
-                recovery_days=None
-            ))
-
-        drawdowns.sort(key=lambda x: x.drawdown_pct, reverse=True)
-        return drawdowns[:n]
-
+        arr = np.asarray(values, dtype=np.float64)
+        starts, lows, ends, dd_pcts = self._scan_drawdowns(arr)
+
+        # Stable so equal drawdowns keep chronological order
+        top = np.argsort(-dd_pcts, kind='stable')[:n]
+        return [
+            DrawdownEvent(
+                drawdown_pct=float(dd_pcts[k]),
+                start_date=dates[starts[k]],
+                low_date=dates[lows[k]],
+                end_date=dates[ends[k]] if ends[k] >= 0 else None,
+                length_days=int((ends[k] if ends[k] >= 0 else len(arr)) - starts[k]),
+                recovery_days=int(ends[k] - lows[k]) if ends[k] >= 0 else None
+            )
+            for k in top
+        ]
 
 if __name__ == "__main__":
     from parser import parse_42macro_excel
 
-    rows, tickers, summary = parse_42macro_excel(
+    grid, tickers, summary = parse_42macro_excel(
         "/sessions/exciting-clever-lamport/mnt/uploads/Macro Regime Outlook (1).xlsx"
     )
 
@@ -632,7 +694,7 @@ if __name__ == "__main__":
         benchmark_ticker="SPY"
     )
 
-    engine = BacktestEngine(rows, DEFAULT_PROFILES["aggressive"])
+    engine = BacktestEngine(grid, DEFAULT_PROFILES["aggressive"])
     results = engine.run(config)
 
     print(f"\n=== RESULTS ===")
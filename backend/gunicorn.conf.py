@@ -0,0 +1,16 @@
+"""
+Gunicorn config for running the API with multiple uvicorn workers:
+
+    gunicorn -c gunicorn.conf.py main:app
+
+Each worker is its own process with its own uploaded GRID data, custom risk
+profiles and rankings caches, so an upload is only visible to the worker that
+received it. Saved backtests are shared through the backtests directory.
+Workers therefore default to one; raise WEB_CONCURRENCY only for deployments
+that do not depend on that per-process state.
+"""
+import os
+
+bind = os.environ.get("BIND", "0.0.0.0:8000")
+workers = int(os.environ.get("WEB_CONCURRENCY", 1))
+worker_class = "uvicorn.workers.UvicornWorker"
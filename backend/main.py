@@ -3,38 +3,49 @@ FastAPI Backend for PGRB Portfolio Backtesting
 """
 import os
 import sys
-import json
 import uuid
+import shutil
+import asyncio
+import tempfile
+import threading
 from datetime import datetime
-from typing import List, Optional, Dict, Any
-from pathlib import Path
+from typing import List, Optional, Dict
+
+import numpy as np
+import orjson
 
 from fastapi import FastAPI, UploadFile, File, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import FileResponse, ORJSONResponse, Response
 from pydantic import BaseModel
 
 # Add current directory to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from parser import parse_42macro_excel, get_data_preview
+from parser import parse_42macro_excel, parse_42macro_excel_cached, get_data_preview
 from engine import BacktestEngine
+from backtest_store import BacktestStore
+from backtest_schemas import BacktestOut
 from models import (
-    GridDataRow, RiskProfile, BacktestConfig, BacktestResults,
-    DEFAULT_PROFILES, REGIME_COLORS
+    GridData, RiskProfile, BacktestConfig, BacktestResults, EquityCurve,
+    DEFAULT_PROFILES, REGIME_COLORS, REGIME_CODES, REGIME_NAMES, REGIME_COLOR_BY_CODE
 )
 
 # Rankings feature imports
 try:
-    from database import init_db, SessionLocal
+    from database import init_db, ScopedSession
     from rankings_router import router as rankings_router
-    from seed_fund_data import seed_funds, seed_categories
+    from seed_fund_data import seed_funds
     RANKINGS_AVAILABLE = True
 except Exception as e:
     print(f"Rankings feature not available: {e}")
     RANKINGS_AVAILABLE = False
 
-app = FastAPI(title="PGRB Portfolio Backtesting API", version="1.0.0")
+app = FastAPI(
+    title="PGRB Portfolio Backtesting API",
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+)
 
 # CORS
 app.add_middleware(
@@ -46,10 +57,12 @@ app.add_middleware(
 )
 
 # In-memory storage (would be database in production)
-grid_data: List[GridDataRow] = []
+grid_data: Optional[GridData] = None
 data_summary: Dict = {}
-backtests: Dict[str, Dict] = {}
+backtests = BacktestStore()
 risk_profiles: Dict[str, RiskProfile] = dict(DEFAULT_PROFILES)
+_risk_profiles_json: Optional[bytes] = None  # cached list response, reset on create/delete
+_risk_profiles_lock = threading.Lock()  # guards risk_profiles and _risk_profiles_json
 
 # Models for API
 class BacktestRequest(BaseModel):
@@ -65,17 +78,23 @@ class RiskProfileRequest(BaseModel):
     allocations: Dict[str, Dict[str, float]]
 
 # Helper functions
+_EQUITY_CURVE_KEYS = ("date", "portfolio_value", "benchmark_value", "regime", "cash_value")
+
+def equity_curve_to_list(ec: EquityCurve) -> List[Dict]:
+    """Zip the equity curve columns into one dict per day"""
+    columns = (
+        np.datetime_as_string(ec.date, unit='s').tolist(),
+        ec.portfolio_value.tolist(),
+        ec.benchmark_value.tolist(),
+        REGIME_NAMES[ec.regime].tolist(),
+        ec.cash_value.tolist(),
+    )
+    return [dict(zip(_EQUITY_CURVE_KEYS, row)) for row in zip(*columns)]
+
 def results_to_dict(results: BacktestResults) -> Dict:
-    """Convert BacktestResults to JSON-serializable dict"""
+    """Arrange BacktestResults in the BacktestResultsOut layout; dataclass entries are read by attribute"""
     return {
-        "config": {
-            "name": results.config.name,
-            "risk_profile_id": results.config.risk_profile_id,
-            "start_date": results.config.start_date.isoformat(),
-            "end_date": results.config.end_date.isoformat(),
-            "starting_value": results.config.starting_value,
-            "benchmark_ticker": results.config.benchmark_ticker,
-        },
+        "config": results.config,
         "summary": {
             "starting_value": results.starting_value,
             "ending_value": results.ending_value,
@@ -97,32 +116,13 @@ def results_to_dict(results: BacktestResults) -> Dict:
             "downside_capture": results.downside_capture,
             "positive_months_pct": results.positive_months_pct,
         },
-        "equity_curve": [
-            {
-                "date": p.date.isoformat(),
-                "portfolio_value": p.portfolio_value,
-                "benchmark_value": p.benchmark_value,
-                "regime": p.regime,
-                "cash_value": p.cash_value
-            }
-            for p in results.equity_curve
-        ],
+        "equity_curve": equity_curve_to_list(results.equity_curve),
         "drawdown_series": results.drawdown_series,
         "monthly_returns": results.monthly_returns,
         "benchmark_monthly_returns": results.benchmark_monthly_returns,
         "trailing_returns": results.trailing_returns,
         "benchmark_trailing_returns": results.benchmark_trailing_returns,
-        "top_drawdowns": [
-            {
-                "drawdown_pct": dd.drawdown_pct,
-                "start_date": dd.start_date.isoformat(),
-                "low_date": dd.low_date.isoformat(),
-                "end_date": dd.end_date.isoformat() if dd.end_date else None,
-                "length_days": dd.length_days,
-                "recovery_days": dd.recovery_days
-            }
-            for dd in results.top_drawdowns
-        ],
+        "top_drawdowns": results.top_drawdowns,
         "final_holdings": results.final_holdings,
         "regime_stats": [
             {
@@ -131,36 +131,30 @@ def results_to_dict(results: BacktestResults) -> Dict:
                 "pct_time": rs.pct_time,
                 "total_return": rs.total_return,
                 "num_trades": rs.num_trades,
-                "color": REGIME_COLORS.get(rs.regime, "#888888")
+                "color": REGIME_COLOR_BY_CODE[REGIME_CODES.get(rs.regime, -1)]
             }
             for rs in results.regime_stats
         ],
         "regime_timeline": results.regime_timeline,
-        "trades": [
-            {
-                "date": t.date.isoformat(),
-                "action": t.action,
-                "ticker": t.ticker,
-                "shares": t.shares,
-                "price": t.price,
-                "value": t.value,
-                "regime": t.regime,
-                "reason": t.reason
-            }
-            for t in results.trades
-        ],
+        "trades": results.trades,
         "total_trades": results.total_trades
     }
 
+def _save_upload(file: UploadFile) -> str:
+    """Copy an upload to a temp file in 1 MiB chunks and return its path"""
+    with tempfile.NamedTemporaryFile(delete=False, suffix=".xlsx") as f:
+        shutil.copyfileobj(file.file, f, 1024 * 1024)
+    return f.name
+
 # Routes
 
 @app.get("/")
-async def root():
+def root():
     return {"message": "PGRB Portfolio Backtesting API", "version": "1.0.0"}
 
 @app.get("/api/health")
-async def health():
-    return {"status": "healthy", "data_loaded": len(grid_data) > 0}
+def health():
+    return {"status": "healthy", "data_loaded": bool(grid_data)}
 
 # Data Management
 @app.post("/api/data/upload")
@@ -168,79 +162,78 @@ async def upload_data(file: UploadFile = File(...)):
     """Upload and parse 42 Macro Excel file"""
     global grid_data, data_summary
 
-    if not file.filename.endswith(('.xlsx', '.xls')):
-        raise HTTPException(status_code=400, detail="File must be Excel format (.xlsx or .xls)")
+    if not file.filename.endswith('.xlsx'):
+        raise HTTPException(status_code=400, detail="File must be Excel format (.xlsx)")
 
+    temp_path = None
     try:
-        # Save uploaded file temporarily
-        temp_path = f"/tmp/{uuid.uuid4()}.xlsx"
-        with open(temp_path, "wb") as f:
-            content = await file.read()
-            f.write(content)
-
-        # Parse the file
-        rows, tickers, summary = parse_42macro_excel(temp_path)
+        # Save uploaded file temporarily and parse it off the event loop
+        temp_path = await asyncio.to_thread(_save_upload, file)
+        grid, tickers, summary = await asyncio.to_thread(parse_42macro_excel, temp_path)
 
         # Store in memory
-        grid_data = rows
+        grid_data = grid
         data_summary = summary
 
-        # Cleanup
-        os.remove(temp_path)
-
         return {
             "success": True,
-            "message": f"Successfully loaded {len(rows)} trading days",
+            "message": f"Successfully loaded {len(grid)} trading days",
             "summary": summary
         }
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+    finally:
+        # Cleanup
+        if temp_path:
+            os.unlink(temp_path)
 
 @app.get("/api/data/summary")
-async def get_data_summary():
+def get_data_summary():
     """Get summary of loaded data"""
     if not grid_data:
         raise HTTPException(status_code=404, detail="No data loaded. Please upload a file first.")
     return data_summary
 
 @app.get("/api/data/preview")
-async def get_preview(n: int = 20):
+def get_preview(n: int = 20):
     """Get preview of recent data"""
     if not grid_data:
         raise HTTPException(status_code=404, detail="No data loaded")
     return get_data_preview(grid_data, n)
 
 @app.get("/api/data/regimes")
-async def get_regime_distribution():
+def get_regime_distribution():
     """Get regime distribution summary"""
     if not grid_data:
         raise HTTPException(status_code=404, detail="No data loaded")
 
-    counts = {}
-    for row in grid_data:
-        counts[row.market_regime] = counts.get(row.market_regime, 0) + 1
-
     return {
-        "distribution": counts,
+        "distribution": data_summary["regime_breakdown"],
+        "risk_distribution": data_summary["risk_regime_breakdown"],
         "colors": REGIME_COLORS
     }
 
 # Risk Profiles
 @app.get("/api/risk-profiles")
-async def list_risk_profiles():
+def list_risk_profiles():
     """List all risk profiles"""
-    return [
-        {
-            "id": p.id,
-            "name": p.name,
-            "allocations": p.allocations
-        }
-        for p in risk_profiles.values()
-    ]
+    global _risk_profiles_json
+    with _risk_profiles_lock:
+        if _risk_profiles_json is None:
+            _risk_profiles_json = orjson.dumps([
+                {
+                    "id": p.id,
+                    "name": p.name,
+                    "allocations": p.allocations
+                }
+                for p in risk_profiles.values()
+            ])
+        content = _risk_profiles_json
+    return Response(content=content, media_type="application/json")
 
 @app.get("/api/risk-profiles/{profile_id}")
-async def get_risk_profile(profile_id: str):
+def get_risk_profile(profile_id: str):
     """Get a specific risk profile"""
     if profile_id not in risk_profiles:
         raise HTTPException(status_code=404, detail="Risk profile not found")
@@ -248,28 +241,55 @@ async def get_risk_profile(profile_id: str):
     return {"id": p.id, "name": p.name, "allocations": p.allocations}
 
 @app.post("/api/risk-profiles")
-async def create_risk_profile(profile: RiskProfileRequest):
+def create_risk_profile(profile: RiskProfileRequest):
     """Create a new risk profile"""
+    global _risk_profiles_json
     profile_id = str(uuid.uuid4())[:8]
     new_profile = RiskProfile(
         id=profile_id,
         name=profile.name,
         allocations=profile.allocations
     )
-    risk_profiles[profile_id] = new_profile
+    with _risk_profiles_lock:
+        risk_profiles[profile_id] = new_profile
+        _risk_profiles_json = None
     return {"id": profile_id, "name": new_profile.name}
 
 @app.delete("/api/risk-profiles/{profile_id}")
-async def delete_risk_profile(profile_id: str):
+def delete_risk_profile(profile_id: str):
     """Delete a risk profile"""
+    global _risk_profiles_json
     if profile_id in ["aggressive", "moderate", "conservative"]:
         raise HTTPException(status_code=400, detail="Cannot delete default profiles")
-    if profile_id not in risk_profiles:
-        raise HTTPException(status_code=404, detail="Risk profile not found")
-    del risk_profiles[profile_id]
+    with _risk_profiles_lock:
+        if profile_id not in risk_profiles:
+            raise HTTPException(status_code=404, detail="Risk profile not found")
+        del risk_profiles[profile_id]
+        _risk_profiles_json = None
     return {"success": True}
 
 # Backtests
+def _run_and_serialize(engine: BacktestEngine, config: BacktestConfig,
+                       backtest_id: str, created_at: str):
+    """Run, encode and store a backtest; all CPU- or disk-bound"""
+    results = engine.run(config)
+    payload = BacktestOut(
+        id=backtest_id,
+        created_at=created_at,
+        results=results_to_dict(results)
+    ).model_dump_json(by_alias=True).encode()
+
+    # Store results, serialized once so reads serve the cached bytes
+    backtests.add({
+        "id": backtest_id,
+        "name": results.config.name,
+        "created_at": created_at,
+        "total_return": results.total_return,
+        "sharpe_ratio": results.sharpe_ratio
+    }, payload)
+    return results
+
+
 @app.post("/api/backtest")
 async def run_backtest(request: BacktestRequest):
     """Run a new backtest"""
@@ -281,8 +301,8 @@ async def run_backtest(request: BacktestRequest):
 
     try:
         # Parse dates
-        start_date = datetime.strptime(request.start_date, "%Y-%m-%d")
-        end_date = datetime.strptime(request.end_date, "%Y-%m-%d")
+        start_date = np.datetime64(request.start_date, 'D').astype('datetime64[us]').item()
+        end_date = np.datetime64(request.end_date, 'D').astype('datetime64[us]').item()
 
         # Create config
         config = BacktestConfig(
@@ -294,18 +314,13 @@ async def run_backtest(request: BacktestRequest):
             benchmark_ticker=request.benchmark_ticker
         )
 
-        # Run backtest
+        # Run, serialize and store the backtest off the event loop
         profile = risk_profiles[request.risk_profile_id]
         engine = BacktestEngine(grid_data, profile)
-        results = engine.run(config)
-
-        # Store results
         backtest_id = str(uuid.uuid4())[:8]
-        backtests[backtest_id] = {
-            "id": backtest_id,
-            "created_at": datetime.now().isoformat(),
-            "results": results_to_dict(results)
-        }
+        created_at = datetime.now().isoformat()
+        results = await asyncio.to_thread(
+            _run_and_serialize, engine, config, backtest_id, created_at)
 
         return {
             "success": True,
@@ -322,44 +337,33 @@ async def run_backtest(request: BacktestRequest):
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.get("/api/backtest/{backtest_id}")
-async def get_backtest(backtest_id: str):
+@app.get("/api/backtest/{backtest_id}", responses={200: {"model": BacktestOut}})
+def get_backtest(backtest_id: str):
     """Get backtest results"""
     if backtest_id not in backtests:
         raise HTTPException(status_code=404, detail="Backtest not found")
-    return backtests[backtest_id]
+    payload = backtests.get(backtest_id)
+    if payload is None:
+        return FileResponse(backtests.path(backtest_id), media_type="application/json")
+    return Response(content=payload, media_type="application/json")
 
 @app.get("/api/backtests")
-async def list_backtests():
+def list_backtests():
     """List all backtests"""
-    return [
-        {
-            "id": bt["id"],
-            "name": bt["results"]["config"]["name"],
-            "created_at": bt["created_at"],
-            "total_return": bt["results"]["summary"]["total_return"],
-            "sharpe_ratio": bt["results"]["risk_metrics"]["sharpe_ratio"]
-        }
-        for bt in backtests.values()
-    ]
+    return backtests.summaries()
 
 # Ticker validation
 @app.get("/api/validate-ticker")
-async def validate_ticker(ticker: str):
+def validate_ticker(ticker: str):
     """Validate if a ticker exists in the data"""
     if not grid_data:
         raise HTTPException(status_code=400, detail="No data loaded")
 
     # Check if ticker exists in VAMS data
-    tickers_in_data = set()
-    for row in grid_data[:1]:  # Just check first row
-        tickers_in_data = set(row.vams.keys())
-        break
-
     return {
         "ticker": ticker,
-        "valid": ticker in tickers_in_data,
-        "available_tickers": sorted(list(tickers_in_data))
+        "valid": ticker in grid_data.ticker_index,
+        "available_tickers": grid_data.sorted_tickers
     }
 
 # Include rankings router if available
@@ -375,10 +379,10 @@ async def startup_event():
     default_file = "/sessions/exciting-clever-lamport/mnt/uploads/Macro Regime Outlook (1).xlsx"
     if os.path.exists(default_file):
         try:
-            rows, tickers, summary = parse_42macro_excel(default_file)
-            grid_data = rows
+            grid, tickers, summary = parse_42macro_excel_cached(default_file)
+            grid_data = grid
             data_summary = summary
-            print(f"Auto-loaded {len(rows)} rows from default file")
+            print(f"Auto-loaded {len(grid)} rows from default file")
         except Exception as e:
             print(f"Failed to auto-load data: {e}")
 
@@ -386,11 +390,11 @@ async def startup_event():
     if RANKINGS_AVAILABLE:
         try:
             init_db()
-            db = SessionLocal()
+            db = ScopedSession()
             try:
                 seed_funds(db)
             finally:
-                db.close()
+                ScopedSession.remove()
             print("Rankings database initialized with seed data")
         except Exception as e:
             print(f"Rankings database initialization failed: {e}")
@@ -400,4 +404,13 @@ async def startup_event():
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8000,
+        # uvloop and httptools are used when installed
+        loop="auto",
+        http="auto",
+        # Uploaded data, risk profiles and caches are per process: one worker by default
+        workers=int(os.environ.get("WEB_CONCURRENCY", 1)),
+    )
@@ -1,4 +1,5 @@
 """Data models for PGRB Backtesting"""
+import numpy as np
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional
 from datetime import datetime
@@ -14,6 +15,12 @@ class RiskRegime(Enum):
     RISK_ON = "RISK ON"
     RISK_OFF = "RISK OFF"
 
+# int8 codes for the regime columns of GridData; unrecognized labels map to UNKNOWN
+REGIME_NAMES = np.array([r.value for r in Regime] + ["UNKNOWN"], dtype=object)
+REGIME_CODES = {name: code for code, name in enumerate(REGIME_NAMES)}
+RISK_REGIME_NAMES = np.array([r.value for r in RiskRegime] + ["UNKNOWN"], dtype=object)
+RISK_REGIME_CODES = {name: code for code, name in enumerate(RISK_REGIME_NAMES)}
+
 # Regime colors for frontend
 REGIME_COLORS = {
     "GOLDILOCKS": "#22c55e",  # Green
@@ -21,19 +28,50 @@ REGIME_COLORS = {
     "INFLATION": "#f97316",   # Orange
     "DEFLATION": "#ef4444",   # Red
 }
+# Same colors indexed by REGIME_CODES, grey for UNKNOWN
+REGIME_COLOR_BY_CODE = tuple(REGIME_COLORS.get(name, "#888888") for name in REGIME_NAMES)
 
 @dataclass
-class GridDataRow:
-    """Single row of GRID data from 42 Macro Excel"""
-    date: datetime
-    sum_confirming_markets: int
-    goldilocks_confirming: int
-    reflation_confirming: int
-    inflation_confirming: int
-    deflation_confirming: int
-    market_regime: str
-    risk_regime: str
-    vams: Dict[str, int]  # {ticker: -2/0/+2}
+class GridData:
+    """GRID data from 42 Macro Excel as columns, one row per date sorted by date"""
+    dates: np.ndarray          # datetime64[D]
+    confirming: np.ndarray     # (N, 5) int16: sum, goldilocks, reflation, inflation, deflation
+    market_regime: np.ndarray  # int8 REGIME_CODES
+    risk_regime: np.ndarray    # int8 RISK_REGIME_CODES
+    vams: np.ndarray           # (N, T) int8 of -2/0/+2, columns follow tickers
+    tickers: List[str]
+    ticker_index: Dict[str, int] = field(init=False)
+    sorted_tickers: List[str] = field(init=False)
+
+    def __post_init__(self):
+        self.ticker_index = {t: i for i, t in enumerate(self.tickers)}
+        self.sorted_tickers = sorted(self.ticker_index)
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def slice(self, start: np.datetime64, end: np.datetime64) -> slice:
+        """Rows dated from start through end, inclusive"""
+        return slice(int(np.searchsorted(self.dates, start, side='left')),
+                     int(np.searchsorted(self.dates, end, side='right')))
+
+    @property
+    def market_regime_names(self) -> np.ndarray:
+        return REGIME_NAMES[self.market_regime]
+
+    @property
+    def risk_regime_names(self) -> np.ndarray:
+        return RISK_REGIME_NAMES[self.risk_regime]
+
+    def regime_counts(self) -> Dict[str, int]:
+        """Number of rows per market regime, for regimes that occur"""
+        counts = np.bincount(self.market_regime, minlength=len(REGIME_NAMES))
+        return {REGIME_NAMES[i]: int(c) for i, c in enumerate(counts) if c}
+
+    def risk_regime_counts(self) -> Dict[str, int]:
+        """Number of rows per risk regime, for regimes that occur"""
+        counts = np.bincount(self.risk_regime, minlength=len(RISK_REGIME_NAMES))
+        return {RISK_REGIME_NAMES[i]: int(c) for i, c in enumerate(counts) if c}
 
 @dataclass
 class RiskProfile:
@@ -42,7 +80,7 @@ class RiskProfile:
     name: str
     allocations: Dict[str, Dict[str, float]]  # {regime: {ticker: weight}}
 
-@dataclass
+@dataclass(slots=True)
 class Position:
     """Current position in a security"""
     ticker: str
@@ -60,7 +98,7 @@ class Position:
             return 0
         return (self.current_price - self.avg_cost) / self.avg_cost
 
-@dataclass
+@dataclass(slots=True)
 class Trade:
     """Record of a trade execution"""
     date: datetime
@@ -73,15 +111,60 @@ class Trade:
     reason: str
 
 @dataclass
-class EquityCurvePoint:
-    """Single point on equity curve"""
-    date: datetime
-    portfolio_value: float
-    benchmark_value: float
-    regime: str
-    cash_value: float = 0
+class TradeLog:
+    """Column store of trades recorded during a backtest run"""
+    date: List[datetime] = field(default_factory=list)
+    action: List[str] = field(default_factory=list)
+    ticker: List[str] = field(default_factory=list)
+    shares: List[float] = field(default_factory=list)
+    price: List[float] = field(default_factory=list)
+    value: List[float] = field(default_factory=list)
+    regime: List[str] = field(default_factory=list)
+    reason: List[str] = field(default_factory=list)
+
+    def append(self, date: datetime, action: str, ticker: str, shares: float,
+               price: float, value: float, regime: str, reason: str):
+        self.date.append(date)
+        self.action.append(action)
+        self.ticker.append(ticker)
+        self.shares.append(shares)
+        self.price.append(price)
+        self.value.append(value)
+        self.regime.append(regime)
+        self.reason.append(reason)
+
+    def extend(self, date: List[datetime], action: List[str], ticker: List[str],
+               shares: List[float], price: List[float], value: List[float],
+               regime: List[str], reason: List[str]):
+        self.date.extend(date)
+        self.action.extend(action)
+        self.ticker.extend(ticker)
+        self.shares.extend(shares)
+        self.price.extend(price)
+        self.value.extend(value)
+        self.regime.extend(regime)
+        self.reason.extend(reason)
+
+    def __len__(self) -> int:
+        return len(self.date)
+
+    def to_trades(self) -> List[Trade]:
+        return list(map(Trade, self.date, self.action, self.ticker, self.shares,
+                        self.price, self.value, self.regime, self.reason))
 
 @dataclass
+class EquityCurve:
+    """Column store of the daily equity curve, one entry per backtest date"""
+    date: np.ndarray             # datetime64[us]
+    portfolio_value: np.ndarray
+    benchmark_value: np.ndarray
+    regime: np.ndarray           # int8 REGIME_CODES
+    cash_value: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.date)
+
+@dataclass(slots=True)
 class DrawdownEvent:
     """A drawdown period"""
     drawdown_pct: float
@@ -91,7 +174,7 @@ class DrawdownEvent:
     length_days: int
     recovery_days: Optional[int]
 
-@dataclass
+@dataclass(slots=True)
 class RegimeStat:
     """Statistics for a single regime"""
     regime: str
@@ -137,7 +220,7 @@ class BacktestResults:
     positive_months_pct: float
 
     # Time series
-    equity_curve: List[EquityCurvePoint] = field(default_factory=list)
+    equity_curve: Optional[EquityCurve] = None
     drawdown_series: List[dict] = field(default_factory=list)
 
     # Monthly returns grid
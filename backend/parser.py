@@ -1,10 +1,22 @@
 """Parser for 42 Macro Excel files"""
+import os
+import hashlib
+from pathlib import Path
+import numpy as np
 import pandas as pd
-from datetime import datetime
+from openpyxl import load_workbook
 from typing import List, Dict, Tuple
-from models import GridDataRow
+from models import (
+    GridData, REGIME_CODES, REGIME_NAMES, RISK_REGIME_CODES, RISK_REGIME_NAMES
+)
 
-def parse_42macro_excel(file_path: str) -> Tuple[List[GridDataRow], List[str], Dict]:
+USED_COLUMNS = 81  # 0-10 grid fields, 11-80 VAMS
+
+# Parsed-column snapshots, keyed by workbook path, mtime and size
+_default_cache_dir = Path(__file__).parent / "grid_cache"
+GRID_CACHE_DIR = Path(os.environ.get("GRID_CACHE_DIR", _default_cache_dir))
+
+def parse_42macro_excel(file_path: str) -> Tuple[GridData, List[str], Dict]:
     """
     Parse 42 Macro Excel file into structured data.
 
@@ -12,126 +24,194 @@ def parse_42macro_excel(file_path: str) -> Tuple[List[GridDataRow], List[str], D
         file_path: Path to the Excel file
 
     Returns:
-        Tuple of (list of GridDataRow, list of tickers, summary dict)
+        Tuple of (GridData, list of tickers, summary dict)
     """
-    # Read with header on row 1 (0-indexed)
-    df = pd.read_excel(file_path, sheet_name=0, header=1)
-
-    # Extract tickers from columns 11-80
-    raw_tickers = list(df.columns[11:81])
-    # Filter to valid ticker symbols (remove NaN, unnamed columns)
-    tickers = [t for t in raw_tickers if isinstance(t, str) and not t.startswith('Unnamed')]
-
-    rows = []
-    for idx, row in df.iterrows():
-        try:
-            # Parse date from column 4
-            date_val = row.iloc[4]
-            if pd.isna(date_val):
-                continue
-            if isinstance(date_val, str):
-                date = datetime.strptime(date_val, '%Y-%m-%d')
-            else:
-                date = pd.to_datetime(date_val).to_pydatetime()
-
-            # Parse confirming markets
-            sum_confirming = int(row.iloc[0]) if not pd.isna(row.iloc[0]) else 0
-            goldilocks = int(row.iloc[5]) if not pd.isna(row.iloc[5]) else 0
-            reflation = int(row.iloc[6]) if not pd.isna(row.iloc[6]) else 0
-            inflation = int(row.iloc[7]) if not pd.isna(row.iloc[7]) else 0
-            deflation = int(row.iloc[8]) if not pd.isna(row.iloc[8]) else 0
-
-            # Parse regimes
-            market_regime = str(row.iloc[9]) if not pd.isna(row.iloc[9]) else "UNKNOWN"
-            risk_regime = str(row.iloc[10]) if not pd.isna(row.iloc[10]) else "UNKNOWN"
-
-            # Parse VAMS for each ticker
-            vams = {}
-            for i, ticker in enumerate(tickers):
-                col_idx = 11 + raw_tickers.index(ticker)
-                val = row.iloc[col_idx]
-                if pd.notna(val):
-                    try:
-                        vams[ticker] = int(val)
-                    except (ValueError, TypeError):
-                        vams[ticker] = 0
-                else:
-                    vams[ticker] = 0
-
-            grid_row = GridDataRow(
-                date=date,
-                sum_confirming_markets=sum_confirming,
-                goldilocks_confirming=goldilocks,
-                reflation_confirming=reflation,
-                inflation_confirming=inflation,
-                deflation_confirming=deflation,
-                market_regime=market_regime.upper(),
-                risk_regime=risk_regime.upper(),
-                vams=vams
-            )
-            rows.append(grid_row)
-
-        except Exception as e:
-            continue  # Skip problematic rows
-
-    # Sort by date
-    rows.sort(key=lambda x: x.date)
-
-    # Generate summary
-    if rows:
-        date_range_days = (rows[-1].date - rows[0].date).days
+    # Stream the first sheet as plain value tuples; header is on row 2.
+    # Only columns 0-80 are used, so cells past them are never materialized.
+    wb = load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        ws = wb.worksheets[0]
+        header = next(ws.iter_rows(min_row=2, max_row=2, max_col=USED_COLUMNS, values_only=True), ())
+
+        # Extract tickers from columns 11-80
+        raw_tickers = list(header[11:81])
+        # Filter to valid ticker symbols (remove empty, unnamed columns)
+        ticker_pos = [i for i, t in enumerate(raw_tickers)
+                      if isinstance(t, str) and not t.startswith('Unnamed')]
+        tickers = [raw_tickers[i] for i in ticker_pos]
+
+        raw_dates = []
+        confirming = []
+        market_regimes = []
+        risk_regimes = []
+        vams_cells = []  # raw columns 11-80 of each parsed row
+        # An explicit max_col also pads short rows with None
+        for row in ws.iter_rows(min_row=3, max_col=USED_COLUMNS, values_only=True):
+            try:
+                # Date from column 4, parsed for all rows after the loop
+                date_val = row[4]
+                if date_val is None:
+                    continue
+
+                # Parse confirming markets: sum, goldilocks, reflation, inflation, deflation
+                counts = tuple(int(row[c]) if row[c] is not None else 0 for c in (0, 5, 6, 7, 8))
+
+                # Parse regimes
+                market_regime = str(row[9]) if row[9] is not None else "UNKNOWN"
+                risk_regime = str(row[10]) if row[10] is not None else "UNKNOWN"
+
+                raw_dates.append(date_val)
+                confirming.append(counts)
+                market_regimes.append(REGIME_CODES.get(market_regime.upper(), REGIME_CODES["UNKNOWN"]))
+                risk_regimes.append(RISK_REGIME_CODES.get(risk_regime.upper(), RISK_REGIME_CODES["UNKNOWN"]))
+                vams_cells.append(row[11:81])
+
+            except Exception as e:
+                continue  # Skip problematic rows
+    finally:
+        wb.close()
+
+    # Cast the VAMS block in one pass; blank and non-numeric cells count as 0
+    if raw_dates and tickers:
+        block = np.array(vams_cells, dtype=object)[:, ticker_pos]
+        values = pd.to_numeric(pd.Series(block.ravel()), errors='coerce')
+        vams = values.fillna(0).to_numpy().astype(np.int8).reshape(block.shape)
+    else:
+        vams = np.zeros((len(raw_dates), len(tickers)), dtype=np.int8)
+
+    # Parse the date column in one pass; rows whose date does not parse are skipped
+    parsed = pd.to_datetime(pd.Series(raw_dates, dtype=object), errors='coerce')
+    date_arr = parsed.to_numpy(dtype='datetime64[D]')
+    valid = np.flatnonzero(~np.isnat(date_arr))
+
+    # Sort by date (stable, so duplicate dates keep sheet order), then keep
+    # the last row of each date
+    order = valid[np.argsort(date_arr[valid], kind='stable')]
+    sorted_dates = date_arr[order]
+    last_of_date = np.ones(len(order), dtype=bool)
+    last_of_date[:-1] = sorted_dates[1:] != sorted_dates[:-1]
+    order = order[last_of_date]
+    grid = GridData(
+        dates=date_arr[order],
+        confirming=np.array(confirming, dtype=np.int16).reshape(-1, 5)[order],
+        market_regime=np.array(market_regimes, dtype=np.int8)[order],
+        risk_regime=np.array(risk_regimes, dtype=np.int8)[order],
+        vams=vams[order],
+        tickers=tickers,
+    )
+
+    return grid, tickers, summarize_grid(grid)
+
+
+def summarize_grid(grid: GridData) -> Dict:
+    """Summary of parsed GRID data for the upload response and /api/data/summary"""
+    n = len(grid)
+    tickers = grid.tickers
+    if n:
+        first, last = grid.dates[0].item(), grid.dates[-1].item()
+        date_range_days = (last - first).days
         years = date_range_days // 365
         weeks = (date_range_days % 365) // 7
         days = (date_range_days % 365) % 7
 
-        regime_counts = {}
-        for r in rows:
-            regime_counts[r.market_regime] = regime_counts.get(r.market_regime, 0) + 1
-
         summary = {
-            "start_date": rows[0].date.strftime("%m/%d/%Y"),
-            "end_date": rows[-1].date.strftime("%m/%d/%Y"),
-            "trading_days": len(rows),
+            "start_date": first.strftime("%m/%d/%Y"),
+            "end_date": last.strftime("%m/%d/%Y"),
+            "trading_days": n,
             "date_range_formatted": f"{years} years, {weeks} weeks, {days} days",
             "tickers": tickers,
             "ticker_count": len(tickers),
-            "regime_breakdown": regime_counts
+            "regime_breakdown": grid.regime_counts(),
+            "risk_regime_breakdown": grid.risk_regime_counts()
         }
     else:
         summary = {"error": "No valid data rows found"}
 
-    return rows, tickers, summary
+    return summary
 
 
-def get_data_preview(rows: List[GridDataRow], n: int = 20) -> List[dict]:
+def _snapshot_path(file_path: str) -> Path:
+    """Snapshot file for the current version (path, mtime, size) of a workbook"""
+    stat = os.stat(file_path)
+    key = f"{os.path.abspath(file_path)}:{stat.st_mtime_ns}:{stat.st_size}"
+    return GRID_CACHE_DIR / f"{hashlib.sha1(key.encode()).hexdigest()}.npz"
+
+
+def parse_42macro_excel_cached(file_path: str) -> Tuple[GridData, List[str], Dict]:
+    """
+    parse_42macro_excel, reusing an .npz snapshot of the parsed columns when
+    the workbook has not changed since it was last parsed.
+    """
+    snapshot = _snapshot_path(file_path)
+    if snapshot.exists():
+        with np.load(snapshot, allow_pickle=False) as snap:
+            grid = GridData(
+                dates=snap["dates"],
+                confirming=snap["confirming"],
+                market_regime=snap["market_regime"],
+                risk_regime=snap["risk_regime"],
+                vams=snap["vams"],
+                tickers=snap["tickers"].tolist(),
+            )
+        return grid, grid.tickers, summarize_grid(grid)
+
+    grid, tickers, summary = parse_42macro_excel(file_path)
+
+    # Write to a temp name first so concurrent workers never load a partial file
+    GRID_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp = snapshot.with_suffix(f".{os.getpid()}.tmp")
+    with open(tmp, "wb") as f:
+        np.savez(
+            f,
+            dates=grid.dates,
+            confirming=grid.confirming,
+            market_regime=grid.market_regime,
+            risk_regime=grid.risk_regime,
+            vams=grid.vams,
+            tickers=np.array(tickers, dtype=str),
+        )
+    os.replace(tmp, snapshot)
+    return grid, tickers, summary
+
+
+def get_data_preview(grid: GridData, n: int = 20) -> List[dict]:
     """Get most recent n rows for preview (most recent first)"""
-    recent = rows[-n:][::-1]  # Last n rows, reversed
+    recent = np.arange(len(grid))[-n:][::-1]  # Last n rows, reversed
+    confirming = grid.confirming[recent].tolist()
+
+    def vams_column(ticker: str) -> List[int]:
+        col = grid.ticker_index.get(ticker)
+        return grid.vams[recent, col].tolist() if col is not None else [0] * len(recent)
+
     preview = []
-    for row in recent:
+    for date, regime, risk_regime, counts, spy, qqq, tlt, gld in zip(
+            grid.dates[recent].tolist(), REGIME_NAMES[grid.market_regime[recent]].tolist(),
+            RISK_REGIME_NAMES[grid.risk_regime[recent]].tolist(), confirming,
+            vams_column("SPY"), vams_column("QQQ"), vams_column("TLT"), vams_column("GLD")):
         preview.append({
-            "date": row.date.strftime("%m/%d/%Y"),
-            "regime": row.market_regime,
-            "risk_regime": row.risk_regime,
-            "sum_confirming": row.sum_confirming_markets,
-            "goldilocks": row.goldilocks_confirming,
-            "reflation": row.reflation_confirming,
-            "inflation": row.inflation_confirming,
-            "deflation": row.deflation_confirming,
-            "spy_vams": row.vams.get("SPY", 0),
-            "qqq_vams": row.vams.get("QQQ", 0),
-            "tlt_vams": row.vams.get("TLT", 0),
-            "gld_vams": row.vams.get("GLD", 0),
+            "date": date.strftime("%m/%d/%Y"),
+            "regime": regime,
+            "risk_regime": risk_regime,
+            "sum_confirming": counts[0],
+            "goldilocks": counts[1],
+            "reflation": counts[2],
+            "inflation": counts[3],
+            "deflation": counts[4],
+            "spy_vams": spy,
+            "qqq_vams": qqq,
+            "tlt_vams": tlt,
+            "gld_vams": gld,
         })
     return preview
 
 
 if __name__ == "__main__":
     # Test the parser
-    rows, tickers, summary = parse_42macro_excel("/sessions/exciting-clever-lamport/mnt/uploads/Macro Regime Outlook (1).xlsx")
+    grid, tickers, summary = parse_42macro_excel("/sessions/exciting-clever-lamport/mnt/uploads/Macro Regime Outlook (1).xlsx")
     print("Summary:", summary)
-    print(f"\nParsed {len(rows)} rows")
-    print(f"Date range: {rows[0].date} to {rows[-1].date}")
-    print(f"\nFirst row VAMS sample: SPY={rows[0].vams.get('SPY')}, QQQ={rows[0].vams.get('QQQ')}")
+    print(f"\nParsed {len(grid)} rows")
+    print(f"Date range: {grid.dates[0]} to {grid.dates[-1]}")
+    print(f"\nFirst row VAMS sample: SPY={grid.vams[0, grid.ticker_index['SPY']]}, QQQ={grid.vams[0, grid.ticker_index['QQQ']]}")
     print(f"\nPreview (recent 5):")
-    for p in get_data_preview(rows, 5):
+    for p in get_data_preview(grid, 5):
         print(p)
@@ -5,7 +5,8 @@ In production, this would use live Yahoo Finance data.
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from functools import lru_cache
+from typing import List, Dict, Optional, Tuple
 
 # Base prices for common ETFs (approximate 2018 starting prices)
 BASE_PRICES = {
@@ -98,12 +99,16 @@ ASSET_TYPES = {
 }
 
 
+# Reverse lookup of ASSET_TYPES; a ticker listed twice keeps its first type
+_TICKER_ASSET = {}
+for _asset_type, _tickers in ASSET_TYPES.items():
+    for _ticker in _tickers:
+        _TICKER_ASSET.setdefault(_ticker, _asset_type)
+
+
 def get_asset_type(ticker: str) -> str:
     """Determine asset type for a ticker"""
-    for asset_type, tickers in ASSET_TYPES.items():
-        if ticker in tickers:
-            return asset_type
-    return "equity"  # Default
+    return _TICKER_ASSET.get(ticker, "equity")  # Default
 
 
 def get_expected_return(ticker: str, regime: str) -> float:
@@ -127,11 +132,56 @@ def get_volatility(ticker: str) -> float:
     return VOLATILITY.get(ticker, VOLATILITY["default"])
 
 
+# Row of each regime in expected-return matrices
+_REGIME_ROWS = {regime: i for i, regime in enumerate(REGIME_RETURNS)}
+
+
+def expected_return_matrix(tickers: List[str]) -> np.ndarray:
+    """Annual expected return per (regime, ticker), regimes in REGIME_RETURNS order"""
+    return np.array([[get_expected_return(t, regime) for t in tickers]
+                     for regime in REGIME_RETURNS]).reshape(len(REGIME_RETURNS), len(tickers))
+
+
+@lru_cache(maxsize=32)
+def _cached_expected_return_matrix(tickers: Tuple[str, ...]) -> np.ndarray:
+    """expected_return_matrix shared across providers; read-only since it is shared"""
+    matrix = expected_return_matrix(list(tickers))
+    matrix.setflags(write=False)
+    return matrix
+
+
+class RegimeSchedule:
+    """Regime timeline as sorted start dates, for vectorized date -> regime lookups"""
+
+    def __init__(self, regime_data: Dict[datetime, str]):
+        starts = sorted(regime_data.keys())
+        self.boundaries = np.array(starts, dtype='datetime64[ns]')
+        self.names = [regime_data[d] for d in starts]
+
+        # Expected-return row per entry, plus a trailing GOLDILOCKS row that
+        # index -1 (dates before the first entry) picks up. Unknown regimes
+        # fall back to GOLDILOCKS like get_expected_return does.
+        default = _REGIME_ROWS["GOLDILOCKS"]
+        self._rows = np.array([_REGIME_ROWS.get(name, default) for name in self.names] + [default],
+                              dtype=np.intp)
+
+    def indices(self, dates: pd.DatetimeIndex) -> np.ndarray:
+        """Index into names of the regime in force on each date, -1 before the first"""
+        return np.searchsorted(self.boundaries, dates.values, side='right') - 1
+
+    def regime_rows(self, dates: pd.DatetimeIndex) -> np.ndarray:
+        """expected_return_matrix row of the regime in force on each date"""
+        return self._rows[self.indices(dates)]
+
+
 def generate_synthetic_prices(
     tickers: List[str],
     start_date: datetime,
     end_date: datetime,
-    regime_data: Dict[datetime, str]
+    regime_data: Dict[datetime, str],
+    schedule: Optional[RegimeSchedule] = None,
+    rng: Optional[np.random.Generator] = None,
+    expected_returns: Optional[np.ndarray] = None
 ) -> pd.DataFrame:
     """
     Generate synthetic but realistic price data based on regime.
@@ -141,58 +191,54 @@ def generate_synthetic_prices(
         start_date: Start date
         end_date: End date
         regime_data: Dict mapping date to regime name
+        schedule: regime_data already sorted into a RegimeSchedule, if available
+        rng: Random generator for the daily shocks (fresh unseeded one if omitted)
+        expected_returns: expected_return_matrix(tickers), if already built
 
     Returns:
         DataFrame with date index and ticker columns
     """
     # Generate date range (business days only)
     dates = pd.date_range(start=start_date, end=end_date, freq='B')
-
-    # Initialize with base prices
-    price_data = {}
-
-    for ticker in tickers:
-        base_price = BASE_PRICES.get(ticker, 50.0)
-        vol = get_volatility(ticker)
-        daily_vol = vol / np.sqrt(252)
-
-        prices = [base_price]
-        current_price = base_price
-
-        for i in range(1, len(dates)):
-            date = dates[i].to_pydatetime()
-
-            # Get regime for this date (find closest)
-            regime = "GOLDILOCKS"  # Default
-            for d in sorted(regime_data.keys(), reverse=True):
-                if d <= date:
-                    regime = regime_data[d]
-                    break
-
-            # Get expected daily return
-            annual_return = get_expected_return(ticker, regime)
-            daily_return = annual_return / 252
-
-            # Add random component
-            random_return = np.random.normal(daily_return, daily_vol)
-
-            # Apply return
-            current_price = current_price * (1 + random_return)
-            current_price = max(current_price, 0.01)  # Floor at $0.01
-
-            prices.append(current_price)
-
-        price_data[ticker] = prices
-
-    df = pd.DataFrame(price_data, index=dates)
-    return df
+    n_days, n_tickers = len(dates), len(tickers)
+
+    # Regime in force on each date: the latest regime date on or before it
+    if schedule is None:
+        schedule = RegimeSchedule(regime_data)
+    regime_rows = schedule.regime_rows(dates)
+
+    # Expected daily return per (regime, ticker) and daily vol per ticker
+    if expected_returns is None:
+        expected_returns = expected_return_matrix(tickers)
+    # Synthetic prices only carry a few significant digits, so the whole
+    # pipeline runs in float32; the engine widens to float64 when it reads them.
+    mu = (expected_returns / 252).astype(np.float32)
+    daily_vol = (np.array([get_volatility(t) for t in tickers]) / np.sqrt(252)).astype(np.float32)
+    base_prices = np.array([BASE_PRICES.get(t, 50.0) for t in tickers], dtype=np.float32)
+
+    # Day 0 is the base price; every later day compounds one random return.
+    # Everything after the draw happens in place in this one buffer, which is
+    # column-major so each ticker's series (and the cumprod over it) is contiguous.
+    prices = np.ones((n_days, n_tickers), dtype=np.float32, order='F')
+    if n_days > 1:
+        if rng is None:
+            rng = np.random.default_rng()
+        z = rng.standard_normal((n_days - 1, n_tickers), dtype=np.float32)
+        prices[1:] += mu[regime_rows[1:]] + daily_vol * z
+    np.cumprod(prices, axis=0, out=prices)
+    prices *= base_prices
+    np.maximum(prices, np.float32(0.01), out=prices)  # Floor at $0.01
+
+    return pd.DataFrame(prices, index=dates, columns=tickers, copy=False)
 
 
 class PriceDataProvider:
     """Provides price data, using synthetic data as fallback"""
 
-    def __init__(self, regime_timeline: Dict[datetime, str]):
+    def __init__(self, regime_timeline: Dict[datetime, str], seed: Optional[int] = None):
         self.regime_timeline = regime_timeline
+        self._regime_schedule = RegimeSchedule(regime_timeline)
+        self.rng = np.random.default_rng(seed)
         self.price_cache: Optional[pd.DataFrame] = None
 
     def get_prices(
@@ -209,7 +255,9 @@ class PriceDataProvider:
         if use_synthetic:
             print(f"Generating synthetic price data for {len(tickers)} tickers...")
             self.price_cache = generate_synthetic_prices(
-                tickers, start_date, end_date, self.regime_timeline
+                tickers, start_date, end_date, self.regime_timeline,
+                schedule=self._regime_schedule, rng=self.rng,
+                expected_returns=_cached_expected_return_matrix(tuple(tickers))
             )
             return self.price_cache
 
@@ -229,11 +277,12 @@ class PriceDataProvider:
                 raise ValueError("No data returned from yfinance")
 
             if len(tickers) > 1:
-                self.price_cache = data['Adj Close']
+                prices = data['Adj Close']
             else:
-                self.price_cache = data['Adj Close'].to_frame()
-                self.price_cache.columns = tickers
+                prices = data['Adj Close'].to_frame()
+                prices.columns = tickers
 
+            self.price_cache = prices
             return self.price_cache
 
         except Exception as e:
@@ -241,20 +290,18 @@ class PriceDataProvider:
             return self.get_prices(tickers, start_date, end_date, use_synthetic=True)
 
     def get_price(self, ticker: str, date: datetime) -> Optional[float]:
-        """Get price for a single ticker on a date"""
+        """
+        Get price for a single ticker on a date (last price on or before it).
+        Backtests read prices from the engine's own matrix; this is for one-off lookups.
+        """
         if self.price_cache is None or ticker not in self.price_cache.columns:
             return None
 
-        try:
-            idx = self.price_cache.index.get_indexer([date], method='ffill')[0]
-            if idx >= 0:
-                price = self.price_cache.iloc[idx][ticker]
-                if pd.notna(price):
-                    return float(price)
-        except:
-            pass
-
-        return None
+        idx = self.price_cache.index.get_indexer([date], method='ffill')[0]
+        if idx < 0:
+            return None
+        price = self.price_cache[ticker].iat[idx]
+        return float(price) if pd.notna(price) else None
 
 
 if __name__ == "__main__":
@@ -4,12 +4,41 @@ Oak Bridge Financial Ranking Algorithm Implementation.
 Calculates individual sub-scores, aggregate scores, and rankings for funds.
 All formulas are implemented EXACTLY as specified in the requirements.
 """
-from typing import Dict, List, Optional
+from typing import List, Optional
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import func, select, update
+from sqlalchemy.orm import Session
+
+from ranking_models import Fund, FundCategory, FundScore
 
 
 # Parent categories that count as "equity" for price score calculation
 EQUITY_PARENT_CATEGORIES = {"US Equity", "International Equity"}
 
+# Sub-scores built from a 3yr/5yr metric pair, with each _calc_* formula
+# expanded to (intercept, 3yr weight, 5yr weight) for funds with 5+ years of
+# history and (intercept, 3yr weight) for younger funds. The first
+# RISK_PAIR_COUNT rows are the risk sub-scores; treynor takes abs() afterwards.
+PAIRED_SUB_SCORES = (
+    ('beta_score', 'beta_3yr', 'beta_5yr', (140.0, -46.9, -23.1), (70.0, -70.0)),
+    ('r_squared_score', 'r_squared_3yr', 'r_squared_5yr', (0.0, 0.335, 0.165), (0.0, 0.5)),
+    ('up_capture_score', 'up_capture_3yr', 'up_capture_5yr', (-3367.0, 67.0, 3300.0), (-100.0, 100.0)),
+    ('down_capture_score', 'down_capture_3yr', 'down_capture_5yr', (100.0, -67.0, -33.0), (100.0, -100.0)),
+    ('sharpe_score', 'sharpe_ratio_3yr', 'sharpe_ratio_5yr', (0.0, 25.0, 12.5), (0.0, 37.5)),
+    ('tracking_error_score', 'tracking_error_3yr', 'tracking_error_5yr', (100.0, -0.335, -0.165), (50.0, -0.5)),
+    ('sortino_score', 'sortino_ratio_3yr', 'sortino_ratio_5yr', (0.0, 670.0, 330.0), (0.0, 100.0)),
+    ('treynor_score', 'treynor_ratio_3yr', 'treynor_ratio_5yr', (0.0, 268.0, 132.0), (0.0, 400.0)),
+    ('info_ratio_score', 'information_ratio_3yr', 'information_ratio_5yr', (0.0, 201.0, 99.0), (0.0, 300.0)),
+    ('kurtosis_score', 'kurtosis_3yr', 'kurtosis_5yr', (0.0, 0.66, 0.34), (0.0, 1.0)),
+    ('drawdown_score', 'max_drawdown_3yr', 'max_drawdown_5yr', (50.0, -4.95, -2.55), (33.0, -4.95)),
+    ('skewness_score', 'skewness_3yr', 'skewness_5yr', (0.0, 33.0, 17.0), (0.0, 0.5)),
+    ('alpha_score', 'alpha_3yr', 'alpha_5yr', (0.0, 3.0, 1.5), (0.0, 4.5)),
+)
+RISK_PAIR_COUNT = 12
+TREYNOR_PAIR = 7
+
 
 class RankingCalculator:
     """
@@ -325,35 +354,150 @@ class RankingCalculator:
 
         return scores
 
-    def rank_funds(self, funds_with_scores: List[dict]) -> List[dict]:
+    def calculate_all_scores_batch(self, funds: List[dict]) -> List[dict]:
         """
-        Assign global_rank and category_rank.
-        Sort by total_gpa_score descending.
+        calculate_all_scores for many funds at once, through score_frame.
+        Returns one score dict per fund, in input order.
+        """
+        if not funds:
+            return []
+
+        scores = self.score_frame(pd.DataFrame.from_records(funds))
+        keys = list(scores.columns)
+        columns = [scores[k].tolist() for k in keys]
+        return [dict(zip(keys, values)) for values in zip(*columns)]
+
+    def score_frame(self, frame: pd.DataFrame) -> pd.DataFrame:
         """
-        # Global ranking
-        sorted_global = sorted(
-            funds_with_scores,
-            key=lambda f: f.get('total_gpa_score', 0) or 0,
-            reverse=True
+        All score columns for a frame with one fund per row.
+        Each formula runs over whole columns; history-length branches become
+        np.where selects. The result shares the index of frame.
+        """
+        n = len(frame)
+
+        # Each numeric field is coerced a whole column at a time, with missing
+        # and non-numeric values counting as 0 like _safe_float
+        def col(name: str) -> np.ndarray:
+            if name not in frame:
+                return np.zeros(n)
+            return pd.to_numeric(frame[name], errors='coerce').fillna(0.0).to_numpy(dtype=np.float64)
+
+        fund_age = col('fund_age_years')
+        has_5yr = fund_age >= 5
+        has_10yr = fund_age >= 10
+        has_3yr = fund_age >= 3
+        if 'parent_category' in frame:
+            is_equity = frame['parent_category'].isin(EQUITY_PARENT_CATEGORIES).to_numpy()
+        else:
+            is_equity = np.zeros(n, dtype=bool)
+
+        scores = {}
+
+        # Every 3yr/5yr pair sub-score is affine in its two inputs, so all of
+        # them come out of one (funds x pairs) pass over the coefficient table
+        pairs = PAIRED_SUB_SCORES
+        x_3yr = np.column_stack([col(p[1]) for p in pairs])
+        x_5yr = np.column_stack([col(p[2]) for p in pairs])
+        long_c = np.array([p[3] for p in pairs]).T   # (3, pairs)
+        short_c = np.array([p[4] for p in pairs]).T  # (2, pairs)
+        paired = np.where(
+            has_5yr[:, None],
+            long_c[0] + x_3yr * long_c[1] + x_5yr * long_c[2],
+            short_c[0] + x_3yr * short_c[1])
+        paired[:, TREYNOR_PAIR] = np.abs(paired[:, TREYNOR_PAIR])
+        for k, p in enumerate(pairs[:RISK_PAIR_COUNT]):
+            scores[p[0]] = paired[:, k]
+
+        scores['risk_score'] = paired[:, :RISK_PAIR_COUNT].sum(axis=1) / 100
+
+        # Return sub-scores
+        scores['alpha_score'] = paired[:, RISK_PAIR_COUNT]
+        scores['yield_score'] = (col('yield_pct') * 100) * 6
+
+        return_qtd, return_ytd = col('return_qtd'), col('return_ytd')
+        excess_1yr = col('return_1yr') - col('bm_return_1yr')
+        excess_3yr = col('return_3yr') - col('bm_return_3yr')
+        excess_5yr = col('return_5yr') - col('bm_return_5yr')
+        excess_10yr = col('return_10yr') - col('bm_return_10yr')
+        batting_component = (col('batting_avg_3yr') + col('batting_avg_5yr')) / 3
+        scores['relative_return_score'] = np.select(
+            [has_10yr, has_5yr, has_3yr],
+            [
+                excess_10yr + (excess_5yr * 2) + (excess_3yr * 2.5) + (excess_1yr * 1.5) +
+                (return_qtd * 1.5) + (return_ytd * 2) + batting_component,
+                (excess_5yr * 3) + (excess_3yr * 2.5) + (excess_1yr * 1.5) +
+                (return_qtd * 1.5) + (return_ytd * 2) + batting_component,
+                ((excess_3yr + excess_1yr) / 2) * 4.5 + (excess_3yr * 1.5) + (excess_1yr * 1.5) +
+                (return_qtd * 1.5) + (return_ytd * 2) + batting_component,
+            ],
+            (excess_1yr * 3.5) + (return_qtd * 1.5) + (return_ytd * 2) + batting_component)
+
+        pe_score = ((20 - col('pe_ratio')) / 20) * 100
+        pb_score = ((3 - col('pb_ratio')) * 10 / 3) * 10
+        scores['price_score'] = np.where(is_equity, pe_score + pb_score, 0.0)
+
+        scores['fee_score'] = (1 - (col('net_expense_ratio') * 100)) * 10 / 2
+
+        scores['return_score'] = (
+            scores['alpha_score'] + scores['yield_score'] +
+            scores['relative_return_score'] + scores['price_score'] +
+            scores['fee_score']
+        ) / 30
+
+        scores['total_rr_score'] = scores['risk_score'] + scores['return_score']
+
+        # Adjustment scores
+        scores['market_cap_score'] = col('market_cap') / 1200
+        turnover = col('turnover')
+        scores['turnover_score'] = np.where(turnover <= 0.50, 0.0, turnover / (-4))
+
+        scores['total_gpa_score'] = (
+            (scores['risk_score'] + scores['return_score']) / 2 +
+            scores['market_cap_score'] + scores['turnover_score']
         )
-        for i, fund in enumerate(sorted_global):
-            fund['global_rank'] = i + 1
-
-        # Category ranking
-        by_category = {}
-        for fund in funds_with_scores:
-            cat = fund.get('category_id')
-            if cat not in by_category:
-                by_category[cat] = []
-            by_category[cat].append(fund)
-
-        for cat_funds in by_category.values():
-            sorted_cat = sorted(
-                cat_funds,
-                key=lambda f: f.get('total_gpa_score', 0) or 0,
-                reverse=True
-            )
-            for i, fund in enumerate(sorted_cat):
-                fund['category_rank'] = i + 1
 
-        return funds_with_scores
+        return pd.DataFrame(scores, index=frame.index)
+
+
+def score_all_funds(session: Session) -> pd.DataFrame:
+    """
+    Score every fund in one pass: a single query loads all funds with their
+    parent category, and the formulas run as column operations.
+    Returns one row per fund with fund_id, category_id and every score column;
+    ranks are assigned in the database by rank_stored_scores.
+    """
+    query = (
+        select(Fund.__table__, FundCategory.parent_category)
+        .outerjoin(FundCategory, Fund.category_id == FundCategory.id)
+        .order_by(Fund.id)
+    )
+    funds = pd.read_sql(query, session.connection())
+
+    scores = RankingCalculator().score_frame(funds)
+    scores.insert(0, 'fund_id', funds['id'])
+    scores.insert(1, 'category_id', funds['category_id'])
+    return scores
+
+
+def rank_stored_scores(session: Session):
+    """
+    Set global_rank and category_rank on every fund_scores row in one UPDATE,
+    using window functions: highest GPA first, missing scores count as 0,
+    ties go to the lower fund id.
+    """
+    order = (func.coalesce(FundScore.total_gpa_score, 0).desc(), FundScore.fund_id)
+    ranked = (
+        select(
+            FundScore.id,
+            func.row_number().over(order_by=order).label('global_rank'),
+            func.row_number().over(partition_by=Fund.category_id, order_by=order).label('category_rank'),
+        )
+        .join(Fund, Fund.id == FundScore.fund_id)
+        .subquery()
+    )
+    session.execute(
+        update(FundScore)
+        .where(FundScore.id == ranked.c.id)
+        .values(global_rank=ranked.c.global_rank, category_rank=ranked.c.category_rank)
+        .execution_options(synchronize_session=False)
+    )
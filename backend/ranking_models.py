@@ -1,12 +1,15 @@
 """
 SQLAlchemy models for the Rankings feature.
 Tables: fund_categories, funds, fund_scores
+
+Metric columns keep their NUMERIC(p, s) storage but load as Python floats
+(asdecimal=False), so scoring reads them without Decimal conversions.
 """
 from sqlalchemy import (
-    Column, Integer, String, Numeric, Date, DateTime, ForeignKey, func
+    Column, Integer, String, Numeric, Date, DateTime, ForeignKey, Index, func
 )
 from sqlalchemy.orm import relationship
-from database import Base
+from database import Base, IS_SQLITE
 
 
 class FundCategory(Base):
@@ -31,63 +34,63 @@ class Fund(Base):
 
     # Age / availability
     inception_date = Column(Date, nullable=True)
-    fund_age_years = Column(Numeric(5, 2))
+    fund_age_years = Column(Numeric(5, 2, asdecimal=False))
 
     # Fund characteristics
-    net_expense_ratio = Column(Numeric(6, 4))
-    turnover = Column(Numeric(6, 4))
-    market_cap = Column(Numeric(12, 2))
-    yield_pct = Column(Numeric(6, 4))
-    pe_ratio = Column(Numeric(8, 2))
-    pb_ratio = Column(Numeric(8, 2))
+    net_expense_ratio = Column(Numeric(6, 4, asdecimal=False))
+    turnover = Column(Numeric(6, 4, asdecimal=False))
+    market_cap = Column(Numeric(12, 2, asdecimal=False))
+    yield_pct = Column(Numeric(6, 4, asdecimal=False))
+    pe_ratio = Column(Numeric(8, 2, asdecimal=False))
+    pb_ratio = Column(Numeric(8, 2, asdecimal=False))
 
     # 3-Year Risk Metrics
-    beta_3yr = Column(Numeric(8, 4))
-    r_squared_3yr = Column(Numeric(8, 4))
-    up_capture_3yr = Column(Numeric(8, 4))
-    down_capture_3yr = Column(Numeric(8, 4))
-    sharpe_ratio_3yr = Column(Numeric(8, 4))
-    tracking_error_3yr = Column(Numeric(8, 4))
-    sortino_ratio_3yr = Column(Numeric(8, 4))
-    treynor_ratio_3yr = Column(Numeric(8, 4))
-    information_ratio_3yr = Column(Numeric(8, 4))
-    kurtosis_3yr = Column(Numeric(8, 4))
-    max_drawdown_3yr = Column(Numeric(8, 4))
-    skewness_3yr = Column(Numeric(8, 4))
-    alpha_3yr = Column(Numeric(8, 4))
+    beta_3yr = Column(Numeric(8, 4, asdecimal=False))
+    r_squared_3yr = Column(Numeric(8, 4, asdecimal=False))
+    up_capture_3yr = Column(Numeric(8, 4, asdecimal=False))
+    down_capture_3yr = Column(Numeric(8, 4, asdecimal=False))
+    sharpe_ratio_3yr = Column(Numeric(8, 4, asdecimal=False))
+    tracking_error_3yr = Column(Numeric(8, 4, asdecimal=False))
+    sortino_ratio_3yr = Column(Numeric(8, 4, asdecimal=False))
+    treynor_ratio_3yr = Column(Numeric(8, 4, asdecimal=False))
+    information_ratio_3yr = Column(Numeric(8, 4, asdecimal=False))
+    kurtosis_3yr = Column(Numeric(8, 4, asdecimal=False))
+    max_drawdown_3yr = Column(Numeric(8, 4, asdecimal=False))
+    skewness_3yr = Column(Numeric(8, 4, asdecimal=False))
+    alpha_3yr = Column(Numeric(8, 4, asdecimal=False))
 
     # 5-Year Risk Metrics
-    beta_5yr = Column(Numeric(8, 4))
-    r_squared_5yr = Column(Numeric(8, 4))
-    up_capture_5yr = Column(Numeric(8, 4))
-    down_capture_5yr = Column(Numeric(8, 4))
-    sharpe_ratio_5yr = Column(Numeric(8, 4))
-    tracking_error_5yr = Column(Numeric(8, 4))
-    sortino_ratio_5yr = Column(Numeric(8, 4))
-    treynor_ratio_5yr = Column(Numeric(8, 4))
-    information_ratio_5yr = Column(Numeric(8, 4))
-    kurtosis_5yr = Column(Numeric(8, 4))
-    max_drawdown_5yr = Column(Numeric(8, 4))
-    skewness_5yr = Column(Numeric(8, 4))
-    alpha_5yr = Column(Numeric(8, 4))
+    beta_5yr = Column(Numeric(8, 4, asdecimal=False))
+    r_squared_5yr = Column(Numeric(8, 4, asdecimal=False))
+    up_capture_5yr = Column(Numeric(8, 4, asdecimal=False))
+    down_capture_5yr = Column(Numeric(8, 4, asdecimal=False))
+    sharpe_ratio_5yr = Column(Numeric(8, 4, asdecimal=False))
+    tracking_error_5yr = Column(Numeric(8, 4, asdecimal=False))
+    sortino_ratio_5yr = Column(Numeric(8, 4, asdecimal=False))
+    treynor_ratio_5yr = Column(Numeric(8, 4, asdecimal=False))
+    information_ratio_5yr = Column(Numeric(8, 4, asdecimal=False))
+    kurtosis_5yr = Column(Numeric(8, 4, asdecimal=False))
+    max_drawdown_5yr = Column(Numeric(8, 4, asdecimal=False))
+    skewness_5yr = Column(Numeric(8, 4, asdecimal=False))
+    alpha_5yr = Column(Numeric(8, 4, asdecimal=False))
 
     # Return Data
-    return_qtd = Column(Numeric(8, 4))
-    return_ytd = Column(Numeric(8, 4))
-    return_1yr = Column(Numeric(8, 4))
-    return_3yr = Column(Numeric(8, 4))
-    return_5yr = Column(Numeric(8, 4))
-    return_10yr = Column(Numeric(8, 4))
+    return_qtd = Column(Numeric(8, 4, asdecimal=False))
+    return_ytd = Column(Numeric(8, 4, asdecimal=False))
+    return_1yr = Column(Numeric(8, 4, asdecimal=False))
+    return_3yr = Column(Numeric(8, 4, asdecimal=False))
+    return_5yr = Column(Numeric(8, 4, asdecimal=False))
+    return_10yr = Column(Numeric(8, 4, asdecimal=False))
 
     # Benchmark Return Data
-    bm_return_1yr = Column(Numeric(8, 4))
-    bm_return_3yr = Column(Numeric(8, 4))
-    bm_return_5yr = Column(Numeric(8, 4))
-    bm_return_10yr = Column(Numeric(8, 4))
+    bm_return_1yr = Column(Numeric(8, 4, asdecimal=False))
+    bm_return_3yr = Column(Numeric(8, 4, asdecimal=False))
+    bm_return_5yr = Column(Numeric(8, 4, asdecimal=False))
+    bm_return_10yr = Column(Numeric(8, 4, asdecimal=False))
 
     # Batting Average
-    batting_avg_3yr = Column(Numeric(6, 4))
-    batting_avg_5yr = Column(Numeric(6, 4))
+    batting_avg_3yr = Column(Numeric(6, 4, asdecimal=False))
+    batting_avg_5yr = Column(Numeric(6, 4, asdecimal=False))
 
     # Metadata
     data_as_of_date = Column(Date, nullable=True)
@@ -99,6 +102,23 @@ class Fund(Base):
     scores = relationship("FundScore", back_populates="fund", uselist=False,
                           cascade="all, delete-orphan")
 
+    # Category-filtered listings walk funds by category in id order
+    __table_args__ = (Index("ix_funds_category_id_id", "category_id", "id"),)
+
+
+def trigram_indexes():
+    """
+    GIN trigram indexes for the substring ILIKE fund search. PostgreSQL only,
+    and only once the pg_trgm extension is enabled, so init_db adds them.
+    """
+    funds = Fund.__table__
+    return (
+        Index("ix_funds_ticker_trgm", funds.c.ticker, postgresql_using="gin",
+              postgresql_ops={"ticker": "gin_trgm_ops"}),
+        Index("ix_funds_name_trgm", funds.c.name, postgresql_using="gin",
+              postgresql_ops={"name": "gin_trgm_ops"}),
+    )
+
 
 class FundScore(Base):
     __tablename__ = "fund_scores"
@@ -107,47 +127,55 @@ class FundScore(Base):
     fund_id = Column(Integer, ForeignKey("funds.id", ondelete="CASCADE"), unique=True)
 
     # Individual Risk Sub-Scores
-    beta_score = Column(Numeric(10, 4))
-    r_squared_score = Column(Numeric(10, 4))
-    up_capture_score = Column(Numeric(10, 4))
-    down_capture_score = Column(Numeric(10, 4))
-    sharpe_score = Column(Numeric(10, 4))
-    tracking_error_score = Column(Numeric(10, 4))
-    sortino_score = Column(Numeric(10, 4))
-    treynor_score = Column(Numeric(10, 4))
-    info_ratio_score = Column(Numeric(10, 4))
-    kurtosis_score = Column(Numeric(10, 4))
-    drawdown_score = Column(Numeric(10, 4))
-    skewness_score = Column(Numeric(10, 4))
+    beta_score = Column(Numeric(10, 4, asdecimal=False))
+    r_squared_score = Column(Numeric(10, 4, asdecimal=False))
+    up_capture_score = Column(Numeric(10, 4, asdecimal=False))
+    down_capture_score = Column(Numeric(10, 4, asdecimal=False))
+    sharpe_score = Column(Numeric(10, 4, asdecimal=False))
+    tracking_error_score = Column(Numeric(10, 4, asdecimal=False))
+    sortino_score = Column(Numeric(10, 4, asdecimal=False))
+    treynor_score = Column(Numeric(10, 4, asdecimal=False))
+    info_ratio_score = Column(Numeric(10, 4, asdecimal=False))
+    kurtosis_score = Column(Numeric(10, 4, asdecimal=False))
+    drawdown_score = Column(Numeric(10, 4, asdecimal=False))
+    skewness_score = Column(Numeric(10, 4, asdecimal=False))
 
     # Aggregated Risk Score
-    risk_score = Column(Numeric(10, 4))
+    risk_score = Column(Numeric(10, 4, asdecimal=False))
 
     # Individual Return Sub-Scores
-    alpha_score = Column(Numeric(10, 4))
-    yield_score = Column(Numeric(10, 4))
-    relative_return_score = Column(Numeric(10, 4))
-    price_score = Column(Numeric(10, 4))
-    fee_score = Column(Numeric(10, 4))
+    alpha_score = Column(Numeric(10, 4, asdecimal=False))
+    yield_score = Column(Numeric(10, 4, asdecimal=False))
+    relative_return_score = Column(Numeric(10, 4, asdecimal=False))
+    price_score = Column(Numeric(10, 4, asdecimal=False))
+    fee_score = Column(Numeric(10, 4, asdecimal=False))
 
     # Aggregated Return Score
-    return_score = Column(Numeric(10, 4))
+    return_score = Column(Numeric(10, 4, asdecimal=False))
 
     # Total RR Score
-    total_rr_score = Column(Numeric(10, 4))
+    total_rr_score = Column(Numeric(10, 4, asdecimal=False))
 
     # Adjustment Scores
-    market_cap_score = Column(Numeric(10, 4))
-    turnover_score = Column(Numeric(10, 4))
+    market_cap_score = Column(Numeric(10, 4, asdecimal=False))
+    turnover_score = Column(Numeric(10, 4, asdecimal=False))
 
     # Final GPA Score
-    total_gpa_score = Column(Numeric(10, 4))
+    total_gpa_score = Column(Numeric(10, 4, asdecimal=False))
 
-    # Rankings
-    category_rank = Column(Integer)
-    global_rank = Column(Integer)
+    # Rankings, filled in for every row whenever scores are written
+    category_rank = Column(Integer, nullable=False, server_default="0")
+    global_rank = Column(Integer, nullable=False, server_default="0")
 
     calculated_at = Column(DateTime, server_default=func.now())
 
     # Relationship
     fund = relationship("Fund", back_populates="scores")
+
+    # /scores pages by GPA descending with unscored funds last, so the top-N
+    # page is an index scan instead of a sort. SQLite cannot say NULLS LAST
+    # in an index; there a plain descending index is the closest match.
+    __table_args__ = (
+        Index("ix_fund_scores_total_gpa_desc",
+              total_gpa_score.desc() if IS_SQLITE else total_gpa_score.desc().nulls_last()),
+    )
@@ -201,6 +201,7 @@ class RankingsResponse(BaseModel):
     limit: int
     category: Optional[str] = None
     data_as_of: Optional[date] = None
+    next_cursor: Optional[str] = None
 
 
 class CategorySummaryOut(BaseModel):
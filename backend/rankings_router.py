@@ -3,82 +3,286 @@ API router for the Rankings feature.
 Handles fund CRUD, uploads, ranking calculations, and exports.
 """
 import io
+import os
+import re
+import time
+import hashlib
+import base64
 import csv
+import itertools
+import operator
 import uuid
 import tempfile
+import threading
+from collections import OrderedDict
 from datetime import date, datetime
-from typing import Optional, List
-
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Query
-from fastapi.responses import StreamingResponse
-from sqlalchemy.orm import Session
-from sqlalchemy import func, desc, asc
-
-from database import get_db
+from typing import Dict, Optional, List, Tuple
+
+import orjson
+import pandas as pd
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request, UploadFile, File, Query
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
+from sqlalchemy.orm import Session, contains_eager
+from sqlalchemy import and_, or_, select, func, desc, asc
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+from database import engine, get_db, ScopedSession, IS_SQLITE
 from ranking_models import Fund, FundCategory, FundScore
 from ranking_schemas import (
     CategoryOut, FundCreate, FundUpdate, FundOut, FundWithScores,
-    FundDetailOut, ScoreOut, RankedFundOut, RankingsResponse,
+    FundDetailOut, RankedFundOut, RankingsResponse,
     CategorySummaryOut, UploadSummary, RecalculateResponse
 )
-from ranking_calculator import RankingCalculator
+from ranking_calculator import rank_stored_scores, score_all_funds
 
 router = APIRouter(prefix="/api/rankings", tags=["rankings"])
-calculator = RankingCalculator()
 
 
 # =====================================================================
 # HELPER FUNCTIONS
 # =====================================================================
 
-def _fund_to_calc_dict(fund: Fund, parent_category: Optional[str] = None) -> dict:
-    """Convert a Fund ORM object to a dict for the calculator."""
-    d = {}
-    for col in Fund.__table__.columns:
-        val = getattr(fund, col.name, None)
-        d[col.name] = float(val) if val is not None and col.name not in (
-            'id', 'ticker', 'name', 'fund_type', 'category_id',
-            'inception_date', 'data_as_of_date', 'created_at', 'updated_at'
-        ) else val
-    d['parent_category'] = parent_category
-    return d
+# Numeric columns served in fund and score payloads
+_FUND_FLOAT_COLS = (
+    'fund_age_years', 'net_expense_ratio', 'turnover', 'market_cap',
+    'yield_pct', 'pe_ratio', 'pb_ratio',
+)
+_SCORE_COLS = tuple(
+    col.name for col in FundScore.__table__.columns
+    if col.name not in ('id', 'fund_id', 'calculated_at', 'category_rank', 'global_rank')
+)
+
+# Score fields repeated at the top level of each /scores row
+_HEADLINE_SCORE_FIELDS = (
+    'total_gpa_score', 'risk_score', 'return_score', 'total_rr_score',
+    'category_rank', 'global_rank',
+)
+_NO_HEADLINE_SCORES = dict.fromkeys(_HEADLINE_SCORE_FIELDS)
+
+
+def _attr_reader(names: Tuple[str, ...]):
+    """
+    Function returning the named attributes of an object as a dict, with the
+    getter resolved once. Numeric columns already load as floats
+    (asdecimal=False) and NULL as None, so no per-value conversion is needed.
+    """
+    get = operator.attrgetter(*names)
+    return lambda obj: dict(zip(names, get(obj)))
+
+
+_fund_values = _attr_reader(_FUND_FLOAT_COLS)
+_score_values = _attr_reader(_SCORE_COLS)
+
+
+def _score_dict(scores: FundScore) -> dict:
+    """Every score column as a float, plus the integer ranks."""
+    return {
+        **_score_values(scores),
+        "category_rank": scores.category_rank,
+        "global_rank": scores.global_rank,
+    }
+
+
+def _encode_cursor(value, fund_id: int, position: int) -> str:
+    """
+    Opaque keyset cursor pointing just past the row (value, fund_id), which
+    is the position-th row of the listing.
+    """
+    return base64.urlsafe_b64encode(orjson.dumps([value, fund_id, position])).decode()
+
+
+def _decode_cursor(cursor: str):
+    """(value, fund_id, position) of a cursor from _encode_cursor"""
+    try:
+        value, fund_id, position = orjson.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return value, int(fund_id), int(position)
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def _after_cursor(sort_col, ascending: bool, value, fund_id: int):
+    """
+    Rows strictly after (value, fund_id) in (sort_col NULLS LAST, Fund.id) order.
+    Spelled out instead of a row-value comparison so NULL sort values page too.
+    """
+    id_after = Fund.id > fund_id if ascending else Fund.id < fund_id
+    if value is None:
+        return and_(sort_col.is_(None), id_after)
+    beyond = sort_col > value if ascending else sort_col < value
+    return or_(beyond, and_(sort_col == value, id_after), sort_col.is_(None))
+
+
+def _search_filter(search: str):
+    """
+    Fund filter for a search box term: a substring of ticker or name. On
+    PostgreSQL the trigram indexes serve it for terms of 3+ characters.
+    """
+    search_term = f"%{search}%"
+    return Fund.ticker.ilike(search_term) | Fund.name.ilike(search_term)
+
+
+ARROW_STREAM_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+
+
+def _wants_arrow(request: Request, format: Optional[str]) -> bool:
+    """Arrow is opt-in via ?format=arrow or an Accept header; JSON stays the default"""
+    return format == "arrow" or ARROW_STREAM_MEDIA_TYPE in request.headers.get("accept", "")
+
+
+def _fund_columns(records: List[dict]) -> Dict[str, list]:
+    """Column lists for fund records, with the nested scores dict inlined"""
+    names = [k for k in records[0] if k != "scores"] if records else []
+    names += [c for c in (*_SCORE_COLS, "category_rank", "global_rank") if c not in names]
+    return {
+        name: [r[name] if name in r else (r["scores"] or {}).get(name) for r in records]
+        for name in names
+    }
+
+
+def _arrow_response(columns: Dict[str, list], metadata: Optional[Dict[str, str]] = None) -> Response:
+    """
+    Columns as one record batch in Arrow IPC stream format. Floats are sent as
+    float32, which is plenty for display-precision scores.
+    """
+    try:
+        import pyarrow as pa
+    except ImportError:
+        raise HTTPException(status_code=406, detail="pyarrow not installed. Request JSON instead.")
+
+    arrays = {}
+    for name, values in columns.items():
+        array = pa.array(values)
+        if pa.types.is_floating(array.type):
+            array = array.cast(pa.float32())
+        arrays[name] = array
+    batch = pa.RecordBatch.from_pydict(arrays)
+    if metadata:
+        batch = batch.replace_schema_metadata(metadata)
+
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, batch.schema) as writer:
+        writer.write_batch(batch)
+    return Response(sink.getvalue().to_pybytes(), media_type=ARROW_STREAM_MEDIA_TYPE)
+
+
+# Encoded JSON responses for read endpoints, most recently used last. Keys
+# start with the data version; bumping it on any fund or score change orphans
+# the old entries. The TTL bounds staleness across worker processes.
+RESPONSE_CACHE_SIZE = int(os.environ.get("RESPONSE_CACHE_SIZE", 512))
+RESPONSE_CACHE_TTL = float(os.environ.get("RESPONSE_CACHE_TTL", 300))
+_response_cache: "OrderedDict[tuple, Tuple[float, str, bytes]]" = OrderedDict()
+_response_cache_lock = threading.Lock()
+_response_version = 0
+
+
+def _invalidate_responses():
+    global _response_version, _category_cache
+    with _response_cache_lock:
+        _response_version += 1
+        _response_cache.clear()
+    _category_cache = None
+
+
+def _response_key(*parts) -> tuple:
+    """Cache key for a response built from the current data version"""
+    return (_response_version, *parts)
+
+
+def _json_response(request: Request, body: bytes, etag: str) -> Response:
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(body, media_type="application/json", headers={"ETag": etag})
+
+
+def _cached_json(request: Request, key: tuple) -> Optional[Response]:
+    """The cached response for key (304 if the client has it), or None on a miss"""
+    with _response_cache_lock:
+        entry = _response_cache.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            return None
+        _response_cache.move_to_end(key)
+    return _json_response(request, entry[2], entry[1])
+
+
+def _cache_json(request: Request, key: tuple, content) -> Response:
+    """Encode content, cache it under key and respond with it"""
+    body = orjson.dumps(content)
+    etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+    with _response_cache_lock:
+        _response_cache[key] = (time.monotonic() + RESPONSE_CACHE_TTL, etag, body)
+        _response_cache.move_to_end(key)
+        while len(_response_cache) > RESPONSE_CACHE_SIZE:
+            _response_cache.popitem(last=False)
+    return _json_response(request, body, etag)
+
+
+# Category id -> (name, parent_category). The table is a few dozen rows
+# written only by seeding, so fund reads look categories up here instead of
+# joining them. Dropped with the response cache.
+_category_cache: Optional[Dict[int, Tuple[str, Optional[str]]]] = None
+_NO_CATEGORY = (None, None)
+
+
+def _categories(db: Session) -> Dict[int, Tuple[str, Optional[str]]]:
+    global _category_cache
+    categories = _category_cache
+    if categories is None:
+        categories = {cat_id: (name, parent) for cat_id, name, parent in db.query(
+            FundCategory.id, FundCategory.name, FundCategory.parent_category)}
+        _category_cache = categories
+    return categories
 
 
 def _recalculate_all(db: Session) -> int:
     """Recalculate all fund scores and rankings. Returns count of funds processed."""
-    funds = db.query(Fund).all()
-    if not funds:
+    scores = score_all_funds(db)
+    if scores.empty:
         return 0
 
-    all_scores = []
-    for fund in funds:
-        cat = db.query(FundCategory).filter(FundCategory.id == fund.category_id).first()
-        parent_cat = cat.parent_category if cat else None
-        fund_dict = _fund_to_calc_dict(fund, parent_cat)
-        scores = calculator.calculate_all_scores(fund_dict)
-        scores['fund_id'] = fund.id
-        scores['category_id'] = fund.category_id
-        all_scores.append(scores)
-
-    # Rank
-    calculator.rank_funds(all_scores)
-
-    # Upsert scores
-    for score_data in all_scores:
-        fund_id = score_data.pop('fund_id')
-        score_data.pop('category_id', None)
-
-        existing = db.query(FundScore).filter(FundScore.fund_id == fund_id).first()
-        if existing:
-            for key, value in score_data.items():
-                setattr(existing, key, value)
-            existing.calculated_at = datetime.utcnow()
-        else:
-            score = FundScore(fund_id=fund_id, **score_data)
-            db.add(score)
+    # Replace every score row in one bulk insert, then rank them in SQL
+    records = scores.drop(columns='category_id').to_dict('records')
+    db.query(FundScore).delete(synchronize_session=False)
+    db.bulk_insert_mappings(FundScore, records)
+    rank_stored_scores(db)
 
     db.commit()
-    return len(funds)
+    # Only now: reads during the run would re-cache the old scores under a newer version
+    _invalidate_responses()
+    return len(records)
+
+
+# Background recalculation. Edits only mark scores stale; a queued run that has
+# not started yet covers every edit made before it starts, so bursts coalesce.
+_recalc_state_lock = threading.Lock()
+_recalc_run_lock = threading.Lock()
+_recalc_pending = False
+
+
+def _schedule_recalculate(background: BackgroundTasks):
+    """Queue a full recalculation after the response unless one is already queued."""
+    global _recalc_pending
+    # The edit is already committed, so cached listings are stale now
+    _invalidate_responses()
+    with _recalc_state_lock:
+        if _recalc_pending:
+            return
+        _recalc_pending = True
+    background.add_task(_recalculate_in_background)
+
+
+def _recalculate_in_background():
+    """Run one queued recalculation in its own session, one run at a time."""
+    global _recalc_pending
+    with _recalc_run_lock:
+        with _recalc_state_lock:
+            _recalc_pending = False
+        db = ScopedSession()
+        try:
+            _recalculate_all(db)
+        finally:
+            ScopedSession.remove()
 
 
 # Column mapping for uploads
@@ -156,115 +360,195 @@ NUMERIC_FIELDS = {
 }
 
 
+def _upsert_funds(db: Session, payload: Dict[str, dict]):
+    """
+    Insert or update funds by ticker in one executemany. For existing funds
+    only the uploaded non-blank values replace stored ones.
+    """
+    funds = Fund.__table__
+    columns = sorted({name for values in payload.values() for name in values})
+    rows = [{"ticker": ticker, **{c: values.get(c) for c in columns}}
+            for ticker, values in payload.items()]
+
+    insert = sqlite_insert if IS_SQLITE else pg_insert
+    stmt = insert(funds)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[funds.c.ticker],
+        set_={
+            **{c: func.coalesce(stmt.excluded[c], funds.c[c]) for c in columns},
+            "updated_at": func.now(),
+        },
+    )
+    db.execute(stmt, rows)
+
+
+def _coerce_float(val):
+    try:
+        return float(val)
+    except (ValueError, TypeError):
+        return None
+
+
+def _coerce_date(val):
+    if isinstance(val, datetime):
+        return val.date()
+    if isinstance(val, date):
+        return val
+    if isinstance(val, str):
+        for fmt in ("%Y-%m-%d", "%m/%d/%Y", "%m-%d-%Y"):
+            try:
+                return datetime.strptime(val.strip(), fmt).date()
+            except ValueError:
+                continue
+    return None
+
+
+def _coerce_text(val):
+    return str(val).strip() if val else None
+
+
+def _coerce_for(db_field: str):
+    """Cell coercion for an upload column mapped to db_field"""
+    if db_field in NUMERIC_FIELDS:
+        return _coerce_float
+    if db_field == "inception_date":
+        return _coerce_date
+    return _coerce_text
+
+
+async def _spool_upload(file: UploadFile, chunk_size: int = 1 << 20):
+    """Copy an upload into a temp file (in memory up to 8 MB) and rewind it."""
+    spool = tempfile.SpooledTemporaryFile(max_size=8 << 20)
+    while chunk := await file.read(chunk_size):
+        spool.write(chunk)
+    spool.seek(0)
+    return spool
+
+
+def _read_csv_upload(source):
+    """
+    Parse an uploaded CSV file object with pandas, coercing the numeric and date columns
+    a whole column at a time. Returns (headers, positional row tuples) with
+    blanks and unparseable values as None, ready for the per-cell plan.
+    """
+    try:
+        frame = pd.read_csv(source, dtype=str, keep_default_na=False,
+                            skip_blank_lines=True, encoding='utf-8-sig')
+    except pd.errors.EmptyDataError:
+        return [], iter(())
+    headers = [str(h) for h in frame.columns]
+    for h in headers:
+        field = _NORMALIZED_COLUMN_MAP.get(_normalize_header(h))
+        if field in NUMERIC_FIELDS:
+            frame[h] = pd.to_numeric(frame[h].str.strip(), errors='coerce')
+        elif field == "inception_date":
+            text = frame[h].str.strip()
+            parsed = pd.Series(pd.NaT, index=frame.index, dtype='datetime64[ns]')
+            for fmt in ("%Y-%m-%d", "%m/%d/%Y", "%m-%d-%Y"):
+                parsed = parsed.fillna(pd.to_datetime(text, format=fmt, errors='coerce'))
+            frame[h] = parsed.dt.date
+    frame = frame.astype(object).where(frame.notna(), None)
+    return headers, frame.itertuples(index=False, name=None)
+
+
+def _normalize_header(header: str) -> str:
+    """Lowercase alphanumerics only, so spacing and punctuation don't matter"""
+    return re.sub(r'[^a-z0-9]+', '', header.lower())
+
+
+_NORMALIZED_COLUMN_MAP = {_normalize_header(k): v for k, v in COLUMN_MAP.items()}
+_FIELD_COERCE = {v: _coerce_for(v) for v in COLUMN_MAP.values()}
+
+
 # =====================================================================
 # CATEGORIES
 # =====================================================================
 
-@router.get("/categories", response_model=List[CategoryOut])
-async def list_categories(db: Session = Depends(get_db)):
+@router.get("/categories", responses={200: {"model": List[CategoryOut]}})
+async def list_categories(request: Request, db: Session = Depends(get_db)):
     """List all fund categories with fund counts."""
-    cats = db.query(FundCategory).order_by(FundCategory.display_order).all()
-    result = []
-    for cat in cats:
-        count = db.query(Fund).filter(Fund.category_id == cat.id).count()
-        result.append(CategoryOut(
-            id=cat.id,
-            name=cat.name,
-            parent_category=cat.parent_category,
-            display_order=cat.display_order,
-            fund_count=count
-        ))
-    return result
+    key = _response_key("categories")
+    cached = _cached_json(request, key)
+    if cached is not None:
+        return cached
+
+    rows = db.query(
+        FundCategory.id, FundCategory.name, FundCategory.parent_category,
+        FundCategory.display_order, func.count(Fund.id)
+    ).outerjoin(
+        Fund, Fund.category_id == FundCategory.id
+    ).group_by(FundCategory.id).order_by(FundCategory.display_order).all()
+    return _cache_json(request, key, [
+        {
+            "id": cat_id,
+            "name": name,
+            "parent_category": parent_category,
+            "display_order": display_order,
+            "fund_count": count,
+        }
+        for cat_id, name, parent_category, display_order, count in rows
+    ])
 
 
 # =====================================================================
 # FUND CRUD
 # =====================================================================
 
-@router.get("/funds", response_model=List[FundWithScores])
+@router.get("/funds", responses={200: {"model": List[FundWithScores]}})
 async def list_funds(
+    request: Request,
     category: Optional[int] = None,
     search: Optional[str] = None,
     page: int = 1,
     limit: int = 25,
+    format: Optional[str] = None,
     db: Session = Depends(get_db)
 ):
     """List all funds with optional category filter and search."""
-    query = db.query(Fund)
+    # Funds and scores for the whole page in one joined query; categories
+    # come from the in-process map
+    query = db.query(Fund, FundScore).outerjoin(FundScore, FundScore.fund_id == Fund.id)
 
     if category:
         query = query.filter(Fund.category_id == category)
     if search:
-        search_term = f"%{search}%"
-        query = query.filter(
-            (Fund.ticker.ilike(search_term)) | (Fund.name.ilike(search_term))
-        )
+        query = query.filter(_search_filter(search))
 
-    total = query.count()
-    funds = query.offset((page - 1) * limit).limit(limit).all()
+    rows = query.offset((page - 1) * limit).limit(limit).all()
 
+    categories = _categories(db)
     result = []
-    for f in funds:
-        cat = db.query(FundCategory).filter(FundCategory.id == f.category_id).first()
-        scores = db.query(FundScore).filter(FundScore.fund_id == f.id).first()
-
-        fund_out = FundWithScores(
-            id=f.id,
-            ticker=f.ticker,
-            name=f.name,
-            fund_type=f.fund_type,
-            category_id=f.category_id,
-            category_name=cat.name if cat else None,
-            parent_category=cat.parent_category if cat else None,
-            fund_age_years=float(f.fund_age_years) if f.fund_age_years else None,
-            net_expense_ratio=float(f.net_expense_ratio) if f.net_expense_ratio else None,
-            turnover=float(f.turnover) if f.turnover else None,
-            market_cap=float(f.market_cap) if f.market_cap else None,
-            yield_pct=float(f.yield_pct) if f.yield_pct else None,
-            pe_ratio=float(f.pe_ratio) if f.pe_ratio else None,
-            pb_ratio=float(f.pb_ratio) if f.pb_ratio else None,
-            data_as_of_date=f.data_as_of_date,
-            scores=ScoreOut(
-                beta_score=float(scores.beta_score) if scores and scores.beta_score else None,
-                r_squared_score=float(scores.r_squared_score) if scores and scores.r_squared_score else None,
-                up_capture_score=float(scores.up_capture_score) if scores and scores.up_capture_score else None,
-                down_capture_score=float(scores.down_capture_score) if scores and scores.down_capture_score else None,
-                sharpe_score=float(scores.sharpe_score) if scores and scores.sharpe_score else None,
-                tracking_error_score=float(scores.tracking_error_score) if scores and scores.tracking_error_score else None,
-                sortino_score=float(scores.sortino_score) if scores and scores.sortino_score else None,
-                treynor_score=float(scores.treynor_score) if scores and scores.treynor_score else None,
-                info_ratio_score=float(scores.info_ratio_score) if scores and scores.info_ratio_score else None,
-                kurtosis_score=float(scores.kurtosis_score) if scores and scores.kurtosis_score else None,
-                drawdown_score=float(scores.drawdown_score) if scores and scores.drawdown_score else None,
-                skewness_score=float(scores.skewness_score) if scores and scores.skewness_score else None,
-                risk_score=float(scores.risk_score) if scores and scores.risk_score else None,
-                alpha_score=float(scores.alpha_score) if scores and scores.alpha_score else None,
-                yield_score=float(scores.yield_score) if scores and scores.yield_score else None,
-                relative_return_score=float(scores.relative_return_score) if scores and scores.relative_return_score else None,
-                price_score=float(scores.price_score) if scores and scores.price_score else None,
-                fee_score=float(scores.fee_score) if scores and scores.fee_score else None,
-                return_score=float(scores.return_score) if scores and scores.return_score else None,
-                total_rr_score=float(scores.total_rr_score) if scores and scores.total_rr_score else None,
-                market_cap_score=float(scores.market_cap_score) if scores and scores.market_cap_score else None,
-                turnover_score=float(scores.turnover_score) if scores and scores.turnover_score else None,
-                total_gpa_score=float(scores.total_gpa_score) if scores and scores.total_gpa_score else None,
-                category_rank=scores.category_rank if scores else None,
-                global_rank=scores.global_rank if scores else None,
-            ) if scores else None
-        )
+    for f, scores in rows:
+        category_name, parent_category = categories.get(f.category_id, _NO_CATEGORY)
+        fund_out = {
+            "id": f.id,
+            "ticker": f.ticker,
+            "name": f.name,
+            "fund_type": f.fund_type,
+            "category_id": f.category_id,
+            "category_name": category_name,
+            "parent_category": parent_category,
+            **_fund_values(f),
+            "data_as_of_date": f.data_as_of_date,
+            "scores": _score_dict(scores) if scores else None,
+        }
         result.append(fund_out)
 
-    return result
+    if _wants_arrow(request, format):
+        return _arrow_response(_fund_columns(result))
 
+    # Already plain data: skip jsonable_encoder
+    return ORJSONResponse(result)
 
-@router.get("/funds/{ticker}")
+
+@router.get("/funds/{ticker}", responses={200: {"model": FundDetailOut}})
 async def get_fund(ticker: str, db: Session = Depends(get_db)):
     """Get a single fund with all its data and scores."""
     fund = db.query(Fund).filter(Fund.ticker == ticker.upper()).first()
     if not fund:
         raise HTTPException(status_code=404, detail=f"Fund {ticker} not found")
 
-    cat = db.query(FundCategory).filter(FundCategory.id == fund.category_id).first()
+    category_name, parent_category = _categories(db).get(fund.category_id, _NO_CATEGORY)
     scores = db.query(FundScore).filter(FundScore.fund_id == fund.id).first()
 
     result = {
@@ -273,30 +557,21 @@ async def get_fund(ticker: str, db: Session = Depends(get_db)):
         "name": fund.name,
         "fund_type": fund.fund_type,
         "category_id": fund.category_id,
-        "category_name": cat.name if cat else None,
-        "parent_category": cat.parent_category if cat else None,
-        "fund_age_years": float(fund.fund_age_years) if fund.fund_age_years else None,
-        "net_expense_ratio": float(fund.net_expense_ratio) if fund.net_expense_ratio else None,
-        "turnover": float(fund.turnover) if fund.turnover else None,
-        "market_cap": float(fund.market_cap) if fund.market_cap else None,
-        "yield_pct": float(fund.yield_pct) if fund.yield_pct else None,
-        "pe_ratio": float(fund.pe_ratio) if fund.pe_ratio else None,
-        "pb_ratio": float(fund.pb_ratio) if fund.pb_ratio else None,
+        "category_name": category_name,
+        "parent_category": parent_category,
+        **_fund_values(fund),
         "data_as_of_date": str(fund.data_as_of_date) if fund.data_as_of_date else None,
     }
 
     if scores:
-        result["scores"] = {
-            col.name: float(getattr(scores, col.name)) if getattr(scores, col.name) is not None else None
-            for col in FundScore.__table__.columns
-            if col.name not in ('id', 'fund_id', 'calculated_at')
-        }
+        result["scores"] = _score_dict(scores)
 
-    return result
+    return ORJSONResponse(result)
 
 
 @router.put("/funds/{ticker}")
-async def update_fund(ticker: str, fund_data: FundUpdate, db: Session = Depends(get_db)):
+async def update_fund(ticker: str, fund_data: FundUpdate, background: BackgroundTasks,
+                      db: Session = Depends(get_db)):
     """Update a single fund's data."""
     fund = db.query(Fund).filter(Fund.ticker == ticker.upper()).first()
     if not fund:
@@ -310,14 +585,14 @@ async def update_fund(ticker: str, fund_data: FundUpdate, db: Session = Depends(
 
     db.commit()
 
-    # Recalculate scores
-    _recalculate_all(db)
+    # Recalculate scores after responding
+    _schedule_recalculate(background)
 
     return {"success": True, "message": f"Fund {ticker} updated"}
 
 
 @router.delete("/funds/{ticker}")
-async def delete_fund(ticker: str, db: Session = Depends(get_db)):
+async def delete_fund(ticker: str, background: BackgroundTasks, db: Session = Depends(get_db)):
     """Delete a fund."""
     fund = db.query(Fund).filter(Fund.ticker == ticker.upper()).first()
     if not fund:
@@ -326,8 +601,8 @@ async def delete_fund(ticker: str, db: Session = Depends(get_db)):
     db.delete(fund)
     db.commit()
 
-    # Re-rank remaining funds
-    _recalculate_all(db)
+    # Re-rank remaining funds after responding
+    _schedule_recalculate(background)
 
     return {"success": True, "message": f"Fund {ticker} deleted"}
 
@@ -337,85 +612,61 @@ async def delete_fund(ticker: str, db: Session = Depends(get_db)):
 # =====================================================================
 
 @router.post("/funds/upload", response_model=UploadSummary)
-async def upload_funds(file: UploadFile = File(...), db: Session = Depends(get_db)):
+async def upload_funds(background: BackgroundTasks, file: UploadFile = File(...),
+                       db: Session = Depends(get_db)):
     """Upload Excel/CSV file with fund data."""
     filename = file.filename or ""
 
     if not filename.endswith(('.xlsx', '.xls', '.csv')):
         raise HTTPException(status_code=400, detail="File must be Excel (.xlsx/.xls) or CSV format")
 
-    content = await file.read()
+    spool = await _spool_upload(file)
     added = 0
     updated = 0
     errors = 0
     error_details = []
 
+    wb = None
     try:
-        rows = []
-        headers = []
-
+        # Rows are read as positional tuples and never materialized as a whole
         if filename.endswith('.csv'):
-            text = content.decode('utf-8-sig')
-            reader = csv.DictReader(io.StringIO(text))
-            headers = reader.fieldnames or []
-            rows = list(reader)
+            headers, rows = _read_csv_upload(spool)
         else:
             # Excel
             try:
                 import openpyxl
-                wb = openpyxl.load_workbook(io.BytesIO(content), read_only=True, data_only=True)
-                ws = wb.active
-                all_rows = list(ws.iter_rows(values_only=True))
-                if len(all_rows) < 2:
-                    raise HTTPException(status_code=400, detail="File must have a header row and at least one data row")
-                headers = [str(h).strip() if h else "" for h in all_rows[0]]
-                for row_vals in all_rows[1:]:
-                    row_dict = {}
-                    for i, h in enumerate(headers):
-                        if i < len(row_vals):
-                            row_dict[h] = row_vals[i]
-                    rows.append(row_dict)
-                wb.close()
             except ImportError:
                 raise HTTPException(status_code=500, detail="openpyxl not installed. Use CSV format or install openpyxl.")
+            wb = openpyxl.load_workbook(spool, read_only=True, data_only=True)
+            rows = wb.active.iter_rows(values_only=True)
+            header_row = next(rows, None)
+            first_row = next(rows, None)
+            if header_row is None or first_row is None:
+                raise HTTPException(status_code=400, detail="File must have a header row and at least one data row")
+            headers = [str(h).strip() if h else "" for h in header_row]
+            rows = itertools.chain([first_row], rows)
 
         # Build category name -> id mapping
         categories = db.query(FundCategory).all()
         cat_name_map = {c.name.lower(): c.id for c in categories}
 
-        # Map headers to DB fields
-        header_map = {}
-        for h in headers:
-            normalized = h.strip().lower()
-            if normalized in COLUMN_MAP:
-                header_map[h] = COLUMN_MAP[normalized]
+        # Map each header to its DB field and cell coercion once per upload
+        columns = []
+        for pos, h in enumerate(headers):
+            db_field = _NORMALIZED_COLUMN_MAP.get(_normalize_header(h))
+            if db_field is not None:
+                columns.append((pos, db_field, _FIELD_COERCE[db_field]))
 
+        payload = {}  # ticker -> column values, in file order
         for row_idx, row in enumerate(rows):
             try:
                 mapped = {}
-                for orig_header, db_field in header_map.items():
-                    val = row.get(orig_header)
+                for pos, db_field, coerce in columns:
+                    val = row[pos] if pos < len(row) else None
                     if val is None or (isinstance(val, str) and val.strip() == ""):
                         mapped[db_field] = None
-                    elif db_field in NUMERIC_FIELDS:
-                        try:
-                            mapped[db_field] = float(val)
-                        except (ValueError, TypeError):
-                            mapped[db_field] = None
-                    elif db_field == "inception_date":
-                        if isinstance(val, datetime):
-                            mapped[db_field] = val.date()
-                        elif isinstance(val, date):
-                            mapped[db_field] = val
-                        elif isinstance(val, str):
-                            for fmt in ("%Y-%m-%d", "%m/%d/%Y", "%m-%d-%Y"):
-                                try:
-                                    mapped[db_field] = datetime.strptime(val.strip(), fmt).date()
-                                    break
-                                except ValueError:
-                                    continue
                     else:
-                        mapped[db_field] = str(val).strip() if val else None
+                        mapped[db_field] = coerce(val)
 
                 ticker = mapped.get("ticker")
                 if not ticker:
@@ -437,38 +688,37 @@ async def upload_funds(file: UploadFile = File(...), db: Session = Depends(get_d
                                 cat_id = cid
                                 break
 
-                # Check if fund exists (upsert)
-                existing = db.query(Fund).filter(Fund.ticker == ticker).first()
-                if existing:
-                    for key, value in mapped.items():
-                        if key not in ("ticker",) and hasattr(existing, key) and value is not None:
-                            setattr(existing, key, value)
-                    if cat_id:
-                        existing.category_id = cat_id
-                    existing.updated_at = datetime.utcnow()
-                    updated += 1
+                # Later rows for the same ticker override its non-blank values
+                values = {k: v for k, v in mapped.items() if k != "ticker"}
+                values["category_id"] = cat_id
+                if ticker in payload:
+                    payload[ticker].update({k: v for k, v in values.items() if v is not None})
                 else:
-                    fund = Fund(ticker=ticker, category_id=cat_id)
-                    for key, value in mapped.items():
-                        if key != "ticker" and key != "_category_name" and hasattr(fund, key):
-                            setattr(fund, key, value)
-                    db.add(fund)
-                    added += 1
+                    payload[ticker] = values
 
             except Exception as e:
                 errors += 1
                 error_details.append(f"Row {row_idx + 2}: {str(e)}")
 
+        if payload:
+            known = {t for (t,) in db.query(Fund.ticker)}
+            updated = sum(1 for t in payload if t in known)
+            added = len(payload) - updated
+            _upsert_funds(db, payload)
         db.commit()
 
-        # Recalculate all scores
+        # Recalculate all scores after responding
         if added > 0 or updated > 0:
-            _recalculate_all(db)
+            _schedule_recalculate(background)
 
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to process file: {str(e)}")
+    finally:
+        if wb is not None:
+            wb.close()
+        spool.close()
 
     return UploadSummary(
         added=added,
@@ -482,175 +732,196 @@ async def upload_funds(file: UploadFile = File(...), db: Session = Depends(get_d
 # RANKINGS / SCORES
 # =====================================================================
 
-@router.get("/scores")
+# /scores sort keys
+_SORT_COLUMNS = {
+    "gpa_score": FundScore.total_gpa_score,
+    "risk_score": FundScore.risk_score,
+    "return_score": FundScore.return_score,
+    "rr_score": FundScore.total_rr_score,
+    "ticker": Fund.ticker,
+    "name": Fund.name,
+    "category_rank": FundScore.category_rank,
+    "global_rank": FundScore.global_rank,
+}
+
+
+@router.get("/scores", responses={200: {"model": RankingsResponse}})
 async def get_ranked_funds(
+    request: Request,
     category: Optional[int] = None,
     sort: str = "gpa_score",
     order: str = "desc",
     page: int = 1,
     limit: int = 25,
     search: Optional[str] = None,
+    cursor: Optional[str] = None,
+    format: Optional[str] = None,
     db: Session = Depends(get_db)
 ):
-    """Get ranked funds with optional category filter."""
-    query = db.query(Fund, FundScore, FundCategory).outerjoin(
-        FundScore, Fund.id == FundScore.fund_id
-    ).outerjoin(
-        FundCategory, Fund.category_id == FundCategory.id
-    )
-
+    """
+    Get ranked funds with optional category filter.
+    Pass the returned next_cursor back as cursor to page without OFFSET.
+    """
+    wants_arrow = _wants_arrow(request, format)
+    key = _response_key("scores", category, sort, order, page, limit, search, cursor)
+    if not wants_arrow:
+        cached = _cached_json(request, key)
+        if cached is not None:
+            return cached
+
+    filters = []
     if category:
-        query = query.filter(Fund.category_id == category)
+        filters.append(Fund.category_id == category)
     if search:
-        search_term = f"%{search}%"
-        query = query.filter(
-            (Fund.ticker.ilike(search_term)) | (Fund.name.ilike(search_term))
-        )
-
-    # Sort
-    sort_map = {
-        "gpa_score": FundScore.total_gpa_score,
-        "risk_score": FundScore.risk_score,
-        "return_score": FundScore.return_score,
-        "rr_score": FundScore.total_rr_score,
-        "ticker": Fund.ticker,
-        "name": Fund.name,
-        "category_rank": FundScore.category_rank,
-        "global_rank": FundScore.global_rank,
-    }
-    sort_col = sort_map.get(sort, FundScore.total_gpa_score)
-    if sort_col is not None:
-        if order == "asc":
-            query = query.order_by(asc(sort_col))
-        else:
-            query = query.order_by(desc(sort_col).nulls_last())
+        filters.append(_search_filter(search))
+
+    sort_col = _SORT_COLUMNS.get(sort, FundScore.total_gpa_score)
+    ascending = order == "asc"
+    direction = asc if ascending else desc
+
+    # The match count and data_as_of ride along as uncorrelated subqueries,
+    # so the page is a single round trip
+    total_q = select(func.count(Fund.id)).where(*filters).scalar_subquery()
+    latest_q = select(func.max(Fund.data_as_of_date)).scalar_subquery()
+    # Scores are filled from the same JOIN, never lazy-loaded; categories
+    # come from the in-process map
+    query = db.query(
+        Fund, sort_col.label("sort_value"),
+        total_q.label("total"), latest_q.label("data_as_of"),
+    ).outerjoin(Fund.scores).options(
+        contains_eager(Fund.scores)
+    ).filter(*filters).order_by(direction(sort_col).nulls_last(), direction(Fund.id))
+
+    # start: rows of the listing before this page
+    if cursor:
+        after_value, after_id, start = _decode_cursor(cursor)
+        query = query.filter(_after_cursor(sort_col, ascending, after_value, after_id))
     else:
-        query = query.order_by(desc(FundScore.total_gpa_score).nulls_last())
-
-    total = query.count()
-    results = query.offset((page - 1) * limit).limit(limit).all()
+        start = (page - 1) * limit
+        query = query.offset(start)
+    results = query.limit(limit).all()
+
+    if results:
+        total, latest_date = results[0].total, results[0].data_as_of
+    elif page == 1 and not cursor:
+        # Nothing matches at all, so there is nothing to count
+        total, latest_date = 0, db.query(latest_q).scalar()
+    else:
+        total, latest_date = db.query(total_q, latest_q).one()
 
-    # Get data_as_of
-    latest_date = db.query(func.max(Fund.data_as_of_date)).scalar()
+    next_cursor = None
+    if len(results) == limit:
+        last = results[-1]
+        next_cursor = _encode_cursor(last.sort_value, last[0].id, start + len(results))
 
+    categories = _categories(db)
     funds_out = []
-    for idx, (fund, score, cat) in enumerate(results):
-        rank = ((page - 1) * limit) + idx + 1
-        if category and score and score.category_rank:
-            rank = score.category_rank
-        elif score and score.global_rank:
-            rank = score.global_rank
+    for idx, (fund, *_) in enumerate(results):
+        score = fund.scores
+        category_name, parent_category = categories.get(fund.category_id, _NO_CATEGORY)
+        scores_out = _score_dict(score) if score else None
+        if score:
+            rank = score.category_rank if category else score.global_rank
+        else:
+            # Not scored yet: fall back to the position in this listing
+            rank = start + idx + 1
 
         fund_out = {
             "rank": rank,
             "ticker": fund.ticker,
             "name": fund.name,
             "fund_type": fund.fund_type,
-            "category_name": cat.name if cat else None,
-            "parent_category": cat.parent_category if cat else None,
+            "category_name": category_name,
+            "parent_category": parent_category,
             "category_id": fund.category_id,
-            "fund_age_years": float(fund.fund_age_years) if fund.fund_age_years else None,
-            "net_expense_ratio": float(fund.net_expense_ratio) if fund.net_expense_ratio else None,
-            "turnover": float(fund.turnover) if fund.turnover else None,
-            "market_cap": float(fund.market_cap) if fund.market_cap else None,
-            "yield_pct": float(fund.yield_pct) if fund.yield_pct else None,
-            "pe_ratio": float(fund.pe_ratio) if fund.pe_ratio else None,
-            "pb_ratio": float(fund.pb_ratio) if fund.pb_ratio else None,
-            "total_gpa_score": float(score.total_gpa_score) if score and score.total_gpa_score else None,
-            "risk_score": float(score.risk_score) if score and score.risk_score else None,
-            "return_score": float(score.return_score) if score and score.return_score else None,
-            "total_rr_score": float(score.total_rr_score) if score and score.total_rr_score else None,
-            "category_rank": score.category_rank if score else None,
-            "global_rank": score.global_rank if score else None,
-            "scores": None,
+            **_fund_values(fund),
+            # Headline scores are copied from the already converted breakdown
+            **({name: scores_out[name] for name in _HEADLINE_SCORE_FIELDS}
+               if scores_out else _NO_HEADLINE_SCORES),
+            "scores": scores_out,
         }
-
-        if score:
-            fund_out["scores"] = {
-                col.name: float(getattr(score, col.name)) if getattr(score, col.name) is not None else None
-                for col in FundScore.__table__.columns
-                if col.name not in ('id', 'fund_id', 'calculated_at')
-            }
-
         funds_out.append(fund_out)
 
-    # Category summary
+    # Category summary: every aggregate in one grouped scan of the category
     category_summary = None
     if category:
-        cat_obj = db.query(FundCategory).filter(FundCategory.id == category).first()
-        if cat_obj:
-            cat_funds = db.query(FundScore).join(Fund).filter(Fund.category_id == category).all()
-            if cat_funds:
-                gpas = [float(s.total_gpa_score) for s in cat_funds if s.total_gpa_score is not None]
-                risk_scores = [float(s.risk_score) for s in cat_funds if s.risk_score is not None]
-                expenses = db.query(Fund.net_expense_ratio).filter(
-                    Fund.category_id == category,
-                    Fund.net_expense_ratio.isnot(None)
-                ).all()
-                exp_vals = [float(e[0]) for e in expenses if e[0] is not None]
-
-                # Find highest GPA ticker
-                best = db.query(Fund, FundScore).join(FundScore).filter(
-                    Fund.category_id == category
-                ).order_by(desc(FundScore.total_gpa_score)).first()
-
-                category_summary = {
-                    "category_name": cat_obj.name,
-                    "fund_count": len(cat_funds),
-                    "avg_gpa": round(sum(gpas) / len(gpas), 2) if gpas else None,
-                    "highest_gpa": round(max(gpas), 2) if gpas else None,
-                    "highest_gpa_ticker": best[0].ticker if best else None,
-                    "lowest_gpa": round(min(gpas), 2) if gpas else None,
-                    "avg_expense": round(sum(exp_vals) / len(exp_vals), 4) if exp_vals else None,
-                    "avg_risk_score": round(sum(risk_scores) / len(risk_scores), 2) if risk_scores else None,
-                }
+        cat_name = categories.get(category, _NO_CATEGORY)[0]
+        best_q = select(Fund.ticker).join(FundScore, FundScore.fund_id == Fund.id).where(
+            Fund.category_id == category
+        ).order_by(desc(FundScore.total_gpa_score).nulls_last(), Fund.id).limit(1).scalar_subquery()
+        (fund_count, avg_gpa, highest_gpa, lowest_gpa,
+         avg_expense, avg_risk, best_ticker) = db.query(
+            func.count(FundScore.id),
+            func.avg(FundScore.total_gpa_score),
+            func.max(FundScore.total_gpa_score),
+            func.min(FundScore.total_gpa_score),
+            func.avg(Fund.net_expense_ratio),
+            func.avg(FundScore.risk_score),
+            best_q,
+        ).select_from(Fund).outerjoin(
+            FundScore, FundScore.fund_id == Fund.id
+        ).filter(Fund.category_id == category).one()
+
+        if cat_name is not None and fund_count:
+            category_summary = {
+                "category_name": cat_name,
+                "fund_count": fund_count,
+                "avg_gpa": round(float(avg_gpa), 2) if avg_gpa is not None else None,
+                "highest_gpa": round(float(highest_gpa), 2) if highest_gpa is not None else None,
+                "highest_gpa_ticker": best_ticker,
+                "lowest_gpa": round(float(lowest_gpa), 2) if lowest_gpa is not None else None,
+                "avg_expense": round(float(avg_expense), 4) if avg_expense is not None else None,
+                "avg_risk_score": round(float(avg_risk), 2) if avg_risk is not None else None,
+            }
 
-    return {
+    if wants_arrow:
+        # Paging info travels in the schema metadata; the category summary is JSON-only
+        return _arrow_response(_fund_columns(funds_out), {
+            "total": str(total),
+            "page": str(page),
+            "limit": str(limit),
+            "data_as_of": str(latest_date) if latest_date else "",
+            "next_cursor": next_cursor or "",
+        })
+
+    return _cache_json(request, key, {
         "funds": funds_out,
         "total": total,
         "page": page,
         "limit": limit,
         "category": category,
         "data_as_of": str(latest_date) if latest_date else None,
+        "next_cursor": next_cursor,
         "category_summary": category_summary,
-    }
+    })
 
 
 @router.get("/scores/{ticker}/detail")
 async def get_fund_score_detail(ticker: str, db: Session = Depends(get_db)):
     """Get full score breakdown for a single fund."""
-    fund = db.query(Fund).filter(Fund.ticker == ticker.upper()).first()
+    # Fund and score in one round trip, seeking on the unique ticker index
+    fund, score = db.query(Fund, FundScore).outerjoin(
+        FundScore, FundScore.fund_id == Fund.id
+    ).filter(Fund.ticker == ticker.upper()).one_or_none() or (None, None)
     if not fund:
         raise HTTPException(status_code=404, detail=f"Fund {ticker} not found")
-
-    score = db.query(FundScore).filter(FundScore.fund_id == fund.id).first()
-    cat = db.query(FundCategory).filter(FundCategory.id == fund.category_id).first()
+    category_name, parent_category = _categories(db).get(fund.category_id, _NO_CATEGORY)
 
     result = {
         "ticker": fund.ticker,
         "name": fund.name,
         "fund_type": fund.fund_type,
-        "category_name": cat.name if cat else None,
-        "parent_category": cat.parent_category if cat else None,
-        "fund_age_years": float(fund.fund_age_years) if fund.fund_age_years else None,
-        "net_expense_ratio": float(fund.net_expense_ratio) if fund.net_expense_ratio else None,
-        "turnover": float(fund.turnover) if fund.turnover else None,
-        "market_cap": float(fund.market_cap) if fund.market_cap else None,
-        "yield_pct": float(fund.yield_pct) if fund.yield_pct else None,
-        "pe_ratio": float(fund.pe_ratio) if fund.pe_ratio else None,
-        "pb_ratio": float(fund.pb_ratio) if fund.pb_ratio else None,
+        "category_name": category_name,
+        "parent_category": parent_category,
+        **_fund_values(fund),
     }
 
     if score:
-        result["scores"] = {
-            col.name: float(getattr(score, col.name)) if getattr(score, col.name) is not None else None
-            for col in FundScore.__table__.columns
-            if col.name not in ('id', 'fund_id', 'calculated_at')
-        }
+        result["scores"] = _score_dict(score)
     else:
         result["scores"] = None
 
-    return result
+    return ORJSONResponse(result)
 
 
 # =====================================================================
@@ -672,114 +943,150 @@ async def recalculate_rankings(db: Session = Depends(get_db)):
 # EXPORT
 # =====================================================================
 
+# (header, column, cell format, scale) for every formatted export column
+_EXPORT_NUMBER_COLUMNS = (
+    ("GPA Score", "total_gpa_score", "{:.2f}", 1),
+    ("Risk Score", "risk_score", "{:.2f}", 1),
+    ("Return Score", "return_score", "{:.2f}", 1),
+    ("RR Score", "total_rr_score", "{:.2f}", 1),
+    ("Beta Score", "beta_score", "{:.2f}", 1),
+    ("R² Score", "r_squared_score", "{:.2f}", 1),
+    ("Up Capture Score", "up_capture_score", "{:.2f}", 1),
+    ("Down Capture Score", "down_capture_score", "{:.2f}", 1),
+    ("Sharpe Score", "sharpe_score", "{:.2f}", 1),
+    ("Tracking Error Score", "tracking_error_score", "{:.2f}", 1),
+    ("Sortino Score", "sortino_score", "{:.2f}", 1),
+    ("Treynor Score", "treynor_score", "{:.2f}", 1),
+    ("Info Ratio Score", "info_ratio_score", "{:.2f}", 1),
+    ("Kurtosis Score", "kurtosis_score", "{:.2f}", 1),
+    ("Drawdown Score", "drawdown_score", "{:.2f}", 1),
+    ("Skewness Score", "skewness_score", "{:.2f}", 1),
+    ("Alpha Score", "alpha_score", "{:.2f}", 1),
+    ("Yield Score", "yield_score", "{:.2f}", 1),
+    ("Relative Return Score", "relative_return_score", "{:.4f}", 1),
+    ("Price Score", "price_score", "{:.2f}", 1),
+    ("Fee Score", "fee_score", "{:.2f}", 1),
+    ("Market Cap Score", "market_cap_score", "{:.2f}", 1),
+    ("Turnover Score", "turnover_score", "{:.2f}", 1),
+    ("Category Rank", "category_rank", "{:.0f}", 1),
+    ("Global Rank", "global_rank", "{:.0f}", 1),
+    ("Expense Ratio", "net_expense_ratio", "{:.2f}%", 100),
+    ("Turnover", "turnover", "{:.0f}%", 100),
+    ("Market Cap (M)", "market_cap", "{:.0f}", 1),
+    ("Yield", "yield_pct", "{:.2f}%", 100),
+    ("P/E", "pe_ratio", "{:.1f}", 1),
+    ("P/B", "pb_ratio", "{:.2f}", 1),
+    ("Fund Age (Yrs)", "fund_age_years", "{:.1f}", 1),
+)
+
+
+EXPORT_CHUNK_ROWS = 1000
+
+
+def _export_frame(funds: pd.DataFrame, by_category: bool, start: int = 0) -> pd.DataFrame:
+    """
+    Export rows for funds in ranked order, formatted a column at a time.
+    start is the number of funds already exported before this chunk.
+    """
+    position = pd.Series(range(start + 1, start + len(funds) + 1), index=funds.index, dtype=float)
+    rank = funds["global_rank"].where(funds["global_rank"].notna(), position)
+    if by_category:
+        rank = funds["category_rank"].where(funds["category_rank"].notna(), rank)
+
+    out = pd.DataFrame({
+        "Rank": rank.astype(int),
+        "Ticker": funds["ticker"],
+        "Name": funds["name"],
+        "Type": funds["fund_type"],
+        "Category": funds["category_name"].fillna(""),
+    })
+    for header, column, fmt, scale in _EXPORT_NUMBER_COLUMNS:
+        values = funds[column].astype(float) * scale
+        out[header] = values.map(fmt.format, na_action="ignore").fillna("")
+    return out
+
+
+def _export_csv_chunks(query, by_category: bool):
+    """CSV text for the export, EXPORT_CHUNK_ROWS funds at a time off a streaming cursor"""
+    with engine.connect() as conn:
+        chunks = pd.read_sql(query, conn.execution_options(stream_results=True),
+                             chunksize=EXPORT_CHUNK_ROWS)
+        header, start = True, 0
+        for funds in chunks:
+            yield _export_frame(funds, by_category, start).to_csv(index=False, header=header)
+            header, start = False, start + len(funds)
+        if header:  # no rows at all: still send the header line
+            yield _export_frame(pd.DataFrame(columns=list(query.selected_columns.keys())),
+                                by_category).to_csv(index=False)
+
+
+def _build_xlsx(query, by_category: bool) -> io.BytesIO:
+    """
+    The export as an xlsx workbook. Rows are read and appended
+    EXPORT_CHUNK_ROWS at a time into openpyxl's write-only sheet.
+    """
+    import openpyxl
+    wb = openpyxl.Workbook(write_only=True)
+    ws = wb.create_sheet("Fund Rankings")
+    with engine.connect() as conn:
+        chunks = pd.read_sql(query, conn.execution_options(stream_results=True),
+                             chunksize=EXPORT_CHUNK_ROWS)
+        header, start = True, 0
+        for funds in chunks:
+            export = _export_frame(funds, by_category, start)
+            if header:
+                ws.append(list(export.columns))
+                header = False
+            for row in export.astype(object).where(export.notna(), None).itertuples(index=False, name=None):
+                ws.append(row)
+            start += len(funds)
+        if header:  # no rows at all: still write the header row
+            ws.append(list(_export_frame(pd.DataFrame(columns=list(query.selected_columns.keys())),
+                                         by_category).columns))
+
+    output = io.BytesIO()
+    wb.save(output)
+    output.seek(0)
+    return output
+
+
 @router.get("/export")
 async def export_rankings(
     category: Optional[int] = None,
     format: str = "csv",
-    db: Session = Depends(get_db)
 ):
-    """Export rankings as CSV or Excel."""
-    query = db.query(Fund, FundScore, FundCategory).outerjoin(
+    """Export rankings as CSV or Excel. Both formats read on their own connection."""
+    query = select(
+        Fund.ticker, Fund.name, Fund.fund_type, FundCategory.name.label("category_name"),
+        *(getattr(FundScore, c) for c in _SCORE_COLS),
+        FundScore.category_rank, FundScore.global_rank,
+        *(getattr(Fund, c) for c in _FUND_FLOAT_COLS),
+    ).outerjoin(
         FundScore, Fund.id == FundScore.fund_id
     ).outerjoin(
         FundCategory, Fund.category_id == FundCategory.id
     ).order_by(desc(FundScore.total_gpa_score).nulls_last())
 
     if category:
-        query = query.filter(Fund.category_id == category)
-
-    results = query.all()
-
-    headers = [
-        "Rank", "Ticker", "Name", "Type", "Category", "GPA Score",
-        "Risk Score", "Return Score", "RR Score",
-        "Beta Score", "R² Score", "Up Capture Score", "Down Capture Score",
-        "Sharpe Score", "Tracking Error Score", "Sortino Score", "Treynor Score",
-        "Info Ratio Score", "Kurtosis Score", "Drawdown Score", "Skewness Score",
-        "Alpha Score", "Yield Score", "Relative Return Score", "Price Score", "Fee Score",
-        "Market Cap Score", "Turnover Score",
-        "Category Rank", "Global Rank",
-        "Expense Ratio", "Turnover", "Market Cap (M)", "Yield", "P/E", "P/B",
-        "Fund Age (Yrs)"
-    ]
-
-    rows = []
-    for idx, (fund, score, cat) in enumerate(results):
-        rank = score.global_rank if score and score.global_rank else idx + 1
-        if category and score and score.category_rank:
-            rank = score.category_rank
-
-        row = [
-            rank,
-            fund.ticker,
-            fund.name,
-            fund.fund_type,
-            cat.name if cat else "",
-            f"{float(score.total_gpa_score):.2f}" if score and score.total_gpa_score else "",
-            f"{float(score.risk_score):.2f}" if score and score.risk_score else "",
-            f"{float(score.return_score):.2f}" if score and score.return_score else "",
-            f"{float(score.total_rr_score):.2f}" if score and score.total_rr_score else "",
-            f"{float(score.beta_score):.2f}" if score and score.beta_score else "",
-            f"{float(score.r_squared_score):.2f}" if score and score.r_squared_score else "",
-            f"{float(score.up_capture_score):.2f}" if score and score.up_capture_score else "",
-            f"{float(score.down_capture_score):.2f}" if score and score.down_capture_score else "",
-            f"{float(score.sharpe_score):.2f}" if score and score.sharpe_score else "",
-            f"{float(score.tracking_error_score):.2f}" if score and score.tracking_error_score else "",
-            f"{float(score.sortino_score):.2f}" if score and score.sortino_score else "",
-            f"{float(score.treynor_score):.2f}" if score and score.treynor_score else "",
-            f"{float(score.info_ratio_score):.2f}" if score and score.info_ratio_score else "",
-            f"{float(score.kurtosis_score):.2f}" if score and score.kurtosis_score else "",
-            f"{float(score.drawdown_score):.2f}" if score and score.drawdown_score else "",
-            f"{float(score.skewness_score):.2f}" if score and score.skewness_score else "",
-            f"{float(score.alpha_score):.2f}" if score and score.alpha_score else "",
-            f"{float(score.yield_score):.2f}" if score and score.yield_score else "",
-            f"{float(score.relative_return_score):.4f}" if score and score.relative_return_score else "",
-            f"{float(score.price_score):.2f}" if score and score.price_score else "",
-            f"{float(score.fee_score):.2f}" if score and score.fee_score else "",
-            f"{float(score.market_cap_score):.2f}" if score and score.market_cap_score else "",
-            f"{float(score.turnover_score):.2f}" if score and score.turnover_score else "",
-            score.category_rank if score else "",
-            score.global_rank if score else "",
-            f"{float(fund.net_expense_ratio) * 100:.2f}%" if fund.net_expense_ratio else "",
-            f"{float(fund.turnover) * 100:.0f}%" if fund.turnover else "",
-            f"{float(fund.market_cap):.0f}" if fund.market_cap else "",
-            f"{float(fund.yield_pct) * 100:.2f}%" if fund.yield_pct else "",
-            f"{float(fund.pe_ratio):.1f}" if fund.pe_ratio else "",
-            f"{float(fund.pb_ratio):.2f}" if fund.pb_ratio else "",
-            f"{float(fund.fund_age_years):.1f}" if fund.fund_age_years else "",
-        ]
-        rows.append(row)
+        query = query.where(Fund.category_id == category)
 
     if format == "xlsx":
+        # Serializing every cell is slow pure-Python work; keep it off the event loop
         try:
-            import openpyxl
-            wb = openpyxl.Workbook()
-            ws = wb.active
-            ws.title = "Fund Rankings"
-            ws.append(headers)
-            for row in rows:
-                ws.append(row)
-
-            output = io.BytesIO()
-            wb.save(output)
-            output.seek(0)
-
-            return StreamingResponse(
-                output,
-                media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-                headers={"Content-Disposition": "attachment; filename=fund_rankings.xlsx"}
-            )
+            output = await run_in_threadpool(_build_xlsx, query, bool(category))
         except ImportError:
             raise HTTPException(status_code=500, detail="openpyxl required for Excel export")
-    else:
-        # CSV
-        output = io.StringIO()
-        writer = csv.writer(output)
-        writer.writerow(headers)
-        writer.writerows(rows)
 
         return StreamingResponse(
-            iter([output.getvalue()]),
+            output,
+            media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+            headers={"Content-Disposition": "attachment; filename=fund_rankings.xlsx"}
+        )
+    else:
+        # CSV, sent as it is read. The generator holds its own connection,
+        # since it outlives the request's session.
+        return StreamingResponse(
+            _export_csv_chunks(query, bool(category)),
             media_type="text/csv",
             headers={"Content-Disposition": "attachment; filename=fund_rankings.csv"}
         )
@@ -2,12 +2,18 @@
 Seed data generator for the Rankings feature.
 Creates realistic synthetic fund data for 80+ funds across multiple categories.
 """
-import random
+import io
+import csv
 from datetime import date, datetime
+from functools import lru_cache
+from itertools import islice
+
+import numpy as np
 from sqlalchemy.orm import Session
 
+from database import IS_SQLITE
 from ranking_models import FundCategory, Fund, FundScore
-from ranking_calculator import RankingCalculator
+from ranking_calculator import RankingCalculator, rank_stored_scores
 
 
 # =====================================================================
@@ -57,385 +63,413 @@ CATEGORIES = [
 # FUND DEFINITIONS WITH REALISTIC DATA RANGES
 # =====================================================================
 
-def _r(low, high, decimals=4):
-    """Generate a random float in range."""
-    return round(random.uniform(low, high), decimals)
-
-
-def _gen_equity_fund(ticker, name, fund_type, category_name, age, large_cap=True):
-    """Generate realistic equity fund data."""
-    has_5yr = age >= 5
-    has_10yr = age >= 10
-
-    beta_base = _r(0.75, 1.25) if large_cap else _r(0.85, 1.45)
-    expense = _r(0.0003, 0.0075) if fund_type == "ETF" else _r(0.005, 0.015)
-    mcap = _r(500, 2000) if large_cap else _r(100, 800)
-    yld = _r(0.005, 0.035) if large_cap else _r(0.002, 0.025)
-    turnover = _r(0.03, 0.95)
-    pe = _r(14, 32)
-    pb = _r(1.5, 5.5)
-
-    fund = {
-        "ticker": ticker,
-        "name": name,
-        "fund_type": fund_type,
-        "category_name": category_name,
-        "fund_age_years": age,
-        "net_expense_ratio": expense,
-        "turnover": turnover,
-        "market_cap": mcap,
-        "yield_pct": yld,
-        "pe_ratio": pe,
-        "pb_ratio": pb,
-        "beta_3yr": beta_base,
-        "r_squared_3yr": _r(80, 99),
-        "up_capture_3yr": _r(0.85, 1.20),
-        "down_capture_3yr": _r(0.80, 1.15),
-        "sharpe_ratio_3yr": _r(0.2, 1.8),
-        "tracking_error_3yr": _r(1.0, 8.0),
-        "sortino_ratio_3yr": _r(0.3, 2.5),
-        "treynor_ratio_3yr": _r(0.02, 0.15),
-        "information_ratio_3yr": _r(-0.5, 1.0),
-        "kurtosis_3yr": _r(-1.0, 3.0),
-        "max_drawdown_3yr": _r(5, 30),
-        "skewness_3yr": _r(-1.5, 0.5),
-        "alpha_3yr": _r(-3, 5),
-        "return_qtd": _r(-0.05, 0.08),
-        "return_ytd": _r(-0.10, 0.20),
-        "return_1yr": _r(-0.05, 0.30),
-        "bm_return_1yr": _r(0.05, 0.18),
-        "batting_avg_3yr": _r(0.25, 0.65),
-        "data_as_of_date": date(2025, 1, 31),
-    }
-
-    if age >= 3:
-        fund["return_3yr"] = _r(0.02, 0.18)
-        fund["bm_return_3yr"] = _r(0.05, 0.14)
-
-    if has_5yr:
-        fund["beta_5yr"] = beta_base + _r(-0.15, 0.15)
-        fund["r_squared_5yr"] = fund["r_squared_3yr"] + _r(-5, 5)
-        fund["up_capture_5yr"] = fund["up_capture_3yr"] + _r(-0.05, 0.05)
-        fund["down_capture_5yr"] = fund["down_capture_3yr"] + _r(-0.05, 0.05)
-        fund["sharpe_ratio_5yr"] = fund["sharpe_ratio_3yr"] + _r(-0.3, 0.3)
-        fund["tracking_error_5yr"] = fund["tracking_error_3yr"] + _r(-1, 1)
-        fund["sortino_ratio_5yr"] = fund["sortino_ratio_3yr"] + _r(-0.3, 0.3)
-        fund["treynor_ratio_5yr"] = fund["treynor_ratio_3yr"] + _r(-0.03, 0.03)
-        fund["information_ratio_5yr"] = fund["information_ratio_3yr"] + _r(-0.2, 0.2)
-        fund["kurtosis_5yr"] = fund["kurtosis_3yr"] + _r(-0.5, 0.5)
-        fund["max_drawdown_5yr"] = fund["max_drawdown_3yr"] + _r(0, 10)
-        fund["skewness_5yr"] = fund["skewness_3yr"] + _r(-0.3, 0.3)
-        fund["alpha_5yr"] = fund["alpha_3yr"] + _r(-1.5, 1.5)
-        fund["return_5yr"] = _r(0.04, 0.16)
-        fund["bm_return_5yr"] = _r(0.06, 0.12)
-        fund["batting_avg_5yr"] = _r(0.25, 0.60)
-
-    if has_10yr:
-        fund["return_10yr"] = _r(0.06, 0.14)
-        fund["bm_return_10yr"] = _r(0.07, 0.11)
-
-    return fund
-
-
-def _gen_bond_fund(ticker, name, fund_type, category_name, age):
-    """Generate realistic fixed income fund data."""
-    has_5yr = age >= 5
-    has_10yr = age >= 10
-
-    beta_base = _r(0.0, 0.6)
-    expense = _r(0.0003, 0.006) if fund_type == "ETF" else _r(0.003, 0.01)
-
-    fund = {
-        "ticker": ticker,
-        "name": name,
-        "fund_type": fund_type,
-        "category_name": category_name,
-        "fund_age_years": age,
-        "net_expense_ratio": expense,
-        "turnover": _r(0.10, 0.80),
-        "market_cap": _r(50, 500),
-        "yield_pct": _r(0.02, 0.065),
-        "pe_ratio": None,
-        "pb_ratio": None,
-        "beta_3yr": beta_base,
-        "r_squared_3yr": _r(40, 95),
-        "up_capture_3yr": _r(0.10, 0.60),
-        "down_capture_3yr": _r(0.05, 0.50),
-        "sharpe_ratio_3yr": _r(-0.3, 1.2),
-        "tracking_error_3yr": _r(0.5, 5.0),
-        "sortino_ratio_3yr": _r(0.1, 1.5),
-        "treynor_ratio_3yr": _r(0.01, 0.08),
-        "information_ratio_3yr": _r(-0.3, 0.8),
-        "kurtosis_3yr": _r(-0.5, 2.0),
-        "max_drawdown_3yr": _r(2, 18),
-        "skewness_3yr": _r(-1.0, 0.3),
-        "alpha_3yr": _r(-2, 3),
-        "return_qtd": _r(-0.03, 0.04),
-        "return_ytd": _r(-0.05, 0.08),
-        "return_1yr": _r(-0.02, 0.12),
-        "bm_return_1yr": _r(0.01, 0.06),
-        "batting_avg_3yr": _r(0.30, 0.55),
-        "data_as_of_date": date(2025, 1, 31),
-    }
-
-    if age >= 3:
-        fund["return_3yr"] = _r(-0.01, 0.06)
-        fund["bm_return_3yr"] = _r(0.01, 0.04)
-
-    if has_5yr:
-        fund["beta_5yr"] = beta_base + _r(-0.1, 0.1)
-        fund["r_squared_5yr"] = fund["r_squared_3yr"] + _r(-5, 5)
-        fund["up_capture_5yr"] = fund["up_capture_3yr"] + _r(-0.05, 0.05)
-        fund["down_capture_5yr"] = fund["down_capture_3yr"] + _r(-0.05, 0.05)
-        fund["sharpe_ratio_5yr"] = fund["sharpe_ratio_3yr"] + _r(-0.2, 0.2)
-        fund["tracking_error_5yr"] = fund["tracking_error_3yr"] + _r(-0.5, 0.5)
-        fund["sortino_ratio_5yr"] = fund["sortino_ratio_3yr"] + _r(-0.2, 0.2)
-        fund["treynor_ratio_5yr"] = fund["treynor_ratio_3yr"] + _r(-0.02, 0.02)
-        fund["information_ratio_5yr"] = fund["information_ratio_3yr"] + _r(-0.15, 0.15)
-        fund["kurtosis_5yr"] = fund["kurtosis_3yr"] + _r(-0.3, 0.3)
-        fund["max_drawdown_5yr"] = fund["max_drawdown_3yr"] + _r(0, 5)
-        fund["skewness_5yr"] = fund["skewness_3yr"] + _r(-0.2, 0.2)
-        fund["alpha_5yr"] = fund["alpha_3yr"] + _r(-1, 1)
-        fund["return_5yr"] = _r(0.00, 0.05)
-        fund["bm_return_5yr"] = _r(0.01, 0.03)
-        fund["batting_avg_5yr"] = _r(0.30, 0.55)
-
-    if has_10yr:
-        fund["return_10yr"] = _r(0.01, 0.04)
-        fund["bm_return_10yr"] = _r(0.015, 0.035)
-
-    return fund
+DATA_AS_OF = date(2025, 1, 31)
+
+# Sampling profile per fund kind. Bounds are (low, high) for a uniform draw
+# rounded to 4 decimals; "expense" is (ETF, mutual fund) and "by_cap" is
+# (large cap, small/mid cap). 5-year fields drift from their 3-year value.
+FUND_PROFILES = {
+    "equity": {
+        "expense": ((0.0003, 0.0075), (0.005, 0.015)),
+        "by_cap": {
+            "beta_3yr": ((0.75, 1.25), (0.85, 1.45)),
+            "market_cap": ((500, 2000), (100, 800)),
+            "yield_pct": ((0.005, 0.035), (0.002, 0.025)),
+        },
+        "ranges": {
+            "turnover": (0.03, 0.95),
+            "pe_ratio": (14, 32),
+            "pb_ratio": (1.5, 5.5),
+            "r_squared_3yr": (80, 99),
+            "up_capture_3yr": (0.85, 1.20),
+            "down_capture_3yr": (0.80, 1.15),
+            "sharpe_ratio_3yr": (0.2, 1.8),
+            "tracking_error_3yr": (1.0, 8.0),
+            "sortino_ratio_3yr": (0.3, 2.5),
+            "treynor_ratio_3yr": (0.02, 0.15),
+            "information_ratio_3yr": (-0.5, 1.0),
+            "kurtosis_3yr": (-1.0, 3.0),
+            "max_drawdown_3yr": (5, 30),
+            "skewness_3yr": (-1.5, 0.5),
+            "alpha_3yr": (-3, 5),
+            "return_qtd": (-0.05, 0.08),
+            "return_ytd": (-0.10, 0.20),
+            "return_1yr": (-0.05, 0.30),
+            "bm_return_1yr": (0.05, 0.18),
+            "batting_avg_3yr": (0.25, 0.65),
+        },
+        "fixed": {},
+        "3yr": {"return_3yr": (0.02, 0.18), "bm_return_3yr": (0.05, 0.14)},
+        "5yr_drift": {
+            "beta_5yr": (-0.15, 0.15),
+            "r_squared_5yr": (-5, 5),
+            "up_capture_5yr": (-0.05, 0.05),
+            "down_capture_5yr": (-0.05, 0.05),
+            "sharpe_ratio_5yr": (-0.3, 0.3),
+            "tracking_error_5yr": (-1, 1),
+            "sortino_ratio_5yr": (-0.3, 0.3),
+            "treynor_ratio_5yr": (-0.03, 0.03),
+            "information_ratio_5yr": (-0.2, 0.2),
+            "kurtosis_5yr": (-0.5, 0.5),
+            "max_drawdown_5yr": (0, 10),
+            "skewness_5yr": (-0.3, 0.3),
+            "alpha_5yr": (-1.5, 1.5),
+        },
+        "5yr": {"return_5yr": (0.04, 0.16), "bm_return_5yr": (0.06, 0.12), "batting_avg_5yr": (0.25, 0.60)},
+        "10yr": {"return_10yr": (0.06, 0.14), "bm_return_10yr": (0.07, 0.11)},
+    },
+    "bond": {
+        "expense": ((0.0003, 0.006), (0.003, 0.01)),
+        "by_cap": {},
+        "ranges": {
+            "beta_3yr": (0.0, 0.6),
+            "turnover": (0.10, 0.80),
+            "market_cap": (50, 500),
+            "yield_pct": (0.02, 0.065),
+            "r_squared_3yr": (40, 95),
+            "up_capture_3yr": (0.10, 0.60),
+            "down_capture_3yr": (0.05, 0.50),
+            "sharpe_ratio_3yr": (-0.3, 1.2),
+            "tracking_error_3yr": (0.5, 5.0),
+            "sortino_ratio_3yr": (0.1, 1.5),
+            "treynor_ratio_3yr": (0.01, 0.08),
+            "information_ratio_3yr": (-0.3, 0.8),
+            "kurtosis_3yr": (-0.5, 2.0),
+            "max_drawdown_3yr": (2, 18),
+            "skewness_3yr": (-1.0, 0.3),
+            "alpha_3yr": (-2, 3),
+            "return_qtd": (-0.03, 0.04),
+            "return_ytd": (-0.05, 0.08),
+            "return_1yr": (-0.02, 0.12),
+            "bm_return_1yr": (0.01, 0.06),
+            "batting_avg_3yr": (0.30, 0.55),
+        },
+        "fixed": {"pe_ratio": None, "pb_ratio": None},
+        "3yr": {"return_3yr": (-0.01, 0.06), "bm_return_3yr": (0.01, 0.04)},
+        "5yr_drift": {
+            "beta_5yr": (-0.1, 0.1),
+            "r_squared_5yr": (-5, 5),
+            "up_capture_5yr": (-0.05, 0.05),
+            "down_capture_5yr": (-0.05, 0.05),
+            "sharpe_ratio_5yr": (-0.2, 0.2),
+            "tracking_error_5yr": (-0.5, 0.5),
+            "sortino_ratio_5yr": (-0.2, 0.2),
+            "treynor_ratio_5yr": (-0.02, 0.02),
+            "information_ratio_5yr": (-0.15, 0.15),
+            "kurtosis_5yr": (-0.3, 0.3),
+            "max_drawdown_5yr": (0, 5),
+            "skewness_5yr": (-0.2, 0.2),
+            "alpha_5yr": (-1, 1),
+        },
+        "5yr": {"return_5yr": (0.00, 0.05), "bm_return_5yr": (0.01, 0.03), "batting_avg_5yr": (0.30, 0.55)},
+        "10yr": {"return_10yr": (0.01, 0.04), "bm_return_10yr": (0.015, 0.035)},
+    },
+}
+
+
+def _gen_funds(specs, profile, rng):
+    """
+    Generate realistic fund data for specs of one kind, drawing each field
+    for every fund at once. Specs are (ticker, name, fund_type, category_name,
+    age, large_cap); history-dependent fields are only set for old enough funds.
+    """
+    n = len(specs)
+    is_etf = np.array([spec[2] == "ETF" for spec in specs])
+    large_cap = np.array([bool(spec[5]) for spec in specs])
+
+    def draw(bounds, pick=None):
+        if pick is not None:  # per-fund bounds from an (if pick, else) pair
+            bounds = np.where(pick[:, None], bounds[0], bounds[1]).T
+        return np.round(rng.uniform(bounds[0], bounds[1], n), 4)
+
+    cols = {"net_expense_ratio": draw(profile["expense"], is_etf)}
+    for field, bounds in profile["by_cap"].items():
+        cols[field] = draw(bounds, large_cap)
+    for group in ("ranges", "3yr", "5yr", "10yr"):
+        for field, bounds in profile[group].items():
+            cols[field] = draw(bounds)
+    for field, bounds in profile["5yr_drift"].items():
+        cols[field] = cols[field.replace("_5yr", "_3yr")] + draw(bounds)
+    values = {field: col.tolist() for field, col in cols.items()}
+
+    always = ["net_expense_ratio", *profile["by_cap"], *profile["ranges"]]
+    by_age = ((3, list(profile["3yr"])), (5, [*profile["5yr_drift"], *profile["5yr"]]),
+              (10, list(profile["10yr"])))
+    funds = []
+    for i, (ticker, name, fund_type, category_name, age, _) in enumerate(specs):
+        fund = {
+            "ticker": ticker,
+            "name": name,
+            "fund_type": fund_type,
+            "category_name": category_name,
+            "fund_age_years": age,
+            **{field: values[field][i] for field in always},
+            **profile["fixed"],
+            "data_as_of_date": DATA_AS_OF,
+        }
+        for min_age, fields in by_age:
+            if age >= min_age:
+                fund.update((field, values[field][i]) for field in fields)
+        funds.append(fund)
+    return funds
 
 
 # =====================================================================
 # ALL FUNDS TO SEED
 # =====================================================================
 
-def get_all_seed_funds():
-    """Return list of all seed fund dicts."""
-    random.seed(42)  # Reproducible data
-
-    funds = []
-
+# (kind, ticker, name, fund_type, category_name, age, large_cap), in listing order
+SEED_FUNDS = [
     # --- Large Cap Blend ETFs ---
-    funds.append(_gen_equity_fund("SPY", "SPDR S&P 500 ETF Trust", "ETF", "Large Cap Blend", 30))
-    funds.append(_gen_equity_fund("IVV", "iShares Core S&P 500 ETF", "ETF", "Large Cap Blend", 24))
-    funds.append(_gen_equity_fund("VOO", "Vanguard S&P 500 ETF", "ETF", "Large Cap Blend", 14))
-    funds.append(_gen_equity_fund("QUAL", "iShares MSCI USA Quality Factor ETF", "ETF", "Large Cap Blend", 11))
-    funds.append(_gen_equity_fund("MTUM", "iShares MSCI USA Momentum Factor ETF", "ETF", "Large Cap Blend", 11))
-    funds.append(_gen_equity_fund("SPLV", "Invesco S&P 500 Low Volatility ETF", "ETF", "Large Cap Blend", 13))
+    ("equity", "SPY", "SPDR S&P 500 ETF Trust", "ETF", "Large Cap Blend", 30, True),
+    ("equity", "IVV", "iShares Core S&P 500 ETF", "ETF", "Large Cap Blend", 24, True),
+    ("equity", "VOO", "Vanguard S&P 500 ETF", "ETF", "Large Cap Blend", 14, True),
+    ("equity", "QUAL", "iShares MSCI USA Quality Factor ETF", "ETF", "Large Cap Blend", 11, True),
+    ("equity", "MTUM", "iShares MSCI USA Momentum Factor ETF", "ETF", "Large Cap Blend", 11, True),
+    ("equity", "SPLV", "Invesco S&P 500 Low Volatility ETF", "ETF", "Large Cap Blend", 13, True),
 
     # --- Large Cap Growth ETFs ---
-    funds.append(_gen_equity_fund("QQQ", "Invesco QQQ Trust", "ETF", "Large Cap Growth", 25))
-    funds.append(_gen_equity_fund("VUG", "Vanguard Growth ETF", "ETF", "Large Cap Growth", 20))
-    funds.append(_gen_equity_fund("IWF", "iShares Russell 1000 Growth ETF", "ETF", "Large Cap Growth", 24))
-    funds.append(_gen_equity_fund("SCHG", "Schwab U.S. Large-Cap Growth ETF", "ETF", "Large Cap Growth", 14))
-    funds.append(_gen_equity_fund("MGK", "Vanguard Mega Cap Growth ETF", "ETF", "Large Cap Growth", 17))
+    ("equity", "QQQ", "Invesco QQQ Trust", "ETF", "Large Cap Growth", 25, True),
+    ("equity", "VUG", "Vanguard Growth ETF", "ETF", "Large Cap Growth", 20, True),
+    ("equity", "IWF", "iShares Russell 1000 Growth ETF", "ETF", "Large Cap Growth", 24, True),
+    ("equity", "SCHG", "Schwab U.S. Large-Cap Growth ETF", "ETF", "Large Cap Growth", 14, True),
+    ("equity", "MGK", "Vanguard Mega Cap Growth ETF", "ETF", "Large Cap Growth", 17, True),
 
     # --- Large Cap Value ETFs ---
-    funds.append(_gen_equity_fund("VTV", "Vanguard Value ETF", "ETF", "Large Cap Value", 20))
-    funds.append(_gen_equity_fund("IWD", "iShares Russell 1000 Value ETF", "ETF", "Large Cap Value", 24))
-    funds.append(_gen_equity_fund("SCHV", "Schwab U.S. Large-Cap Value ETF", "ETF", "Large Cap Value", 14))
-    funds.append(_gen_equity_fund("DVY", "iShares Select Dividend ETF", "ETF", "Large Cap Value", 18))
-    funds.append(_gen_equity_fund("VYM", "Vanguard High Dividend Yield ETF", "ETF", "Large Cap Value", 18))
+    ("equity", "VTV", "Vanguard Value ETF", "ETF", "Large Cap Value", 20, True),
+    ("equity", "IWD", "iShares Russell 1000 Value ETF", "ETF", "Large Cap Value", 24, True),
+    ("equity", "SCHV", "Schwab U.S. Large-Cap Value ETF", "ETF", "Large Cap Value", 14, True),
+    ("equity", "DVY", "iShares Select Dividend ETF", "ETF", "Large Cap Value", 18, True),
+    ("equity", "VYM", "Vanguard High Dividend Yield ETF", "ETF", "Large Cap Value", 18, True),
 
     # --- Mid Cap ETFs ---
-    funds.append(_gen_equity_fund("IWR", "iShares Russell Mid-Cap ETF", "ETF", "Mid Cap Blend", 23, large_cap=False))
-    funds.append(_gen_equity_fund("MDY", "SPDR S&P MidCap 400 ETF Trust", "ETF", "Mid Cap Blend", 28, large_cap=False))
-    funds.append(_gen_equity_fund("VO", "Vanguard Mid-Cap ETF", "ETF", "Mid Cap Blend", 20, large_cap=False))
-    funds.append(_gen_equity_fund("IJH", "iShares Core S&P Mid-Cap ETF", "ETF", "Mid Cap Blend", 24, large_cap=False))
-    funds.append(_gen_equity_fund("IWP", "iShares Russell Mid-Cap Growth ETF", "ETF", "Mid Cap Growth", 23, large_cap=False))
-    funds.append(_gen_equity_fund("IWS", "iShares Russell Mid-Cap Value ETF", "ETF", "Mid Cap Value", 23, large_cap=False))
+    ("equity", "IWR", "iShares Russell Mid-Cap ETF", "ETF", "Mid Cap Blend", 23, False),
+    ("equity", "MDY", "SPDR S&P MidCap 400 ETF Trust", "ETF", "Mid Cap Blend", 28, False),
+    ("equity", "VO", "Vanguard Mid-Cap ETF", "ETF", "Mid Cap Blend", 20, False),
+    ("equity", "IJH", "iShares Core S&P Mid-Cap ETF", "ETF", "Mid Cap Blend", 24, False),
+    ("equity", "IWP", "iShares Russell Mid-Cap Growth ETF", "ETF", "Mid Cap Growth", 23, False),
+    ("equity", "IWS", "iShares Russell Mid-Cap Value ETF", "ETF", "Mid Cap Value", 23, False),
 
     # --- Small Cap ETFs ---
-    funds.append(_gen_equity_fund("IWM", "iShares Russell 2000 ETF", "ETF", "Small Cap Blend", 24, large_cap=False))
-    funds.append(_gen_equity_fund("IJR", "iShares Core S&P Small-Cap ETF", "ETF", "Small Cap Blend", 24, large_cap=False))
-    funds.append(_gen_equity_fund("VB", "Vanguard Small-Cap ETF", "ETF", "Small Cap Blend", 20, large_cap=False))
-    funds.append(_gen_equity_fund("IWN", "iShares Russell 2000 Value ETF", "ETF", "Small Cap Value", 24, large_cap=False))
-    funds.append(_gen_equity_fund("IWO", "iShares Russell 2000 Growth ETF", "ETF", "Small Cap Growth", 24, large_cap=False))
-    funds.append(_gen_equity_fund("SCHA", "Schwab U.S. Small-Cap ETF", "ETF", "Small Cap Blend", 14, large_cap=False))
+    ("equity", "IWM", "iShares Russell 2000 ETF", "ETF", "Small Cap Blend", 24, False),
+    ("equity", "IJR", "iShares Core S&P Small-Cap ETF", "ETF", "Small Cap Blend", 24, False),
+    ("equity", "VB", "Vanguard Small-Cap ETF", "ETF", "Small Cap Blend", 20, False),
+    ("equity", "IWN", "iShares Russell 2000 Value ETF", "ETF", "Small Cap Value", 24, False),
+    ("equity", "IWO", "iShares Russell 2000 Growth ETF", "ETF", "Small Cap Growth", 24, False),
+    ("equity", "SCHA", "Schwab U.S. Small-Cap ETF", "ETF", "Small Cap Blend", 14, False),
 
     # --- International ETFs ---
-    funds.append(_gen_equity_fund("EFA", "iShares MSCI EAFE ETF", "ETF", "Developed International - Large Cap", 22))
-    funds.append(_gen_equity_fund("VEA", "Vanguard FTSE Developed Markets ETF", "ETF", "Developed International - Large Cap", 17))
-    funds.append(_gen_equity_fund("IEFA", "iShares Core MSCI EAFE ETF", "ETF", "Developed International - Large Cap", 12))
-    funds.append(_gen_equity_fund("SCZ", "iShares MSCI EAFE Small-Cap ETF", "ETF", "Developed International - Small/Mid Cap", 17, large_cap=False))
-    funds.append(_gen_equity_fund("VSS", "Vanguard FTSE All-World ex-US Small-Cap ETF", "ETF", "Developed International - Small/Mid Cap", 16, large_cap=False))
-    funds.append(_gen_equity_fund("EEM", "iShares MSCI Emerging Markets ETF", "ETF", "Emerging Markets - Large Cap", 22, large_cap=False))
-    funds.append(_gen_equity_fund("VWO", "Vanguard FTSE Emerging Markets ETF", "ETF", "Emerging Markets - Large Cap", 19, large_cap=False))
-    funds.append(_gen_equity_fund("IEMG", "iShares Core MSCI Emerging Markets ETF", "ETF", "Emerging Markets - Large Cap", 12, large_cap=False))
-    funds.append(_gen_equity_fund("ACWX", "iShares MSCI ACWI ex U.S. ETF", "ETF", "Developed International - Large Cap", 17))
-    funds.append(_gen_equity_fund("EWZ", "iShares MSCI Brazil ETF", "ETF", "Region Specific (Europe, Asia Pacific, Latin America)", 24, large_cap=False))
-    funds.append(_gen_equity_fund("EWJ", "iShares MSCI Japan ETF", "ETF", "Region Specific (Europe, Asia Pacific, Latin America)", 28))
-    funds.append(_gen_equity_fund("EWG", "iShares MSCI Germany ETF", "ETF", "Region Specific (Europe, Asia Pacific, Latin America)", 28))
-    funds.append(_gen_equity_fund("FXI", "iShares China Large-Cap ETF", "ETF", "Emerging Markets - Large Cap", 20, large_cap=False))
+    ("equity", "EFA", "iShares MSCI EAFE ETF", "ETF", "Developed International - Large Cap", 22, True),
+    ("equity", "VEA", "Vanguard FTSE Developed Markets ETF", "ETF", "Developed International - Large Cap", 17, True),
+    ("equity", "IEFA", "iShares Core MSCI EAFE ETF", "ETF", "Developed International - Large Cap", 12, True),
+    ("equity", "SCZ", "iShares MSCI EAFE Small-Cap ETF", "ETF", "Developed International - Small/Mid Cap", 17, False),
+    ("equity", "VSS", "Vanguard FTSE All-World ex-US Small-Cap ETF", "ETF", "Developed International - Small/Mid Cap", 16, False),
+    ("equity", "EEM", "iShares MSCI Emerging Markets ETF", "ETF", "Emerging Markets - Large Cap", 22, False),
+    ("equity", "VWO", "Vanguard FTSE Emerging Markets ETF", "ETF", "Emerging Markets - Large Cap", 19, False),
+    ("equity", "IEMG", "iShares Core MSCI Emerging Markets ETF", "ETF", "Emerging Markets - Large Cap", 12, False),
+    ("equity", "ACWX", "iShares MSCI ACWI ex U.S. ETF", "ETF", "Developed International - Large Cap", 17, True),
+    ("equity", "EWZ", "iShares MSCI Brazil ETF", "ETF", "Region Specific (Europe, Asia Pacific, Latin America)", 24, False),
+    ("equity", "EWJ", "iShares MSCI Japan ETF", "ETF", "Region Specific (Europe, Asia Pacific, Latin America)", 28, True),
+    ("equity", "EWG", "iShares MSCI Germany ETF", "ETF", "Region Specific (Europe, Asia Pacific, Latin America)", 28, True),
+    ("equity", "FXI", "iShares China Large-Cap ETF", "ETF", "Emerging Markets - Large Cap", 20, False),
 
     # --- Fixed Income ETFs ---
-    funds.append(_gen_bond_fund("AGG", "iShares Core U.S. Aggregate Bond ETF", "ETF", "US Aggregate Bond", 22))
-    funds.append(_gen_bond_fund("BND", "Vanguard Total Bond Market ETF", "ETF", "US Aggregate Bond", 17))
-    funds.append(_gen_bond_fund("TLT", "iShares 20+ Year Treasury Bond ETF", "ETF", "US Government Bond", 22))
-    funds.append(_gen_bond_fund("IEF", "iShares 7-10 Year Treasury Bond ETF", "ETF", "US Government Bond", 22))
-    funds.append(_gen_bond_fund("SHY", "iShares 1-3 Year Treasury Bond ETF", "ETF", "Short-Term Bond", 22))
-    funds.append(_gen_bond_fund("LQD", "iShares iBoxx Investment Grade Corporate Bond ETF", "ETF", "US Corporate Bond", 22))
-    funds.append(_gen_bond_fund("HYG", "iShares iBoxx High Yield Corporate Bond ETF", "ETF", "US High Yield Bond", 17))
-    funds.append(_gen_bond_fund("TIP", "iShares TIPS Bond ETF", "ETF", "TIPS / Inflation Protected", 22))
-    funds.append(_gen_bond_fund("MUB", "iShares National Muni Bond ETF", "ETF", "Municipal Bond", 17))
-    funds.append(_gen_bond_fund("EMB", "iShares JP Morgan USD Emerging Markets Bond ETF", "ETF", "Emerging Markets Bond", 17))
-    funds.append(_gen_bond_fund("BNDX", "Vanguard Total International Bond ETF", "ETF", "International Bond", 11))
-    funds.append(_gen_bond_fund("BSV", "Vanguard Short-Term Bond ETF", "ETF", "Short-Term Bond", 17))
-    funds.append(_gen_bond_fund("VCSH", "Vanguard Short-Term Corporate Bond ETF", "ETF", "US Corporate Bond", 14))
+    ("bond", "AGG", "iShares Core U.S. Aggregate Bond ETF", "ETF", "US Aggregate Bond", 22, None),
+    ("bond", "BND", "Vanguard Total Bond Market ETF", "ETF", "US Aggregate Bond", 17, None),
+    ("bond", "TLT", "iShares 20+ Year Treasury Bond ETF", "ETF", "US Government Bond", 22, None),
+    ("bond", "IEF", "iShares 7-10 Year Treasury Bond ETF", "ETF", "US Government Bond", 22, None),
+    ("bond", "SHY", "iShares 1-3 Year Treasury Bond ETF", "ETF", "Short-Term Bond", 22, None),
+    ("bond", "LQD", "iShares iBoxx Investment Grade Corporate Bond ETF", "ETF", "US Corporate Bond", 22, None),
+    ("bond", "HYG", "iShares iBoxx High Yield Corporate Bond ETF", "ETF", "US High Yield Bond", 17, None),
+    ("bond", "TIP", "iShares TIPS Bond ETF", "ETF", "TIPS / Inflation Protected", 22, None),
+    ("bond", "MUB", "iShares National Muni Bond ETF", "ETF", "Municipal Bond", 17, None),
+    ("bond", "EMB", "iShares JP Morgan USD Emerging Markets Bond ETF", "ETF", "Emerging Markets Bond", 17, None),
+    ("bond", "BNDX", "Vanguard Total International Bond ETF", "ETF", "International Bond", 11, None),
+    ("bond", "BSV", "Vanguard Short-Term Bond ETF", "ETF", "Short-Term Bond", 17, None),
+    ("bond", "VCSH", "Vanguard Short-Term Corporate Bond ETF", "ETF", "US Corporate Bond", 14, None),
 
     # --- Sector ETFs ---
-    funds.append(_gen_equity_fund("XLK", "Technology Select Sector SPDR Fund", "ETF", "Sector Funds (Technology, Healthcare, Energy, Financials, etc.)", 26))
-    funds.append(_gen_equity_fund("XLF", "Financial Select Sector SPDR Fund", "ETF", "Sector Funds (Technology, Healthcare, Energy, Financials, etc.)", 26))
-    funds.append(_gen_equity_fund("XLE", "Energy Select Sector SPDR Fund", "ETF", "Sector Funds (Technology, Healthcare, Energy, Financials, etc.)", 26))
-    funds.append(_gen_equity_fund("XLV", "Health Care Select Sector SPDR Fund", "ETF", "Sector Funds (Technology, Healthcare, Energy, Financials, etc.)", 26))
-    funds.append(_gen_equity_fund("XLU", "Utilities Select Sector SPDR Fund", "ETF", "Sector Funds (Technology, Healthcare, Energy, Financials, etc.)", 26))
-    funds.append(_gen_equity_fund("XLI", "Industrial Select Sector SPDR Fund", "ETF", "Sector Funds (Technology, Healthcare, Energy, Financials, etc.)", 26))
-    funds.append(_gen_equity_fund("XLRE", "Real Estate Select Sector SPDR Fund", "ETF", "Real Estate / REITs", 9))
-    funds.append(_gen_equity_fund("VNQ", "Vanguard Real Estate ETF", "ETF", "Real Estate / REITs", 20))
+    ("equity", "XLK", "Technology Select Sector SPDR Fund", "ETF", "Sector Funds (Technology, Healthcare, Energy, Financials, etc.)", 26, True),
+    ("equity", "XLF", "Financial Select Sector SPDR Fund", "ETF", "Sector Funds (Technology, Healthcare, Energy, Financials, etc.)", 26, True),
+    ("equity", "XLE", "Energy Select Sector SPDR Fund", "ETF", "Sector Funds (Technology, Healthcare, Energy, Financials, etc.)", 26, True),
+    ("equity", "XLV", "Health Care Select Sector SPDR Fund", "ETF", "Sector Funds (Technology, Healthcare, Energy, Financials, etc.)", 26, True),
+    ("equity", "XLU", "Utilities Select Sector SPDR Fund", "ETF", "Sector Funds (Technology, Healthcare, Energy, Financials, etc.)", 26, True),
+    ("equity", "XLI", "Industrial Select Sector SPDR Fund", "ETF", "Sector Funds (Technology, Healthcare, Energy, Financials, etc.)", 26, True),
+    ("equity", "XLRE", "Real Estate Select Sector SPDR Fund", "ETF", "Real Estate / REITs", 9, True),
+    ("equity", "VNQ", "Vanguard Real Estate ETF", "ETF", "Real Estate / REITs", 20, True),
 
     # --- Commodity ETFs ---
-    funds.append(_gen_bond_fund("GLD", "SPDR Gold Shares", "ETF", "Commodities", 20))
-    funds.append(_gen_bond_fund("IAU", "iShares Gold Trust", "ETF", "Commodities", 19))
-    funds.append(_gen_bond_fund("DBC", "Invesco DB Commodity Index Tracking Fund", "ETF", "Commodities", 18))
+    ("bond", "GLD", "SPDR Gold Shares", "ETF", "Commodities", 20, None),
+    ("bond", "IAU", "iShares Gold Trust", "ETF", "Commodities", 19, None),
+    ("bond", "DBC", "Invesco DB Commodity Index Tracking Fund", "ETF", "Commodities", 18, None),
 
     # --- Mutual Funds ---
-    funds.append(_gen_equity_fund("VFIAX", "Vanguard 500 Index Fund Admiral", "Mutual Fund", "Large Cap Blend", 24))
-    funds.append(_gen_equity_fund("FXAIX", "Fidelity 500 Index Fund", "Mutual Fund", "Large Cap Blend", 35))
-    funds.append(_gen_equity_fund("VIGAX", "Vanguard Growth Index Fund Admiral", "Mutual Fund", "Large Cap Growth", 24))
-    funds.append(_gen_equity_fund("VVIAX", "Vanguard Value Index Fund Admiral", "Mutual Fund", "Large Cap Value", 24))
-    funds.append(_gen_equity_fund("VEXAX", "Vanguard Extended Market Index Fund Admiral", "Mutual Fund", "Mid Cap Blend", 24, large_cap=False))
-    funds.append(_gen_equity_fund("VTIAX", "Vanguard Total International Stock Index Fund Admiral", "Mutual Fund", "Developed International - Large Cap", 14))
-    funds.append(_gen_bond_fund("VBTLX", "Vanguard Total Bond Market Index Fund Admiral", "Mutual Fund", "US Aggregate Bond", 24))
-    funds.append(_gen_bond_fund("PTTAX", "PIMCO Total Return Fund A", "Mutual Fund", "US Aggregate Bond", 35))
-    funds.append(_gen_equity_fund("FCNTX", "Fidelity Contrafund", "Mutual Fund", "Large Cap Growth", 35))
-    funds.append(_gen_equity_fund("DODGX", "Dodge & Cox Stock Fund", "Mutual Fund", "Large Cap Value", 35))
+    ("equity", "VFIAX", "Vanguard 500 Index Fund Admiral", "Mutual Fund", "Large Cap Blend", 24, True),
+    ("equity", "FXAIX", "Fidelity 500 Index Fund", "Mutual Fund", "Large Cap Blend", 35, True),
+    ("equity", "VIGAX", "Vanguard Growth Index Fund Admiral", "Mutual Fund", "Large Cap Growth", 24, True),
+    ("equity", "VVIAX", "Vanguard Value Index Fund Admiral", "Mutual Fund", "Large Cap Value", 24, True),
+    ("equity", "VEXAX", "Vanguard Extended Market Index Fund Admiral", "Mutual Fund", "Mid Cap Blend", 24, False),
+    ("equity", "VTIAX", "Vanguard Total International Stock Index Fund Admiral", "Mutual Fund", "Developed International - Large Cap", 14, True),
+    ("bond", "VBTLX", "Vanguard Total Bond Market Index Fund Admiral", "Mutual Fund", "US Aggregate Bond", 24, None),
+    ("bond", "PTTAX", "PIMCO Total Return Fund A", "Mutual Fund", "US Aggregate Bond", 35, None),
+    ("equity", "FCNTX", "Fidelity Contrafund", "Mutual Fund", "Large Cap Growth", 35, True),
+    ("equity", "DODGX", "Dodge & Cox Stock Fund", "Mutual Fund", "Large Cap Value", 35, True),
+]
 
-    return funds
+
+SEED_CHUNK_SIZE = 1000
+
+
+def iter_seed_funds(chunk_size: int = SEED_CHUNK_SIZE):
+    """
+    Yield seed fund dicts in listing order. Funds are generated chunk_size
+    at a time, so only one chunk of dicts is alive at once.
+    """
+    rng = np.random.default_rng(42)  # Reproducible data
+
+    for start in range(0, len(SEED_FUNDS), chunk_size):
+        specs = SEED_FUNDS[start:start + chunk_size]
+        # Generate each kind in one batch, then restore the listing order
+        funds = [None] * len(specs)
+        for kind, profile in FUND_PROFILES.items():
+            positions = [i for i, spec in enumerate(specs) if spec[0] == kind]
+            generated = _gen_funds([specs[i][1:] for i in positions], profile, rng)
+            for i, fund in zip(positions, generated):
+                funds[i] = fund
+        yield from funds
+
+
+@lru_cache(maxsize=1)
+def get_all_seed_funds():
+    """
+    Return all seed fund dicts. Generated once and shared between calls,
+    so callers must not mutate them.
+    """
+    return tuple(iter_seed_funds())
 
 
 # =====================================================================
 # SEEDING FUNCTIONS
 # =====================================================================
 
-def seed_categories(db: Session):
-    """Insert all fund categories. Returns dict mapping name -> id."""
-    existing = db.query(FundCategory).count()
-    if existing > 0:
+# Every fund column the seed data can fill; ids and timestamps come from the database
+FUND_SEED_COLUMNS = [
+    col.name for col in Fund.__table__.columns
+    if col.name not in ("id", "created_at", "updated_at")
+]
+_EMPTY_FUND_ROW = dict.fromkeys(FUND_SEED_COLUMNS)
+
+
+def _copy_rows(db: Session, table: str, rows: list) -> bool:
+    """
+    Load rows with PostgreSQL COPY ... FROM STDIN. Returns False when the
+    connection's driver has no COPY support (SQLite, non-psycopg2 drivers).
+    """
+    cursor = db.connection().connection.cursor()
+    if not hasattr(cursor, "copy_expert"):
+        cursor.close()
+        return False
+
+    columns = list(rows[0])
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    for row in rows:
+        # Unquoted empty fields are NULL in COPY's CSV format
+        writer.writerow(["" if row[c] is None else row[c] for c in columns])
+    buf.seek(0)
+    try:
+        cursor.copy_expert(f"COPY {table} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)", buf)
+    finally:
+        cursor.close()
+    return True
+
+
+def bulk_insert(db: Session, model, rows: list):
+    """Insert row dicts for model with COPY on PostgreSQL, else one Core executemany."""
+    if not rows:
+        return
+    if IS_SQLITE or not _copy_rows(db, model.__tablename__, rows):
+        db.execute(model.__table__.insert(), rows)
+
+def seed_categories(db: Session, commit: bool = True):
+    """
+    Insert all fund categories. Returns dict mapping name -> id.
+    With commit=False the new rows are only flushed, for a caller's transaction.
+    """
+    existing = db.query(FundCategory.name, FundCategory.id).all()
+    if existing:
         # Return existing mapping
-        cats = db.query(FundCategory).all()
-        return {c.name: c.id for c in cats}
-
-    category_map = {}
-    for name, parent, order in CATEGORIES:
-        cat = FundCategory(name=name, parent_category=parent, display_order=order)
-        db.add(cat)
-        db.flush()
-        category_map[name] = cat.id
-
-    db.commit()
+        return dict(existing)
+
+    cats = [
+        FundCategory(name=name, parent_category=parent, display_order=order)
+        for name, parent, order in CATEGORIES
+    ]
+    db.add_all(cats)
+    db.flush()  # one batch; assigns every id
+    category_map = {c.name: c.id for c in cats}
+
+    if commit:
+        db.commit()
     return category_map
 
 
 def seed_funds(db: Session):
-    """Seed the database with sample fund data and calculate all scores."""
-    # First seed categories
-    category_map = seed_categories(db)
+    """
+    Seed the database with sample fund data and calculate all scores.
+    Categories, funds and scores are committed together or not at all.
+    """
+    try:
+        _seed_funds(db)
+    except Exception:
+        db.rollback()
+        raise
+
+
+def _seed_funds(db: Session):
+    # First seed categories, in the same transaction as the funds
+    category_map = seed_categories(db, commit=False)
 
     # Check if funds already exist
     existing_count = db.query(Fund).count()
     if existing_count > 0:
+        db.commit()  # keep any categories just created
         print(f"Database already has {existing_count} funds. Skipping seed.")
         return
 
-    # Get all seed fund data
-    all_funds = get_all_seed_funds()
     calculator = RankingCalculator()
-
-    fund_records = []
-    for fund_data in all_funds:
-        cat_name = fund_data.pop("category_name", None)
-        cat_id = category_map.get(cat_name)
-
-        # Create the Fund record
-        fund = Fund(
-            ticker=fund_data["ticker"],
-            name=fund_data["name"],
-            fund_type=fund_data["fund_type"],
-            category_id=cat_id,
-            fund_age_years=fund_data.get("fund_age_years"),
-            net_expense_ratio=fund_data.get("net_expense_ratio"),
-            turnover=fund_data.get("turnover"),
-            market_cap=fund_data.get("market_cap"),
-            yield_pct=fund_data.get("yield_pct"),
-            pe_ratio=fund_data.get("pe_ratio"),
-            pb_ratio=fund_data.get("pb_ratio"),
-            beta_3yr=fund_data.get("beta_3yr"),
-            r_squared_3yr=fund_data.get("r_squared_3yr"),
-            up_capture_3yr=fund_data.get("up_capture_3yr"),
-            down_capture_3yr=fund_data.get("down_capture_3yr"),
-            sharpe_ratio_3yr=fund_data.get("sharpe_ratio_3yr"),
-            tracking_error_3yr=fund_data.get("tracking_error_3yr"),
-            sortino_ratio_3yr=fund_data.get("sortino_ratio_3yr"),
-            treynor_ratio_3yr=fund_data.get("treynor_ratio_3yr"),
-            information_ratio_3yr=fund_data.get("information_ratio_3yr"),
-            kurtosis_3yr=fund_data.get("kurtosis_3yr"),
-            max_drawdown_3yr=fund_data.get("max_drawdown_3yr"),
-            skewness_3yr=fund_data.get("skewness_3yr"),
-            alpha_3yr=fund_data.get("alpha_3yr"),
-            beta_5yr=fund_data.get("beta_5yr"),
-            r_squared_5yr=fund_data.get("r_squared_5yr"),
-            up_capture_5yr=fund_data.get("up_capture_5yr"),
-            down_capture_5yr=fund_data.get("down_capture_5yr"),
-            sharpe_ratio_5yr=fund_data.get("sharpe_ratio_5yr"),
-            tracking_error_5yr=fund_data.get("tracking_error_5yr"),
-            sortino_ratio_5yr=fund_data.get("sortino_ratio_5yr"),
-            treynor_ratio_5yr=fund_data.get("treynor_ratio_5yr"),
-            information_ratio_5yr=fund_data.get("information_ratio_5yr"),
-            kurtosis_5yr=fund_data.get("kurtosis_5yr"),
-            max_drawdown_5yr=fund_data.get("max_drawdown_5yr"),
-            skewness_5yr=fund_data.get("skewness_5yr"),
-            alpha_5yr=fund_data.get("alpha_5yr"),
-            return_qtd=fund_data.get("return_qtd"),
-            return_ytd=fund_data.get("return_ytd"),
-            return_1yr=fund_data.get("return_1yr"),
-            return_3yr=fund_data.get("return_3yr"),
-            return_5yr=fund_data.get("return_5yr"),
-            return_10yr=fund_data.get("return_10yr"),
-            bm_return_1yr=fund_data.get("bm_return_1yr"),
-            bm_return_3yr=fund_data.get("bm_return_3yr"),
-            bm_return_5yr=fund_data.get("bm_return_5yr"),
-            bm_return_10yr=fund_data.get("bm_return_10yr"),
-            batting_avg_3yr=fund_data.get("batting_avg_3yr"),
-            batting_avg_5yr=fund_data.get("batting_avg_5yr"),
-            data_as_of_date=fund_data.get("data_as_of_date"),
-        )
-        db.add(fund)
-        db.flush()
-
-        # Prepare data dict for calculator (include parent_category)
-        cat = db.query(FundCategory).filter(FundCategory.id == cat_id).first()
-        calc_data = dict(fund_data)
-        calc_data["parent_category"] = cat.parent_category if cat else None
-        calc_data["category_id"] = cat_id
-
-        # Calculate scores
-        scores = calculator.calculate_all_scores(calc_data)
-        scores["fund_id"] = fund.id
-        scores["category_id"] = cat_id  # For ranking later
-
-        fund_records.append(scores)
+    parent_of = dict(db.query(FundCategory.id, FundCategory.parent_category))
+
+    # Insert and score one chunk at a time; ranks need every fund, so they
+    # are assigned in the database once all chunks are in
+    seeded = 0
+    funds = iter_seed_funds()
+    while chunk := list(islice(funds, SEED_CHUNK_SIZE)):
+        fund_rows = []
+        for fund_data in chunk:
+            # Every row carries every column, as COPY and executemany need
+            row = _EMPTY_FUND_ROW | {k: v for k, v in fund_data.items() if k in _EMPTY_FUND_ROW}
+            row["category_id"] = category_map.get(fund_data.get("category_name"))
+            fund_rows.append(row)
+        bulk_insert(db, Fund, fund_rows)
+        fund_ids = dict(db.query(Fund.ticker, Fund.id).filter(
+            Fund.ticker.in_([row["ticker"] for row in fund_rows])
+        ))
+
+        # Score the chunk in one vectorized pass (include parent_category)
+        calc_inputs = [
+            {**{k: v for k, v in fund_data.items() if k != "category_name"},
+             "parent_category": parent_of.get(row["category_id"])}
+            for fund_data, row in zip(chunk, fund_rows)
+        ]
+        score_rows = calculator.calculate_all_scores_batch(calc_inputs)
+        for scores, row in zip(score_rows, fund_rows):
+            scores["fund_id"] = fund_ids[row["ticker"]]
+        bulk_insert(db, FundScore, score_rows)
+        seeded += len(chunk)
 
     # Rank all funds
-    calculator.rank_funds(fund_records)
-
-    # Save scores
-    for score_data in fund_records:
-        fund_id = score_data.pop("fund_id")
-        cat_id = score_data.pop("category_id", None)
-        score = FundScore(fund_id=fund_id, **score_data)
-        db.add(score)
+    rank_stored_scores(db)
 
     db.commit()
-    print(f"Seeded {len(all_funds)} funds with scores and rankings.")
+    print(f"Seeded {seeded} funds with scores and rankings.")
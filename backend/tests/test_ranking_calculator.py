@@ -0,0 +1,54 @@
+"""
+The vectorized score_frame (used for every stored score) must agree with the
+per-fund _calc_* reference formulas in calculate_all_scores.
+"""
+import random
+
+import pytest
+
+pytest.importorskip("pandas")
+pytest.importorskip("sqlalchemy")
+
+from ranking_calculator import RankingCalculator  # noqa: E402
+
+METRICS = (
+    'beta', 'r_squared', 'up_capture', 'down_capture', 'sharpe_ratio',
+    'tracking_error', 'sortino_ratio', 'treynor_ratio', 'information_ratio',
+    'kurtosis', 'max_drawdown', 'skewness', 'alpha',
+)
+FIELDS = (
+    *(f"{m}_{period}" for m in METRICS for period in ("3yr", "5yr")),
+    'yield_pct', 'return_qtd', 'return_ytd', 'return_1yr', 'return_3yr',
+    'return_5yr', 'return_10yr', 'bm_return_1yr', 'bm_return_3yr',
+    'bm_return_5yr', 'bm_return_10yr', 'batting_avg_3yr', 'batting_avg_5yr',
+    'pe_ratio', 'pb_ratio', 'net_expense_ratio', 'market_cap', 'turnover',
+)
+
+
+def _funds():
+    """Funds in every history tier, equity and not, with some blank fields"""
+    rng = random.Random(42)
+    funds = []
+    for fund_age in (1.0, 3.0, 4.5, 5.0, 7.0, 10.0, 25.0, None):
+        for parent in ("US Equity", "International Equity", "Fixed Income", None):
+            fund = {name: rng.uniform(-2, 2) for name in FIELDS}
+            fund['market_cap'] = rng.uniform(100, 500000)
+            fund['turnover'] = rng.choice((0.1, 0.5, 0.9))
+            fund[rng.choice(FIELDS)] = None
+            fund['fund_age_years'] = fund_age
+            fund['parent_category'] = parent
+            funds.append(fund)
+    return funds
+
+
+def test_batch_scores_match_reference():
+    calculator = RankingCalculator()
+    funds = _funds()
+    batch = calculator.calculate_all_scores_batch(funds)
+
+    assert len(batch) == len(funds)
+    for fund, scores in zip(funds, batch):
+        expected = calculator.calculate_all_scores(fund)
+        assert scores.keys() == expected.keys()
+        for name, value in expected.items():
+            assert scores[name] == pytest.approx(value, rel=1e-9, abs=1e-9), (name, fund)